@@ -73,6 +73,7 @@ except ImportError:
 from .constants import (
     CONN_ATTRS_DN,
     DEFAULT_CONFIGURATION,
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
     DEPRECATED_TLS_VERSIONS,
     OPENSSL_CS_NAMES,
     TLS_CIPHER_SUITES,
@@ -104,6 +105,7 @@ if OTEL_ENABLED:
         trace,
     )
 
+from .network import validate_compression_options
 from .optionfiles import read_option_files
 from .types import (
     BinaryProtocolType,
@@ -115,7 +117,7 @@ from .types import (
     StrOrBytes,
     WarningType,
 )
-from .utils import GenericWrapper, import_object
+from .utils import GenericWrapper, PreparedStatementCache, import_object
 
 NAMED_TUPLE_CACHE: weakref.WeakValueDictionary[Any, Any] = weakref.WeakValueDictionary()
 
@@ -182,6 +184,8 @@ class MySQLConnectionAbstract(ABC):
         self._charset_id: int = 45
         self._sql_mode: Optional[str] = None
         self._time_zone: Optional[str] = None
+        self._max_allowed_packet: Optional[int] = None
+        self._max_allowed_packet_limit: Optional[int] = None
         self._autocommit: bool = False
         self._server_version: Optional[Tuple[int, ...]] = None
         self._handshake: Optional[HandShakeType] = None
@@ -223,7 +227,7 @@ class MySQLConnectionAbstract(ABC):
             "allow_local_infile_in_path"
         ]
 
-        self._prepared_statements: Any = None
+        self._prepared_statements: Optional[PreparedStatementCache] = None
         self._query_attrs: Dict[str, BinaryProtocolType] = {}
 
         self._ssl_active: bool = False
@@ -234,6 +238,12 @@ class MySQLConnectionAbstract(ABC):
         self._converter_class: Optional[Type[MySQLConverter]] = None
         self._converter_str_fallback: bool = False
         self._compress: bool = False
+        self._compression_algorithms: Optional[Tuple[str, ...]] = None
+        self._compression_algorithm: Optional[str] = None
+        self._zstd_compression_level: int = DEFAULT_ZSTD_COMPRESSION_LEVEL
+        self._read_buffer_size: Optional[int] = DEFAULT_CONFIGURATION[
+            "read_buffer_size"
+        ]
 
         self._consume_results: bool = False
         self._init_command: Optional[str] = None
@@ -497,6 +507,20 @@ class MySQLConnectionAbstract(ABC):
         """Sets the current database."""
         self.cmd_query(f"USE {value}")
 
+    @property
+    def prepared_statement_cache(self) -> Optional[PreparedStatementCache]:
+        """The prepared statement cache.
+
+        Statements prepared by `MySQLCursorPrepared` are kept by their SQL text
+        and shared by all the cursors of the connection. The cache is enabled
+        with the `prepared_statement_cache_size` option, its `hits` and `misses`
+        counters can be used to check its efficiency.
+
+        Returns:
+            The `PreparedStatementCache` or `None` if disabled.
+        """
+        return self._prepared_statements
+
     @property
     def can_consume_results(self) -> bool:
         """Returns whether to consume results."""
@@ -602,6 +626,34 @@ class MySQLConnectionAbstract(ABC):
         except KeyError:
             self._consume_results = False
 
+        # The read-ahead buffer is only used by the pure Python implementation
+        if config.get("read_buffer_size") is not None:
+            read_buffer_size = config["read_buffer_size"]
+            if (
+                not isinstance(read_buffer_size, int)
+                or isinstance(read_buffer_size, bool)
+                or read_buffer_size < 1
+            ):
+                raise AttributeError(
+                    "read_buffer_size must be a positive integer, "
+                    f"found: '{read_buffer_size}'"
+                )
+
+        if "prepared_statement_cache_size" in config:
+            cache_size = config["prepared_statement_cache_size"]
+            if cache_size is not None and (
+                not isinstance(cache_size, int)
+                or isinstance(cache_size, bool)
+                or cache_size < 0
+            ):
+                raise AttributeError(
+                    "prepared_statement_cache_size must be a positive integer, "
+                    f"found: '{cache_size}'"
+                )
+            self._prepared_statements = (
+                PreparedStatementCache(cache_size) if cache_size else None
+            )
+
         # Configure auth_plugin
         try:
             self._auth_plugin = config["auth_plugin"]
@@ -700,6 +752,16 @@ class MySQLConnectionAbstract(ABC):
                 except AttributeError:
                     setattr(self, attribute, value)
 
+        algorithms, self._zstd_compression_level = validate_compression_options(
+            self._compression_algorithms, self._zstd_compression_level
+        )
+        self._compression_algorithms = algorithms
+        if (algorithms and set(algorithms) != {"uncompressed"}) or (
+            self._client_flags & ClientFlag.COMPRESS
+        ):
+            # Kept to negotiate the compression again on each handshake
+            self._compress = True
+
         # Disable SSL for unix socket connections
         if self._unix_socket and os.name == "posix":
             self._ssl_disabled = True
@@ -1035,6 +1097,35 @@ class MySQLConnectionAbstract(ABC):
         self.cmd_query(f"SET @@session.sql_mode = '{value}'")
         self._sql_mode = value
 
+    @property
+    def max_allowed_packet(self) -> int:
+        """Gets the maximum size of the statements sent to the server.
+
+        Unless a limit was set, the server's `max_allowed_packet` is queried
+        once per session and cached. Statements built by the connector, such as
+        the multi-row INSERT statements of `executemany()`, are split to fit in it.
+        """
+        if self._max_allowed_packet_limit is not None:
+            return self._max_allowed_packet_limit
+        if self._max_allowed_packet is None:
+            self._max_allowed_packet = int(
+                self.info_query(  # type: ignore[arg-type]
+                    "SELECT @@session.max_allowed_packet"
+                )[0]
+            )
+        return self._max_allowed_packet
+
+    @max_allowed_packet.setter
+    def max_allowed_packet(self, value: int) -> None:
+        """Sets the maximum size of the statements built by the connector.
+
+        The server's `max_allowed_packet` is not changed: a lower limit only
+        keeps the statements built by the connector smaller.
+        """
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+            raise ValueError("max_allowed_packet must be a positive integer")
+        self._max_allowed_packet_limit = value
+
     @abstractmethod
     def info_query(self, query: str) -> Optional[RowType]:
         """Sends a query which only returns 1 row.
@@ -1233,6 +1324,20 @@ class MySQLConnectionAbstract(ABC):
             >>> cnx.set_charset_collation('latin1', 'latin1_general_ci')
             ```
         """
+        charset_name, collation_name = self._get_charset_collation(charset, collation)
+        self._execute_query(f"SET NAMES '{charset_name}' COLLATE '{collation_name}'")
+        self._set_charset_name(charset_name)
+
+    def _get_charset_collation(
+        self, charset: Optional[Union[int, str]] = None, collation: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Looks up the character set and collation for the current connection.
+
+        The arguments are the ones of `set_charset_collation()`. The character set
+        ID of the connection is updated.
+
+        Returns a tuple with the character set and collation names.
+        """
         err_msg = "{} should be either integer, string or None"
         if not isinstance(charset, (int, str)) and charset is not None:
             raise ValueError(err_msg.format("charset"))
@@ -1268,8 +1373,10 @@ class MySQLConnectionAbstract(ABC):
                 collation_name,
             ) = self._character_set.get_charset_info(charset, collation=None)
 
-        self._execute_query(f"SET NAMES '{charset_name}' COLLATE '{collation_name}'")
+        return charset_name, collation_name
 
+    def _set_charset_name(self, charset_name: str) -> None:
+        """Uses a character set set on the server for the current connection."""
         try:
             # Required for C Extension
             self.set_character_set_name(charset_name)
@@ -1311,13 +1418,26 @@ class MySQLConnectionAbstract(ABC):
         This method executes commands after the connection has been
         established. Some setting like autocommit, character set, and SQL mode
         are set using this method.
+
+        The character set, autocommit, time zone and SQL mode are set using a
+        single `SET` statement, so a new connection only waits for one round trip
+        before the `init_command`.
         """
-        self.set_charset_collation(self._charset_id)
-        self.autocommit = self._autocommit
+        # The server's max_allowed_packet is queried again for the new session
+        self._max_allowed_packet = None
+        charset_name, collation_name = self._get_charset_collation(self._charset_id)
+        assignments = [
+            f"NAMES '{charset_name}' COLLATE '{collation_name}'",
+            f"@@session.autocommit = {'ON' if self._autocommit else 'OFF'}",
+        ]
         if self._time_zone:
-            self.time_zone = self._time_zone
+            assignments.append(f"@@session.time_zone = '{self._time_zone}'")
         if self._sql_mode:
-            self.sql_mode = self._sql_mode
+            if isinstance(self._sql_mode, (list, tuple)):
+                self._sql_mode = ",".join(self._sql_mode)
+            assignments.append(f"@@session.sql_mode = '{self._sql_mode}'")
+        self._execute_query(f"SET {', '.join(assignments)}")
+        self._set_charset_name(charset_name)
         if self._init_command:
             self._execute_query(self._init_command)
 
@@ -1507,6 +1627,7 @@ class MySQLConnectionAbstract(ABC):
         cursor_class: Optional[Type["MySQLCursorAbstract"]] = None,
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        fetch_size: Optional[int] = None,
     ) -> "MySQLCursorAbstract":
         """Instantiates and returns a cursor.
 
@@ -1537,6 +1658,10 @@ class MySQLConnectionAbstract(ABC):
                           that's being used.
             dictionary: If `True`, the cursor returns rows as dictionaries.
             named_tuple: If `True`, the cursor returns rows as named tuples.
+            fetch_size: Only for prepared cursors. If set, a read-only cursor is
+                        opened on the server and rows are fetched in batches of
+                        `fetch_size` rows, which bounds the memory used by large
+                        result sets.
 
         Returns:
             cursor: A cursor object.
@@ -1545,6 +1670,7 @@ class MySQLConnectionAbstract(ABC):
             ProgrammingError: When `cursor_class` is not a subclass of
                               `MySQLCursorAbstract`.
             ValueError: When cursor is not available.
+            NotSupportedError: When `fetch_size` is not supported.
         """
 
     @abstractmethod
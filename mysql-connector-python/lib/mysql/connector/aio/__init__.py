@@ -28,7 +28,13 @@
 
 """MySQL Connector/Python - MySQL driver written in Python."""
 
-__all__ = ["CMySQLConnection", "MySQLConnection", "connect"]
+__all__ = [
+    "CMySQLConnection",
+    "MySQLConnection",
+    "MySQLConnectionPool",
+    "PooledMySQLConnection",
+    "connect",
+]
 
 import random
 
@@ -39,6 +45,7 @@ from ..errors import Error, InterfaceError, ProgrammingError
 from ..pooling import ERROR_NO_CEXT
 from .abstracts import MySQLConnectionAbstract
 from .connection import MySQLConnection
+from .pooling import MySQLConnectionPool, PooledMySQLConnection
 
 try:
     import dns.exception
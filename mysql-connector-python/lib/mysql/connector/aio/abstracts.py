@@ -42,6 +42,7 @@ import warnings
 import weakref
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from inspect import signature
 from types import TracebackType
@@ -51,6 +52,7 @@ from typing import (
     AsyncGenerator,
     BinaryIO,
     Callable,
+    Deque,
     Dict,
     Generator,
     Iterator,
@@ -76,6 +78,7 @@ from ..abstracts import (
 from ..constants import (
     CONN_ATTRS_DN,
     DEFAULT_CONFIGURATION,
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
     DEPRECATED_TLS_VERSIONS,
     OPENSSL_CS_NAMES,
     TLS_CIPHER_SUITES,
@@ -90,6 +93,7 @@ from ..errors import (
     NotSupportedError,
     ProgrammingError,
 )
+from ..network import validate_compression_options
 from ..types import (
     BinaryProtocolType,
     DescriptionType,
@@ -103,7 +107,7 @@ from ..types import (
     StrOrBytes,
     WarningType,
 )
-from ..utils import GenericWrapper, import_object
+from ..utils import GenericWrapper, PreparedStatementCache, import_object
 from .authentication import MySQLAuthenticator
 from .charsets import Charset, charsets
 from .protocol import MySQLProtocol
@@ -170,6 +174,8 @@ class MySQLConnectionAbstract(ABC):
         auth_plugin: Optional[str] = None,
         client_flags: Optional[int] = None,
         compress: bool = False,
+        compression_algorithms: Optional[Union[str, Sequence[str]]] = None,
+        zstd_compression_level: Optional[int] = None,
         consume_results: bool = False,
         autocommit: bool = False,
         time_zone: Optional[str] = None,
@@ -199,6 +205,7 @@ class MySQLConnectionAbstract(ABC):
         ssl_verify_identity: Optional[bool] = False,
         ssl_disabled: Optional[bool] = DEFAULT_CONFIGURATION["ssl_disabled"],
         tls_versions: Optional[List[str]] = [],
+        prepared_statement_cache_size: Optional[int] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
         self._user: str = user
@@ -213,10 +220,17 @@ class MySQLConnectionAbstract(ABC):
         self._connection_timeout: int = connection_timeout
         self._connection_attrs: Dict[str, str] = conn_attrs
         self._compress: bool = compress
+        self._compression_algorithms: Optional[
+            Union[str, Sequence[str]]
+        ] = compression_algorithms
+        self._compression_algorithm: Optional[str] = None
+        self._zstd_compression_level: Optional[int] = zstd_compression_level
         self._consume_results: bool = consume_results
         self._autocommit: bool = autocommit
         self._time_zone: Optional[str] = time_zone
         self._sql_mode: Optional[str] = sql_mode
+        self._max_allowed_packet: Optional[int] = None
+        self._max_allowed_packet_limit: Optional[int] = None
         self._init_command: Optional[str] = init_command
         self._protocol: MySQLProtocol = MySQLProtocol()
         self._socket: Optional[Union[MySQLTcpSocket, MySQLUnixSocket]] = None
@@ -244,6 +258,9 @@ class MySQLConnectionAbstract(ABC):
         self._query_attrs: Dict[str, BinaryProtocolType] = {}
         self._query_attrs_supported: int = False
         self._columns_desc: List[DescriptionType] = []
+        self._row_decoder: Optional[
+            Callable[[Tuple[Optional[bytes], ...]], Tuple[Any, ...]]
+        ] = None
         self._authenticator: MySQLAuthenticator = MySQLAuthenticator()
         self._converter_class: Type[MySQLConverter] = converter_class or MySQLConverter
         self._converter_str_fallback: bool = converter_str_fallback
@@ -259,12 +276,20 @@ class MySQLConnectionAbstract(ABC):
         self._unread_result: bool = False
         self._use_unicode: bool = True
         self._in_transaction: bool = False
+        self._session_state: Dict[str, Any] = {}
+        self._stmt_bound_types: Dict[int, bytes] = {}
+        self._local_infile_source: Optional[Tuple[str, BinaryIO]] = None
+        self._prepared_statement_cache_size: Optional[
+            int
+        ] = prepared_statement_cache_size
+        self._prepared_statements: Optional[PreparedStatementCache] = None
         self._oci_config_file: Optional[str] = None
         self._oci_config_profile: Optional[str] = None
         self._fido_callback: Optional[Union[str, Callable[[str], None]]] = fido_callback
         self._webauthn_callback: Optional[
             Union[str, Callable[[str], None]]
         ] = webauthn_callback
+        self._pool_config_version: Any = None
 
         self.converter: Optional[MySQLConverter] = None
 
@@ -291,6 +316,15 @@ class MySQLConnectionAbstract(ABC):
             except AttributeError as err:
                 raise AttributeError("'user' must be a string") from err
 
+        algorithms, self._zstd_compression_level = validate_compression_options(
+            self._compression_algorithms, self._zstd_compression_level
+        )
+        self._compression_algorithms = algorithms
+        if (algorithms and set(algorithms) != {"uncompressed"}) or (
+            self._client_flags & ClientFlag.COMPRESS
+        ):
+            # Kept to negotiate the compression again on each handshake
+            self._compress = True
         if self._compress:
             self.set_client_flags([ClientFlag.COMPRESS])
 
@@ -345,6 +379,19 @@ class MySQLConnectionAbstract(ABC):
             if self._tls_ciphersuites:
                 self._validate_tls_ciphersuites()
 
+        cache_size = self._prepared_statement_cache_size
+        if cache_size is not None and (
+            not isinstance(cache_size, int)
+            or isinstance(cache_size, bool)
+            or cache_size < 0
+        ):
+            raise AttributeError(
+                "prepared_statement_cache_size must be a positive integer, "
+                f"found: '{cache_size}'"
+            )
+        if cache_size:
+            self._prepared_statements = PreparedStatementCache(cache_size)
+
         if not isinstance(self._connection_attrs, dict):
             raise InterfaceError("conn_attrs must be of type dict")
 
@@ -677,6 +724,20 @@ class MySQLConnectionAbstract(ABC):
         """Set the current database."""
         await self.cmd_query(f"USE {value}")
 
+    @property
+    def prepared_statement_cache(self) -> Optional[PreparedStatementCache]:
+        """The prepared statement cache.
+
+        Statements prepared by `MySQLCursorPrepared` are kept by their SQL text
+        and shared by all the cursors of the connection. The cache is enabled
+        with the `prepared_statement_cache_size` option, its `hits` and `misses`
+        counters can be used to check its efficiency.
+
+        Returns:
+            The `PreparedStatementCache` or `None` if disabled.
+        """
+        return self._prepared_statements
+
     @property
     def can_consume_results(self) -> bool:
         """Returns whether to consume results"""
@@ -688,6 +749,16 @@ class MySQLConnectionAbstract(ABC):
         assert isinstance(value, bool)
         self._consume_results = value
 
+    @property
+    def pool_config_version(self) -> Any:
+        """Returns the pool configuration version."""
+        return self._pool_config_version
+
+    @pool_config_version.setter
+    def pool_config_version(self, value: Any) -> None:
+        """Sets the pool configuration version"""
+        self._pool_config_version = value
+
     @property
     def in_transaction(self) -> bool:
         """MySQL session has started a transaction."""
@@ -817,6 +888,35 @@ class MySQLConnectionAbstract(ABC):
         await self.cmd_query(f"SET @@session.sql_mode = '{value}'")
         self._sql_mode = value
 
+    async def get_max_allowed_packet(self) -> int:
+        """Gets the maximum size of the statements sent to the server.
+
+        Unless a limit was set, the server's `max_allowed_packet` is queried once
+        per session and cached. Statements built by the connector, such as the
+        multi-row INSERT statements of `executemany()`, are split to fit in it.
+        """
+        if self._max_allowed_packet_limit is not None:
+            return self._max_allowed_packet_limit
+        if self._max_allowed_packet is None:
+            self._max_allowed_packet = int(
+                (
+                    await self.info_query(  # type: ignore[arg-type]
+                        "SELECT @@session.max_allowed_packet"
+                    )
+                )[0]
+            )
+        return self._max_allowed_packet
+
+    def set_max_allowed_packet(self, value: int) -> None:
+        """Sets the maximum size of the statements built by the connector.
+
+        The server's `max_allowed_packet` is not changed: a lower limit only keeps
+        the statements built by the connector smaller.
+        """
+        if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+            raise ValueError("max_allowed_packet must be a positive integer")
+        self._max_allowed_packet_limit = value
+
     @property
     def get_warnings(self) -> bool:
         """Get whether this connection retrieves warnings automatically.
@@ -938,13 +1038,26 @@ class MySQLConnectionAbstract(ABC):
         This method executes commands after the connection has been established.
         Some setting like autocommit, character set, and SQL mode are set using this
         method.
+
+        The character set, autocommit, time zone and SQL mode are set using a single
+        `SET` statement, so a new connection only waits for one round trip before
+        the `init_command`.
         """
-        await self.set_charset_collation(self._charset.charset_id)
-        await self.set_autocommit(self._autocommit)
+        # The server's max_allowed_packet is queried again for the new session
+        self._max_allowed_packet = None
+        self._get_charset_collation(self._charset.charset_id)
+        assignments = [
+            f"NAMES '{self._charset.name}' COLLATE '{self._charset.collation}'",
+            f"@@session.autocommit = {'ON' if self._autocommit else 'OFF'}",
+        ]
         if self._time_zone:
-            await self.set_time_zone(self._time_zone)
+            assignments.append(f"@@session.time_zone = '{self._time_zone}'")
         if self._sql_mode:
-            await self.set_sql_mode(self._sql_mode)
+            if isinstance(self._sql_mode, (list, tuple)):
+                self._sql_mode = ",".join(self._sql_mode)
+            assignments.append(f"@@session.sql_mode = '{self._sql_mode}'")
+        await self.cmd_query(f"SET {', '.join(assignments)}")
+        self._set_charset_name()
         if self._init_command:
             await self._execute_query(self._init_command)
 
@@ -973,6 +1086,20 @@ class MySQLConnectionAbstract(ABC):
             >>> cnx.set_charset_collation('latin1', 'latin1_general_ci')
             ```
         """
+        self._get_charset_collation(charset, collation)
+        await self.cmd_query(
+            f"SET NAMES '{self._charset.name}' COLLATE '{self._charset.collation}'"
+        )
+        self._set_charset_name()
+
+    def _get_charset_collation(
+        self, charset: Optional[Union[int, str]] = None, collation: Optional[str] = None
+    ) -> None:
+        """Look up the character set and collation for the current connection.
+
+        The arguments are the ones of `set_charset_collation()`. The character set
+        of the connection is updated.
+        """
         err_msg = "{} should be either integer, string or None"
         if not isinstance(charset, (int, str)) and charset is not None:
             raise ValueError(err_msg.format("charset"))
@@ -1002,9 +1129,8 @@ class MySQLConnectionAbstract(ABC):
         self._charset_name = self._charset.name
         self._charset_collation = self._charset.collation
 
-        await self.cmd_query(
-            f"SET NAMES '{self._charset.name}' COLLATE '{self._charset.collation}'"
-        )
+    def _set_charset_name(self) -> None:
+        """Use the character set set on the server for the current connection."""
         try:
             # Required for C Extension
             self.set_character_set_name(self._charset.name)
@@ -1184,6 +1310,8 @@ class MySQLConnectionAbstract(ABC):
         """Consume pending results."""
         if self.unread_result:
             await self.get_rows()
+            if self._prepared_statements is not None:
+                self._prepared_statements.unpin_unread_result()
 
     async def info_query(self, query: StrOrBytes) -> Optional[RowType]:
         """Send a query which only returns 1 row."""
@@ -1274,6 +1402,7 @@ class MySQLConnectionAbstract(ABC):
         cursor_class: Optional[Type[MySQLCursorAbstract]] = None,
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        fetch_size: Optional[int] = None,
     ) -> MySQLCursorAbstract:
         """Instantiate and return a cursor.
 
@@ -1286,6 +1415,9 @@ class MySQLConnectionAbstract(ABC):
         parameter, but it needs to be a subclass of
         mysql.connector.aio.abstracts.MySQLCursorAbstract.
 
+        Prepared cursors given a `fetch_size` open a read-only cursor on the server
+        and fetch the rows in batches of `fetch_size` rows.
+
         Raises:
             ProgrammingError: When cursor_class is not a subclass of
                               CursorBase.
@@ -1528,6 +1660,7 @@ class MySQLCursorAbstract(ABC):
             None,
             None,
         )
+        self._prefetched: Deque[RowType] = deque()
         self.arraysize: int = 1
         self._connection.add_cursor(self)
 
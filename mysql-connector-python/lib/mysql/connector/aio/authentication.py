@@ -36,6 +36,7 @@ import copy
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from ..constants import DEFAULT_ZSTD_COMPRESSION_LEVEL
 from ..errors import InterfaceError, NotSupportedError, get_exception
 from ..protocol import (
     AUTH_SWITCH_STATUS,
@@ -248,6 +249,7 @@ class MySQLAuthenticator:
         auth_plugin_class: Optional[str] = None,
         conn_attrs: Optional[Dict[str, str]] = None,
         is_change_user_request: bool = False,
+        zstd_compression_level: int = DEFAULT_ZSTD_COMPRESSION_LEVEL,
         **plugin_config: Any,
     ) -> bytes:
         """Perform the authentication phase.
@@ -270,6 +272,8 @@ class MySQLAuthenticator:
                                than the authorization plugin name).
             conn_attrs: Connection attributes.
             is_change_user_request: Whether is a `change user request` operation or not.
+            zstd_compression_level: Compression level sent to the server when the
+                                    zstd compression algorithm is negotiated.
             plugin_config: Custom configuration to be passed to the auth plugin
                            when invoked. The parameters defined here will override the
                            ones defined in the auth plugin itself.
@@ -305,6 +309,7 @@ class MySQLAuthenticator:
             is_change_user_request=is_change_user_request,
             ssl_enabled=self.ssl_enabled,
             plugin_config=self.plugin_config,
+            zstd_compression_level=zstd_compression_level,
         )
 
         # client sends transaction response
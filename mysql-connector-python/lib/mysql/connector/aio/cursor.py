@@ -35,12 +35,16 @@ __all__ = ["MySQLCursor"]
 import re
 import warnings
 
-from collections import namedtuple
+from collections import deque, namedtuple
 from decimal import Decimal
+from io import IOBase
 from typing import (
     Any,
     AsyncGenerator,
+    Deque,
     Dict,
+    Generator,
+    Iterable,
     Iterator,
     List,
     NoReturn,
@@ -50,20 +54,26 @@ from typing import (
     Union,
 )
 
-from ..constants import ServerFlag
+from ..constants import ClientFlag, CursorType, ServerFlag
 from ..cursor import (
+    LOAD_DATA_ROWS_FILE,
     MAX_RESULTS,
-    RE_PY_MAPPING_PARAM,
-    RE_PY_PARAM,
-    RE_SQL_COMMENT,
+    MULTI_STATEMENT_SEPARATOR,
     RE_SQL_FIND_PARAM,
     RE_SQL_INSERT_STMT,
-    RE_SQL_INSERT_VALUES,
-    RE_SQL_ON_DUPLICATE,
     RE_SQL_PYTHON_CAPTURE_PARAM_NAME,
     RE_SQL_PYTHON_REPLACE_PARAM,
+    LoadDataRowsReader,
+    batch_insert_statements,
+    batch_statements,
+    compile_format_template,
+    compile_insert_template,
+    compile_mapping_template,
+    encode_operation,
     is_eol_comment,
+    load_data_statement,
     parse_multi_statement_query,
+    substitute_params,
 )
 from ..errors import (
     Error,
@@ -89,61 +99,6 @@ from .abstracts import NAMED_TUPLE_CACHE, MySQLConnectionAbstract, MySQLCursorAb
 ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
 
-class _ParamSubstitutor:
-    """Substitute parameters into a SQL statement."""
-
-    def __init__(self, params: Sequence[bytes]) -> None:
-        self.params: Sequence[bytes] = params
-        self.index: int = 0
-
-    def __call__(self, matchobj: re.Match) -> bytes:
-        index = self.index
-        self.index += 1
-        try:
-            return bytes(self.params[index])
-        except IndexError:
-            raise ProgrammingError(
-                "Not enough parameters for the SQL statement"
-            ) from None
-
-    @property
-    def remaining(self) -> int:
-        """Return the number of parameters remaining to be substituted."""
-        return len(self.params) - self.index
-
-
-def _bytestr_format_dict(bytestr: bytes, value_dict: Dict[bytes, bytes]) -> bytes:
-    """
-    >>> _bytestr_format_dict(b'%(a)s', {b'a': b'foobar'})
-    b'foobar
-    >>> _bytestr_format_dict(b'%%(a)s', {b'a': b'foobar'})
-    b'%%(a)s'
-    >>> _bytestr_format_dict(b'%%%(a)s', {b'a': b'foobar'})
-    b'%%foobar'
-    >>> _bytestr_format_dict(b'%(x)s %(y)s',
-    ...                      {b'x': b'x=%(y)s', b'y': b'y=%(x)s'})
-    b'x=%(y)s y=%(x)s'
-    """
-
-    def replace(matchobj: re.Match) -> bytes:
-        """Replace pattern."""
-        value: Optional[bytes] = None
-        groups = matchobj.groupdict()
-        if groups["conversion_type"] == b"%":
-            value = b"%"
-        if groups["conversion_type"] == b"s":
-            key = groups["mapping_key"]
-            value = value_dict[key]
-        if value is None:
-            raise ValueError(
-                f"Unsupported conversion_type: {groups['conversion_type']}"
-            )
-        return value
-
-    stmt = RE_PY_MAPPING_PARAM.sub(replace, bytestr)
-    return stmt
-
-
 class MySQLCursor(MySQLCursorAbstract):
     """Default cursor for interacting with MySQL.
 
@@ -172,9 +127,7 @@ class MySQLCursor(MySQLCursorAbstract):
         self._connection = None
         return True
 
-    def _process_params_dict(
-        self, params: ParamsDictType
-    ) -> Dict[bytes, Union[bytes, Decimal]]:
+    def _process_params_dict(self, params: ParamsDictType) -> Dict[bytes, bytes]:
         """Process query parameters given as dictionary."""
         res: Dict[bytes, Any] = {}
         try:
@@ -194,9 +147,7 @@ class MySQLCursor(MySQLCursorAbstract):
             ) from err
         return res
 
-    def _process_params(
-        self, params: ParamsSequenceType
-    ) -> Tuple[Union[bytes, Decimal], ...]:
+    def _process_params(self, params: ParamsSequenceType) -> Tuple[bytes, ...]:
         """Process query parameters."""
         result = params[:]
         try:
@@ -307,6 +258,61 @@ class MySQLCursor(MySQLCursorAbstract):
 
         return row
 
+    async def _read_rows(self, count: int, raw: bool = False) -> None:
+        """Read rows of the result set ahead.
+
+        Reads up to count rows with a single get_rows() call, looking one row ahead
+        so the end of the result set is handled as soon as its last row is read.
+        """
+        rows = []
+        if self._nextrow[0]:
+            rows.append(self._nextrow[0])
+            self._nextrow = (None, None)
+        tmp, eof = await self._connection.get_rows(
+            count=count - len(rows) + 1,
+            binary=self._binary,
+            columns=self.description,
+            raw=raw,
+        )
+        rows.extend(tmp)
+        if eof is None:
+            self._nextrow = (rows.pop(), None)
+        else:
+            await self._handle_eof(eof)
+        self._prefetched.extend(rows)
+
+    async def _fetch_rows(
+        self, size: int, raw: bool = False, prefetch: int = 1
+    ) -> List[RowType]:
+        """Return up to size rows of the result set.
+
+        The rows are taken from the ones read ahead, and the missing ones, at least
+        prefetch of them, are read in a single batch.
+        """
+        missing = size - len(self._prefetched)
+        if missing > 0 and self._have_unread_result():
+            await self._read_rows(max(missing, prefetch), raw)
+        rows = [
+            self._prefetched.popleft() for _ in range(min(size, len(self._prefetched)))
+        ]
+        if rows:
+            if self._rowcount == -1:
+                self._rowcount = 0
+            self._rowcount += len(rows)
+        return rows
+
+    async def _fetch_remaining_rows(self, raw: Optional[bool] = None) -> List[RowType]:
+        """Return the rows read ahead and the rest of the result set."""
+        rows = list(self._prefetched)
+        self._prefetched.clear()
+        if self._have_unread_result():
+            tmp, eof = await self._connection.get_rows(raw=raw)
+            if self._nextrow[0]:
+                rows.append(self._nextrow[0])
+            rows.extend(tmp)
+            await self._handle_eof(eof)
+        return rows
+
     async def _handle_result(self, result: ResultType) -> None:
         """Handle the result after a command was send.
 
@@ -394,6 +400,7 @@ class MySQLCursor(MySQLCursorAbstract):
         self._stored_results = []
         self._rowcount = -1
         self._nextrow = (None, None)
+        self._prefetched = deque()
         await self.reset()
 
     def _have_unread_result(self) -> bool:
@@ -426,32 +433,25 @@ class MySQLCursor(MySQLCursorAbstract):
             ProgrammingError: On converting to bytes, missing parameters or invalid
                               parameters type.
         """
-        try:
-            stmt = (
-                operation
-                if isinstance(operation, (bytes, bytearray))
-                else operation.encode(self._connection.python_charset)
-            )
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise ProgrammingError(str(err)) from err
-
-        if params:
-            if isinstance(params, dict):
-                stmt = _bytestr_format_dict(stmt, self._process_params_dict(params))
-            elif isinstance(params, (list, tuple)):
-                psub = _ParamSubstitutor(self._process_params(params))
-                stmt = RE_PY_PARAM.sub(psub, stmt)
-                if psub.remaining != 0:
-                    raise ProgrammingError(
-                        "Not all parameters were used in the SQL statement"
-                    )
-            else:
-                raise ProgrammingError(
-                    f"Could not process parameters: {type(params).__name__}({params}),"
-                    " it must be of type list, tuple or dict"
-                )
+        if isinstance(operation, bytearray):
+            operation = bytes(operation)
+        charset = self._connection.python_charset
+        if not params:
+            return encode_operation(operation, charset)
 
-        return stmt
+        if isinstance(params, dict):
+            values = self._process_params_dict(params)
+            fragments, names = compile_mapping_template(operation, charset)
+            return substitute_params(fragments, [values[name] for name in names])
+        if isinstance(params, (list, tuple)):
+            return substitute_params(
+                compile_format_template(operation, charset),
+                self._process_params(params),
+            )
+        raise ProgrammingError(
+            f"Could not process parameters: {type(params).__name__}({params}),"
+            " it must be of type list, tuple or dict"
+        )
 
     async def _fetch_warnings(self) -> Optional[List[WarningType]]:
         """Fetch warnings doing a SHOW WARNINGS."""
@@ -462,60 +462,46 @@ class MySQLCursor(MySQLCursorAbstract):
         return result if result else None  # type: ignore[return-value]
 
     def _batch_insert(
-        self, operation: str, seq_params: Sequence[ParamsSequenceOrDictType]
-    ) -> Optional[bytes]:
-        """Implements multi row insert"""
-
-        def remove_comments(match: re.Match) -> str:
-            """Remove comments from INSERT statements.
-
-            This function is used while removing comments from INSERT
-            statements. If the matched string is a comment not enclosed
-            by quotes, it returns an empty string, else the string itself.
-            """
-            if match.group(1):
-                return ""
-            return match.group(2)
-
-        tmp = re.sub(
-            RE_SQL_ON_DUPLICATE,
-            "",
-            re.sub(RE_SQL_COMMENT, remove_comments, operation),
-        )
-
-        matches = re.search(RE_SQL_INSERT_VALUES, tmp)
-        if not matches:
-            raise InterfaceError(
-                "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
-            )
-        fmt = matches.group(1).encode(self._connection.python_charset)
-        values = []
+        self,
+        operation: str,
+        seq_params: Iterable[ParamsSequenceOrDictType],
+        max_allowed_packet: int,
+    ) -> Optional[Generator[bytes, None, None]]:
+        """Implements multi row insert
+
+        Returns a generator of the multi-row INSERT statements, each one holding as
+        many rows as fit in `max_allowed_packet`, or None when the statement can not
+        be rewritten. All the parameter sets are converted before returning, so that
+        an invalid one raises before any row is inserted.
+        """
+        charset = self._connection.python_charset
+        stmt, fmt = compile_insert_template(operation, charset)
+        if fmt not in stmt:
+            return None
 
-        try:
-            stmt = operation.encode(self._connection.python_charset)
-            for params in seq_params:
-                tmp = fmt
-                if isinstance(params, dict):
-                    tmp = _bytestr_format_dict(tmp, self._process_params_dict(params))
-                else:
-                    psub = _ParamSubstitutor(self._process_params(params))
-                    tmp = RE_PY_PARAM.sub(psub, tmp)
-                    if psub.remaining != 0:
-                        raise ProgrammingError(
-                            "Not all parameters were used in the SQL statement"
+        def rows() -> Generator[bytes, None, None]:
+            """Substitute the parameters in the row of values."""
+            try:
+                for params in seq_params:
+                    if isinstance(params, dict):
+                        values = self._process_params_dict(params)
+                        fragments, names = compile_mapping_template(fmt, charset)
+                        yield substitute_params(
+                            fragments, [values[name] for name in names]
                         )
-                values.append(tmp)
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b",".join(values), 1)
-                self._executed = stmt
-                return stmt
-            return None
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise ProgrammingError(str(err)) from err
-        except Error:
-            raise
-        except Exception as err:
-            raise InterfaceError(f"Failed executing the operation; {err}") from None
+                    else:
+                        yield substitute_params(
+                            compile_format_template(fmt, charset),
+                            self._process_params(params),
+                        )
+            except (UnicodeDecodeError, UnicodeEncodeError) as err:
+                raise ProgrammingError(str(err)) from err
+            except Error:
+                raise
+            except Exception as err:
+                raise InterfaceError(f"Failed executing the operation; {err}") from None
+
+        return batch_insert_statements(stmt, fmt, list(rows()), max_allowed_packet)
 
     def stored_results(self) -> Iterator[MySQLCursorAbstract]:
         """Returns an iterator for stored results.
@@ -730,6 +716,7 @@ class MySQLCursor(MySQLCursorAbstract):
         self,
         operation: str,
         seq_params: Sequence[ParamsSequenceType],
+        batch_size: Optional[int] = None,
     ) -> None:
         """Prepare and execute a MySQL Prepared Statement many times.
 
@@ -737,7 +724,30 @@ class MySQLCursor(MySQLCursorAbstract):
         the list seq_params.
 
         If the cursor instance already had a prepared statement, it is first closed.
+
+        INSERT statements are sent as multi-row INSERT statements, as many as needed
+        to fit in the connection's `max_allowed_packet`. All the parameter sets are
+        converted before the first statement is sent. When a statement fails, the
+        rows inserted by the previous ones are kept unless the transaction is
+        rolled back.
+
+        Statements other than INSERT are executed once per parameter set, unless
+        `batch_size` is given. Then, up to `batch_size` statements are sent at once
+        in a multi-statement query fitting in max_allowed_packet, and the operation
+        must be a single statement. When a statement fails, the following ones in
+        its batch are not executed. The error raised tells which parameter set
+        failed, and rowcount holds the rows affected by the statements executed
+        before it.
+
+        Raises:
+            ValueError: If `batch_size` is not a positive integer.
         """
+        if batch_size is not None and (
+            not isinstance(batch_size, int)
+            or isinstance(batch_size, bool)
+            or batch_size < 1
+        ):
+            raise ValueError("batch_size must be a positive integer")
         if not operation or not seq_params:
             return None
         await self._connection.handle_unread_result()
@@ -752,10 +762,27 @@ class MySQLCursor(MySQLCursorAbstract):
             if not seq_params:
                 self._rowcount = 0
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                self._executed = stmt
-                return await self.execute(stmt)
+            stmts = self._batch_insert(
+                operation,
+                seq_params,
+                await self._connection.get_max_allowed_packet(),
+            )
+            if stmts is not None:
+                rowcnt, last_insert_id = 0, None
+                for stmt in stmts:
+                    await self.execute(stmt)
+                    rowcnt += self._rowcount
+                    if last_insert_id is None:
+                        # The ID generated for the first row, as when the rows
+                        # are inserted by one statement
+                        last_insert_id = self._last_insert_id
+                self._rowcount = rowcnt
+                self._last_insert_id = last_insert_id
+                return None
+
+        if batch_size:
+            await self._execute_batched(operation, seq_params, batch_size)
+            return None
 
         rowcnt = 0
         try:
@@ -768,9 +795,102 @@ class MySQLCursor(MySQLCursorAbstract):
             raise ProgrammingError(f"Failed executing the operation; {err}") from None
         self._rowcount = rowcnt
 
+    async def _execute_batched(
+        self,
+        operation: str,
+        seq_params: Iterable[ParamsSequenceType],
+        batch_size: int,
+    ) -> None:
+        """Execute the operation with the parameter sets in multi-statement batches.
+
+        The results of each batch are read through `executemulti()`, adding up
+        rowcount.
+        """
+        stmts = (self._prepare_statement(operation, params) for params in seq_params)
+        rowcnt = index = 0
+        try:
+            for batch in batch_statements(
+                stmts, batch_size, await self._connection.get_max_allowed_packet()
+            ):
+                stmt = MULTI_STATEMENT_SEPARATOR.join(batch)
+                try:
+                    async for _ in self.executemulti(stmt):
+                        if self.with_rows and self._have_unread_result():
+                            await self.fetchall()
+                        rowcnt += self._rowcount
+                        # The result sets of a procedure are followed by its status
+                        in_call = self._executed.upper().startswith(b"CALL")
+                        if self._description is None or not in_call:
+                            index += 1
+                except Error as err:
+                    raise err.__class__(
+                        msg=f"{err.msg} (executing parameter set {index})",
+                        errno=err.errno,
+                        sqlstate=err.sqlstate,
+                    ) from err
+        except (ValueError, TypeError) as err:
+            raise ProgrammingError(f"Failed executing the operation; {err}") from None
+        finally:
+            self._rowcount = rowcnt
+
+    async def load_rows(
+        self,
+        table: str,
+        rows: Iterable[Union[ParamsSequenceType, ParamsDictType]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Load rows in a table using LOAD DATA LOCAL INFILE.
+
+        The rows are streamed to the server as the data of a LOAD DATA LOCAL INFILE
+        statement, converted and encoded as they are consumed, so rows can be an
+        iterator and no file is written. The values are converted like the
+        parameters of execute(). The number of rows loaded is available in rowcount.
+
+        The connection must be opened with allow_local_infile or
+        allow_local_infile_in_path, and local_infile must be enabled on the server.
+        The rows are not subject to allow_local_infile_in_path.
+
+        Args:
+            table: The table the rows are loaded in. The name is quoted, a name in
+                   the `db.table` form is split at its first dot.
+            rows: The rows to load. Rows given as dictionaries are read in the order
+                  of columns.
+            columns: The columns, or user variables, the fields are assigned to.
+
+        Raises:
+            NotSupportedError: If the connection doesn't allow LOAD DATA LOCAL
+                               INFILE.
+            ProgrammingError: If a row can't be converted. The rows before it are
+                              loaded.
+        """
+        if not self._connection:
+            raise ProgrammingError("Cursor is not connected")
+
+        if not self._connection.isset_client_flag(ClientFlag.LOCAL_FILES):
+            raise NotSupportedError(
+                "load_rows() requires the allow_local_infile or "
+                "allow_local_infile_in_path connection option"
+            )
+
+        reader = LoadDataRowsReader(rows, self._connection.converter, columns)
+        # pylint: disable=protected-access
+        self._connection._local_infile_source = (LOAD_DATA_ROWS_FILE, reader)
+        try:
+            await self.execute(
+                load_data_statement(table, columns, self._connection.charset)
+            )
+        finally:
+            self._connection._local_infile_source = None
+        # pylint: enable=protected-access
+        if reader.error is not None:
+            raise reader.error
+
     async def fetchone(self) -> Optional[RowType]:
         """Return next row of a query result set.
 
+        Up to arraysize rows are read from the server at once, and returned by the
+        next calls.
+
         Raises:
             InterfaceError: If there is no result to fetch.
 
@@ -779,7 +899,8 @@ class MySQLCursor(MySQLCursorAbstract):
         """
         if self._executed is None:
             raise InterfaceError(ERR_NO_RESULT_TO_FETCH)
-        return await self._fetch_row()
+        rows = await self._fetch_rows(1, raw=self._raw, prefetch=self.arraysize)
+        return rows[0] if rows else None
 
     async def fetchall(self) -> List[RowType]:
         """Return all rows of a query result set.
@@ -790,14 +911,10 @@ class MySQLCursor(MySQLCursorAbstract):
         if self._executed is None:
             raise InterfaceError(ERR_NO_RESULT_TO_FETCH)
 
-        if not self._connection.unread_result:
+        if not self._prefetched and not self._connection.unread_result:
             return []
 
-        rows, eof = await self._connection.get_rows()
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-
-        await self._handle_eof(eof)
+        rows = await self._fetch_remaining_rows()
         rowcount = len(rows)
         if rowcount >= 0 and self._rowcount == -1:
             self._rowcount = 0
@@ -809,21 +926,13 @@ class MySQLCursor(MySQLCursorAbstract):
 
         When no more rows are available, it returns an empty list.
         The number of rows returned can be specified using the size argument, which
-        defaults to one.
+        defaults to arraysize. The rows are read from the server in a single batch.
 
         Returns:
             list: The next set of rows of a query result set.
         """
         self._check_executed()
-        res = []
-        cnt = size or self.arraysize
-        while cnt > 0:
-            cnt -= 1
-            row = await self.fetchone()
-            if row:
-                res.append(row)
-
-        return res
+        return await self._fetch_rows(size or self.arraysize, raw=self._raw)
 
 
 class MySQLCursorBuffered(MySQLCursor):
@@ -883,6 +992,23 @@ class MySQLCursorBuffered(MySQLCursor):
         self._next_row = len(self._rows)
         return res
 
+    async def fetchmany(self, size: Optional[int] = None) -> List[RowType]:
+        """Return the next set of rows of a query result set.
+
+        When no more rows are available, it returns an empty list.
+        The number of rows returned can be specified using the size argument, which
+        defaults to arraysize.
+
+        Returns:
+            list: The next set of rows of a query result set.
+        """
+        self._check_executed()
+        if self._rows is None:
+            return []
+        res = self._rows[self._next_row : self._next_row + (size or self.arraysize)]
+        self._next_row += len(res)
+        return res
+
     @property
     def with_rows(self) -> bool:
         return self._rows is not None
@@ -895,15 +1021,6 @@ class MySQLCursorRaw(MySQLCursor):
         super().__init__(connection)
         self._raw: bool = True
 
-    async def fetchone(self) -> Optional[RowType]:
-        """Return next row of a query result set.
-
-        Returns:
-            tuple or None: A row from query result set.
-        """
-        self._check_executed()
-        return await self._fetch_row(raw=True)
-
     async def fetchall(self) -> List[RowType]:
         """Return all rows of a query result set.
 
@@ -911,12 +1028,9 @@ class MySQLCursorRaw(MySQLCursor):
             list: A list of tuples with all rows of a query result set.
         """
         self._check_executed()
-        if not self._have_unread_result():
+        if not self._prefetched and not self._have_unread_result():
             return []
-        rows, eof = await self._connection.get_rows(raw=True)
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-        await self._handle_eof(eof)
+        rows = await self._fetch_remaining_rows(raw=True)
         rowcount = len(rows)
         if rowcount >= 0 and self._rowcount == -1:
             self._rowcount = 0
@@ -968,6 +1082,21 @@ class MySQLCursorDict(MySQLCursor):
         """
         return self._row_to_python(await super().fetchone(), self.description)
 
+    async def fetchmany(
+        self, size: Optional[int] = None
+    ) -> List[Optional[Dict[str, RowItemType]]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of dictionaries with the next set of rows of a query
+                  result set where column names are used as keys.
+        """
+        return [
+            self._row_to_python(row, self.description)
+            for row in await super().fetchmany(size)
+            if row
+        ]
+
     async def fetchall(self) -> List[Optional[Dict[str, RowItemType]]]:
         """Return all rows of a query result set.
 
@@ -1027,6 +1156,18 @@ class MySQLCursorNamedTuple(MySQLCursor):
             else row
         )
 
+    async def fetchmany(self, size: Optional[int] = None) -> List[Optional[RowType]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of tuples with the next set of rows of a query result set.
+        """
+        return [
+            self._row_to_python(row, self.description)
+            for row in await super().fetchmany(size)
+            if row
+        ]
+
     async def fetchall(self) -> List[Optional[RowType]]:
         """Return all rows of a query result set.
 
@@ -1057,6 +1198,17 @@ class MySQLCursorBufferedDict(MySQLCursorDict, MySQLCursorBuffered):
             return self._row_to_python(row, self.description)
         return None
 
+    async def fetchmany(
+        self, size: Optional[int] = None
+    ) -> List[Optional[Dict[str, RowItemType]]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of dictionaries with the next set of rows of a query
+                  result set.
+        """
+        return await super().fetchmany(size)
+
     async def fetchall(self) -> List[Optional[Dict[str, RowItemType]]]:
         """Return all rows of a query result set.
 
@@ -1089,6 +1241,15 @@ class MySQLCursorBufferedNamedTuple(MySQLCursorNamedTuple, MySQLCursorBuffered):
             return self._row_to_python(row, self.description)
         return None
 
+    async def fetchmany(self, size: Optional[int] = None) -> List[Optional[RowType]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of named tuples with the next set of rows of a query
+                  result set.
+        """
+        return await super().fetchmany(size)
+
     async def fetchall(self) -> List[Optional[RowType]]:
         """Return all rows of a query result set.
 
@@ -1105,9 +1266,18 @@ class MySQLCursorBufferedNamedTuple(MySQLCursorNamedTuple, MySQLCursorBuffered):
 
 
 class MySQLCursorPrepared(MySQLCursor):
-    """Cursor using MySQL Prepared Statements"""
+    """Cursor using MySQL Prepared Statements.
+
+    When `fetch_size` is given, statements returning a result set open a read-only
+    cursor on the server, and rows are fetched in batches of `fetch_size` rows using
+    COM_STMT_FETCH. The connection can be used by other statements between batches.
+    """
 
-    def __init__(self, connection: MySQLConnectionAbstract):
+    def __init__(
+        self,
+        connection: MySQLConnectionAbstract,
+        fetch_size: Optional[int] = None,
+    ):
         super().__init__(connection)
         self._rows: Optional[List[RowType]] = None
         self._next_row: int = 0
@@ -1116,22 +1286,67 @@ class MySQLCursorPrepared(MySQLCursor):
         self._have_result: Optional[bool] = None
         self._last_row_sent: bool = False
         self._cursor_exists: bool = False
+        self._stmt_reset_needed: bool = False
+        if fetch_size is not None and (
+            not isinstance(fetch_size, int)
+            or isinstance(fetch_size, bool)
+            or fetch_size < 1
+        ):
+            raise ValueError("fetch_size must be a positive integer")
+        self._fetch_size: Optional[int] = fetch_size
+        self._fetched_rows: Deque[RowType] = deque()
+
+    @property
+    def fetch_size(self) -> Optional[int]:
+        """Number of rows fetched at once from the server-side cursor."""
+        return self._fetch_size
 
     async def reset(self, free: bool = True) -> None:
         if self._prepared:
-            try:
-                await self._connection.cmd_stmt_close(self._prepared["statement_id"])
-            except Error:
-                # We tried to deallocate, but it's OK when we fail.
-                pass
+            if self._connection.prepared_statement_cache is None:
+                try:
+                    await self._connection.cmd_stmt_close(
+                        self._prepared["statement_id"]
+                    )
+                except Error:
+                    # We tried to deallocate, but it's OK when we fail.
+                    pass
+            elif self._cursor_exists and not self._last_row_sent:
+                try:
+                    # Close the server-side cursor of the cached statement
+                    await self._connection.cmd_stmt_reset(
+                        self._prepared["statement_id"]
+                    )
+                except Error:
+                    pass
+            # Cached statements are kept for reuse and deallocated on eviction
+            self._pin_prepared(False)
             self._prepared = None
         self._last_row_sent = False
         self._cursor_exists = False
+        self._stmt_reset_needed = False
+        self._fetched_rows.clear()
+
+    def _pin_prepared(self, pinned: bool) -> None:
+        """Pins or unpins the cached prepared statement of the cursor.
+
+        The statement is pinned while its result set is not read, so other
+        cursors prepare their own statement instead of closing the open
+        server-side cursor or discarding the pending rows.
+        """
+        cache = self._connection.prepared_statement_cache
+        if cache is None or not self._prepared:
+            return
+        if pinned:
+            cache.pin(self._prepared, self, unread_result=not self._cursor_exists)
+        else:
+            cache.unpin(self._prepared, self)
 
     async def _handle_noresultset(self, res: ResultType) -> None:
         self._handle_server_status(
             res.get("status_flag", res.get("server_status", 0)),
         )
+        self._pin_prepared(False)
         await super()._handle_noresultset(res)
 
     def _handle_server_status(self, flags: int) -> None:
@@ -1142,6 +1357,7 @@ class MySQLCursorPrepared(MySQLCursor):
         self._handle_server_status(
             eof.get("status_flag", eof.get("server_status", 0)),
         )
+        self._pin_prepared(self._cursor_exists and not self._last_row_sent)
         await super()._handle_eof(eof)
 
     async def callproc(self, procname: Any, args: Any = ()) -> NoReturn:
@@ -1188,10 +1404,65 @@ class MySQLCursorPrepared(MySQLCursor):
             self._description = result[1]
             self._connection.unread_result = True
             self._have_result = True
-            if "status_flag" in result[2]:  # type: ignore[operator]
-                self._handle_server_status(result[2]["status_flag"])
-            elif "server_status" in result[2]:  # type: ignore[operator]
-                self._handle_server_status(result[2]["server_status"])
+            # No status means that no cursor was opened on the server
+            eof: EofPacketType = result[2]  # type: ignore[assignment]
+            self._handle_server_status(
+                eof.get("status_flag", eof.get("server_status", 0))
+            )
+            if self._cursor_exists:
+                # Rows stay on the server until fetched with COM_STMT_FETCH
+                self._connection.unread_result = False
+            self._pin_prepared(True)
+
+    async def _fetch_from_server_cursor(self) -> Optional[RowType]:
+        """Returns the next row from the server-side cursor.
+
+        Rows are fetched in batches of `fetch_size` rows when the rows fetched
+        previously have been consumed.
+        """
+        if not self._fetched_rows:
+            if not self._cursor_exists:
+                # No cursor was opened, the rows were sent right away
+                return await self._fetch_row(raw=self._raw) or None
+            if self._last_row_sent:
+                return None
+            await self._connection.handle_unread_result()
+            await self._connection.cmd_stmt_fetch(
+                self._prepared["statement_id"], self._fetch_size
+            )
+            rows, eof = await self._connection.get_rows(
+                binary=self._binary, columns=self.description, raw=self._raw
+            )
+            self._fetched_rows.extend(rows)
+            await self._handle_eof(eof)
+            if not self._fetched_rows:
+                return None
+        if self._rowcount == -1:
+            self._rowcount = 1
+        else:
+            self._rowcount += 1
+        return self._fetched_rows.popleft()
+
+    def _check_params(self, params: ParamsSequenceType) -> None:
+        """Check the parameters given to the prepared statement.
+
+        Raises:
+            ProgrammingError: When the parameters are not a tuple or list, or when
+                              their number does not match the statement.
+        """
+        if not isinstance(params, (tuple, list)):
+            raise ProgrammingError(
+                errno=1210,
+                msg="Incorrect type of argument: "
+                f"{type(params).__name__}({params})"
+                ", it must be of type tuple or list the argument given to "
+                "the prepared statement",
+            )
+        if len(self._prepared["parameters"]) != len(params):
+            raise ProgrammingError(
+                errno=1210,
+                msg="Incorrect number of arguments executing prepared statement",
+            )
 
     async def execute(
         self,
@@ -1237,8 +1508,9 @@ class MySQLCursorPrepared(MySQLCursor):
             # Convert %(name)s to ? before sending it to MySQL
             operation = re.sub(RE_SQL_PYTHON_REPLACE_PARAM, "?", operation)
 
-        if operation is not self._executed:
-            if self._prepared:
+        cache = self._connection.prepared_statement_cache
+        if operation is not self._executed or cache is not None:
+            if self._prepared and cache is None:
                 await self._connection.cmd_stmt_close(self._prepared["statement_id"])
             self._executed = operation
 
@@ -1252,36 +1524,48 @@ class MySQLCursorPrepared(MySQLCursor):
                 operation = re.sub(RE_SQL_FIND_PARAM, b"?", operation)
 
             try:
-                self._prepared = await self._connection.cmd_stmt_prepare(operation)
+                if cache is not None:
+                    # The cached statement may have been evicted or invalidated,
+                    # or be pinned by another cursor
+                    self._pin_prepared(False)
+                    prepared = await self._connection.get_prepared_statement(operation)
+                else:
+                    prepared = await self._connection.cmd_stmt_prepare(operation)
             except Error:
                 self._executed = None
                 raise
-
-        await self._connection.cmd_stmt_reset(self._prepared["statement_id"])
+            if prepared is not self._prepared:
+                # A freshly prepared statement has nothing to reset
+                self._prepared = prepared
+                self._stmt_reset_needed = self._cursor_exists = False
+
+        if (
+            self._stmt_reset_needed
+            or self._cursor_exists
+            and not self._last_row_sent
+            or self._connection.unread_result
+        ):
+            # Discard long data, open server-side cursor or pending result set,
+            # otherwise COM_STMT_RESET is a wasted round trip
+            await self._connection.cmd_stmt_reset(self._prepared["statement_id"])
+            self._stmt_reset_needed = False
 
         if self._prepared["parameters"] and not params:
             return
         if params:
-            if not isinstance(params, (tuple, list)):
-                raise ProgrammingError(
-                    errno=1210,
-                    msg="Incorrect type of argument: "
-                    f"{type(params).__name__}({params})"
-                    ", it must be of type tuple or list the argument given to "
-                    "the prepared statement",
-                )
-            if len(self._prepared["parameters"]) != len(params):
-                raise ProgrammingError(
-                    errno=1210,
-                    msg="Incorrect number of arguments executing prepared statement",
-                )
+            self._check_params(params)
 
         if params is None:
             params = ()
+        if any(isinstance(param, IOBase) for param in params):
+            # Sent using COM_STMT_SEND_LONG_DATA, discarded by COM_STMT_RESET
+            self._stmt_reset_needed = True
+        self._fetched_rows.clear()
         res = await self._connection.cmd_stmt_execute(
             self._prepared["statement_id"],
             data=params,
             parameters=self._prepared["parameters"],
+            flags=CursorType.READ_ONLY if self._fetch_size else CursorType.NO_CURSOR,
         )
         await self._handle_result(res)
 
@@ -1289,6 +1573,7 @@ class MySQLCursorPrepared(MySQLCursor):
         self,
         operation: str,
         seq_params: Sequence[ParamsSequenceType],
+        pipeline_size: Optional[int] = None,
     ) -> None:
         """Prepare and execute a MySQL Prepared Statement many times
 
@@ -1298,28 +1583,113 @@ class MySQLCursorPrepared(MySQLCursor):
         If the cursor instance already had a prepared statement, it is
         first closed.
 
-        executemany() simply calls execute().
+        executemany() simply calls execute(), unless `pipeline_size` is given.
+        Then, when the statement does not return a result set, the remaining
+        parameter sets are sent without waiting for the response of the previous
+        one, keeping at most `pipeline_size` executions in flight. When an
+        execution fails, the remaining parameter sets are not sent, but the ones
+        already in flight are still executed by the server. The error raised tells
+        which parameter set failed, and `rowcount` holds the rows affected by the
+        successful executions. The parameter sets are taken from `seq_params` as
+        they are sent; an invalid one stops the pipeline the same way, its error is
+        raised once the executions in flight are done.
         """
+        if pipeline_size is not None and (
+            not isinstance(pipeline_size, int)
+            or isinstance(pipeline_size, bool)
+            or pipeline_size < 1
+        ):
+            raise ValueError("pipeline_size must be a positive integer")
         if not operation or not seq_params:
             return None
         await self._connection.handle_unread_result()
 
         try:
-            _ = iter(seq_params)
+            params_iter = iter(seq_params)
         except TypeError as err:
             raise ProgrammingError("Parameters for query must be an Iterable") from err
 
         rowcnt = 0
         try:
-            for params in seq_params:
+            for params in params_iter:
                 await self.execute(operation, params)
                 if self.with_rows and self._have_unread_result():
                     await self.fetchall()
                 rowcnt += self._rowcount
+                if pipeline_size and not self.with_rows and not self._stmt_reset_needed:
+                    self._rowcount = rowcnt
+                    await self._execute_pipelined(operation, params_iter, pipeline_size)
+                    return None
         except (ValueError, TypeError) as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
         self._rowcount = rowcnt
 
+    async def _execute_pipelined(
+        self,
+        operation: StrOrBytes,
+        seq_params: Iterator[ParamsSequenceOrDictType],
+        pipeline_size: int,
+    ) -> None:
+        """Execute the prepared statement with the remaining parameter sets.
+
+        The first parameter set has already been executed, and the number of rows
+        it affected is in `rowcount`.
+        """
+        if isinstance(operation, bytes):
+            operation = operation.decode(self._connection.python_charset)
+        replacement_keys = re.findall(RE_SQL_PYTHON_CAPTURE_PARAM_NAME, operation)
+        indexes: List[int] = []
+        invalid: List[ProgrammingError] = []
+
+        def seq_data() -> Iterator[ParamsSequenceType]:
+            # Parameter sets are checked as they are sent, an invalid one ends
+            # the pipeline and is reported once the previous ones are executed
+            for index, params in enumerate(seq_params, start=1):
+                try:
+                    if isinstance(params, dict):
+                        try:
+                            params = tuple(params[key] for key in replacement_keys)
+                        except KeyError as err:
+                            raise ProgrammingError(
+                                "Not all placeholders were found in the parameters "
+                                "dict"
+                            ) from err
+                    if self._prepared["parameters"] and not params:
+                        continue
+                    if params:
+                        self._check_params(params)
+                except ProgrammingError as err:
+                    invalid.append(err)
+                    return
+                indexes.append(index)
+                yield params or ()
+
+        results = await self._connection.cmd_stmt_execute_pipelined(
+            self._prepared["statement_id"],
+            seq_data(),
+            self._prepared["parameters"],
+            window=pipeline_size,
+        )
+        rowcnt = self._rowcount
+        error = None
+        for index, result in zip(indexes, results):
+            if isinstance(result, Error):
+                if error is None:
+                    error = (index, result)
+                continue
+            await self._handle_noresultset(result)
+            rowcnt += self._rowcount
+        self._rowcount = rowcnt
+        if error:
+            index, exc = error
+            raise exc.__class__(
+                msg=f"{exc.msg} (executing parameter set {index})",
+                errno=exc.errno,
+                sqlstate=exc.sqlstate,
+            ) from exc
+        if invalid:
+            raise invalid[0]
+
     async def fetchone(self) -> Optional[RowType]:
         """Return next row of a query result set.
 
@@ -1327,6 +1697,8 @@ class MySQLCursorPrepared(MySQLCursor):
             tuple or None: A row from query result set.
         """
         self._check_executed()
+        if self._fetch_size:
+            return await self._fetch_from_server_cursor()
         if self._cursor_exists:
             await self._connection.cmd_stmt_fetch(self._prepared["statement_id"])
         return await self._fetch_row() or None
@@ -1344,6 +1716,14 @@ class MySQLCursorPrepared(MySQLCursor):
         self._check_executed()
         res = []
         cnt = size or self.arraysize
+        if self._fetch_size:
+            while cnt > 0:
+                cnt -= 1
+                row = await self._fetch_from_server_cursor()
+                if row is None:
+                    break
+                res.append(row)
+            return res
         while cnt > 0 and self._have_unread_result():
             cnt -= 1
             row = await self._fetch_row()
@@ -1358,6 +1738,13 @@ class MySQLCursorPrepared(MySQLCursor):
             list: A list of tuples with all rows of a query result set.
         """
         self._check_executed()
+        if self._fetch_size:
+            rows = []
+            row = await self._fetch_from_server_cursor()
+            while row is not None:
+                rows.append(row)
+                row = await self._fetch_from_server_cursor()
+            return rows
         rows = []
         if self._nextrow[0]:
             rows.append(self._nextrow[0])
@@ -1393,48 +1780,12 @@ class MySQLCursorPreparedDict(MySQLCursorDict, MySQLCursorPrepared):  # type: ig
     4. MySQLCursor (base class)
     """
 
-    async def fetchmany(
-        self, size: Optional[int] = None
-    ) -> List[Dict[str, RowItemType]]:
-        """Return the next set of rows of a query result set.
-
-        When no more rows are available, it returns an empty list.
-        The number of rows returned can be specified using the size argument,
-        which defaults to one.
-
-        Returns:
-            list: The next set of rows of a query result set represented
-                  as a list of dictionaries where column names are used as keys.
-        """
-        return [
-            self._row_to_python(row, self.description)
-            for row in await super().fetchmany(size=size)
-            if row
-        ]
-
 
 class MySQLCursorPreparedNamedTuple(MySQLCursorNamedTuple, MySQLCursorPrepared):
     """
     This class is a blend of features from MySQLCursorNamedTuple and MySQLCursorPrepared
     """
 
-    async def fetchmany(self, size: Optional[int] = None) -> List[RowType]:
-        """Return the next set of rows of a query result set.
-
-        When no more rows are available, it returns an empty list.
-        The number of rows returned can be specified using the size argument,
-        which defaults to one.
-
-        Returns:
-            list: The next set of rows of a query result set represented
-                  as a list of named tuples where column names are used as names.
-        """
-        return [
-            self._row_to_python(row, self.description)
-            for row in await super().fetchmany(size=size)
-            if row
-        ]
-
 
 class MySQLCursorPreparedRaw(MySQLCursorPrepared):
     """
@@ -1449,6 +1800,8 @@ class MySQLCursorPreparedRaw(MySQLCursorPrepared):
         Returns:
             tuple or None: A row from query result set.
         """
+        if self._fetch_size:
+            return await super().fetchone()
         self._check_executed()
         if self._cursor_exists:
             await self._connection.cmd_stmt_fetch(self._prepared["statement_id"])
@@ -1464,6 +1817,8 @@ class MySQLCursorPreparedRaw(MySQLCursorPrepared):
         Returns:
             list: The next set of rows of a query result set.
         """
+        if self._fetch_size:
+            return await super().fetchmany(size)
         self._check_executed()
         res = []
         cnt = size or self.arraysize
@@ -1480,6 +1835,8 @@ class MySQLCursorPreparedRaw(MySQLCursorPrepared):
         Returns:
             list: A list of tuples with all rows of a query result set.
         """
+        if self._fetch_size:
+            return await super().fetchall()
         self._check_executed()
         rows = []
         if self._nextrow[0]:
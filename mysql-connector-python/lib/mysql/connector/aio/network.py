@@ -35,7 +35,6 @@ __all__ = ["MySQLTcpSocket", "MySQLUnixSocket"]
 
 import asyncio
 import struct
-import zlib
 
 try:
     import ssl
@@ -64,6 +63,7 @@ from ..network import (
     MAX_PAYLOAD_LENGTH,
     MIN_COMPRESS_LENGTH,
     PACKET_HEADER_LENGTH,
+    get_compression_codec,
 )
 from .utils import StreamWriter, open_connection
 
@@ -254,12 +254,17 @@ class NetworkBrokerPlain(NetworkBroker):
 
 
 class NetworkBrokerCompressed(NetworkBrokerPlain):
-    """Broker class for MySQL socket communication."""
+    """Broker class for MySQL socket communication using compressed packets.
 
-    def __init__(self) -> None:
+    Payloads are compressed with the algorithm negotiated during the handshake,
+    `zlib` or `zstd`; the framing of the compressed packets is the same for both.
+    """
+
+    def __init__(self, algorithm: str = "zlib", level: Optional[int] = None) -> None:
         super().__init__()
         self._compressed_pktnr = -1
         self._queue_read: Deque[bytearray] = deque()
+        self._compress, self._decompress = get_compression_codec(algorithm, level)
 
     @staticmethod
     def _prepare_packets(payload: bytes, pktnr: int) -> List[bytes]:
@@ -310,7 +315,7 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
 
     async def _write_pkt(self, writer: StreamWriter, address: str, pkt: bytes) -> None:
         """Compress packet and write it to the comm channel."""
-        compressed_pkt = zlib.compress(pkt)
+        compressed_pkt = self._compress(pkt)
         pkt = (
             struct.pack("<I", len(compressed_pkt))[0:3]
             + struct.pack("<B", self._compressed_pktnr)
@@ -375,12 +380,15 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
                 )
 
     async def _read_compressed_pkt(
-        self, reader: asyncio.StreamReader, compressed_pll: int
+        self, reader: asyncio.StreamReader, compressed_pll: int, uncompressed_pll: int
     ) -> None:
         """Handle reading of a compressed packet."""
         # compressed_pll stands for compressed payload length.
         pkt = bytearray(
-            zlib.decompress(await super()._read_chunk(reader, size=compressed_pll))
+            self._decompress(
+                await super()._read_chunk(reader, size=compressed_pll),
+                uncompressed_pll,
+            )
         )
         offset = 0
         while offset < len(pkt):
@@ -408,7 +416,7 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
                 pkt += (
                     compressed_pkt
                     if uncompressed_pll == 0
-                    else zlib.decompress(compressed_pkt)
+                    else self._decompress(compressed_pkt, uncompressed_pll)
                 )
 
             self._queue_read.append(pkt[offset : offset + PACKET_HEADER_LENGTH + pll])
@@ -439,7 +447,9 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
                     )
                 else:
                     # Packet comes in compressed, further action is needed.
-                    await self._read_compressed_pkt(reader, compressed_pll)
+                    await self._read_compressed_pkt(
+                        reader, compressed_pll, uncompressed_pll
+                    )
             except IOError as err:
                 raise OperationalError(
                     errno=2055, values=(address, _strioerror(err))
@@ -471,6 +481,7 @@ class MySQLSocket(ABC):
         self._address: Optional[str] = None
         self._netbroker: NetworkBroker = NetworkBrokerPlain()
         self._is_connected: bool = False
+        self._unread_packet: Optional[bytearray] = None
 
     @property
     def address(self) -> str:
@@ -490,6 +501,7 @@ class MySQLSocket(ABC):
                 self._writer.transport.abort()
             await self._writer.wait_closed()
         self._is_connected = False
+        self._unread_packet = None
 
     def is_connected(self) -> bool:
         """Check if the socket is connected.
@@ -503,9 +515,16 @@ class MySQLSocket(ABC):
         """Set the connection timeout."""
         self._connection_timeout = timeout
 
-    def switch_to_compressed_mode(self) -> None:
-        """Enable network layer where transactions are made with compressed packets."""
-        self._netbroker = NetworkBrokerCompressed()
+    def switch_to_compressed_mode(
+        self, algorithm: str = "zlib", level: Optional[int] = None
+    ) -> None:
+        """Enable network layer where transactions are made with compressed packets.
+
+        Args:
+            algorithm: Compression algorithm, either `zlib` or `zstd`.
+            level: Compression level, only used by `zstd`.
+        """
+        self._netbroker = NetworkBrokerCompressed(algorithm, level)
 
     async def switch_to_ssl(self, ssl_context: ssl.SSLContext) -> None:
         """Upgrade an existing stream-based connection to TLS.
@@ -549,8 +568,15 @@ class MySQLSocket(ABC):
 
     async def read(self) -> bytearray:
         """Read packets from the MySQL server."""
+        if self._unread_packet is not None:
+            packet, self._unread_packet = self._unread_packet, None
+            return packet
         return await self._netbroker.read(self._reader, self.address)
 
+    def unread(self, packet: bytearray) -> None:
+        """Push back a packet, returned by the next call to `read()`."""
+        self._unread_packet = packet
+
     def build_ssl_context(
         self,
         ssl_ca: Optional[str] = None,
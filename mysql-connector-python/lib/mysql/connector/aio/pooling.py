@@ -0,0 +1,982 @@
+# Copyright (c) 2025, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+# mypy: disable-error-code="attr-defined"
+
+"""Implementing pooling of asynchronous connections to MySQL servers."""
+
+from __future__ import annotations
+
+__all__ = ["MySQLConnectionPool", "PooledMySQLConnection"]
+
+import asyncio
+import contextlib
+import time
+import weakref
+
+from collections import deque
+from types import TracebackType
+from typing import Any, Deque, Dict, List, NoReturn, Optional, Type
+from uuid import uuid4
+
+from ..errors import Error, PoolError
+from ..pooling import (
+    CNX_POOL_MAINTENANCE_INTERVAL,
+    CNX_POOL_MAXNAMESIZE,
+    CNX_POOL_MAXSIZE,
+    CNX_POOL_NAMEREGEX,
+    PoolMetrics,
+    generate_pool_name,
+)
+from ..types import PoolMetricsType
+from .abstracts import MySQLConnectionAbstract
+from .connection import MySQLConnection
+
+
+class PooledMySQLConnection:
+    """Class holding an asynchronous MySQL Connection in a pool
+
+    PooledMySQLConnection is used by MySQLConnectionPool to return an
+    instance holding a MySQL connection. It works like a MySQLConnection
+    except for methods like close() and config().
+
+    The close()-method will add the connection back to the pool rather
+    than disconnecting from the MySQL server.
+
+    Attributes:
+        pool_name (str): Returns the name of the connection pool to which the
+                         connection belongs.
+    """
+
+    def __init__(self, pool: MySQLConnectionPool, cnx: MySQLConnectionAbstract) -> None:
+        """Constructor.
+
+        Args:
+            pool: A `MySQLConnectionPool` instance.
+            cnx: A `MySQLConnectionAbstract` subclass instance.
+        """
+        if not isinstance(pool, MySQLConnectionPool):
+            raise AttributeError("pool should be a MySQLConnectionPool")
+        if not isinstance(cnx, MySQLConnectionAbstract):
+            raise AttributeError("cnx should be a MySQLConnection")
+        self._cnx_pool: MySQLConnectionPool = pool
+        self._cnx: Optional[MySQLConnectionAbstract] = cnx
+        self._checkout_time: float = time.monotonic()
+
+    async def __aenter__(self) -> PooledMySQLConnection:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        await self.close()
+
+    def __getattr__(self, attr: Any) -> Any:
+        """Calls attributes of the MySQLConnection instance"""
+        return getattr(self._cnx, attr)
+
+    async def close(self) -> None:
+        """Do not close, but adds connection back to pool.
+
+        For a pooled connection, close() does not actually close it but returns it
+        to the pool and makes it available for subsequent connection requests. When
+        the pool resets sessions, the session is reset using `cmd_reset_connection()`,
+        or `reset_session()` when the server does not support it. Calling close()
+        more than once has no effect.
+        """
+        cnx, self._cnx = self._cnx, None
+        if cnx is None:
+            return
+
+        self._cnx_pool._metrics.record(
+            "hold_time", time.monotonic() - self._checkout_time
+        )
+        usable = False
+        try:
+            # Unlike reset_session(), cmd_reset_connection() does not ping the
+            # server first; reset_session() is only needed as a fallback
+            if self._cnx_pool.reset_session and not await cnx.cmd_reset_connection():
+                await cnx.reset_session()
+            usable = True
+        finally:
+            # A connection which could not be reset is validated on next checkout
+            self._cnx_pool._mark_used(cnx, usable)
+            await self._cnx_pool.add_connection(cnx)
+
+    @staticmethod
+    def config(**kwargs: Any) -> NoReturn:
+        """Configuration is done through the pool.
+
+        For pooled connections, the `config()` method raises a `PoolError`
+        exception. Configuration for pooled connections should be done
+        using the pool object.
+        """
+        raise PoolError(
+            "Configuration for pooled connections should be done through the "
+            "pool itself"
+        )
+
+    @property
+    def pool_name(self) -> str:
+        """Returns the name of the connection pool to which the connection belongs."""
+        return self._cnx_pool.pool_name
+
+
+async def _run_pool_maintenance(
+    pool_ref: weakref.ReferenceType[MySQLConnectionPool], interval: float
+) -> None:
+    """Periodically run the health checks of a pool until it is closed
+
+    Only a weak reference to the pool is held between runs so that the task ends
+    once the pool is garbage collected.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        pool = pool_ref()
+        if pool is None or pool.closed:
+            return
+        try:
+            await pool._maintain()
+        except Error:
+            pass  # Retried in the next run
+        del pool
+
+
+class MySQLConnectionPool:
+    """Class defining a pool of asynchronous MySQL connections
+
+    Connections are borrowed with `get_connection()` and given back by closing
+    the returned `PooledMySQLConnection`. The pool is opened, and its background
+    health checks started, by `open()` or when used as an asynchronous context
+    manager:
+
+    ```
+    >>> async with MySQLConnectionPool(pool_name="mypool", **dbconfig) as pool:
+    >>>     async with await pool.get_connection() as cnx:
+    >>>         async with await cnx.cursor() as cur:
+    >>>             await cur.execute("SELECT 1")
+    ```
+    """
+
+    def __init__(
+        self,
+        pool_name: Optional[str] = None,
+        pool_size: int = 5,
+        pool_reset_session: bool = True,
+        pool_acquire_timeout: float = 0,
+        pool_min_size: Optional[int] = None,
+        pool_max_size: Optional[int] = None,
+        pool_max_idle_time: Optional[float] = None,
+        pool_max_lifetime: Optional[float] = None,
+        pool_validation_interval: Optional[float] = 0,
+        pool_health_check_interval: Optional[float] = CNX_POOL_MAINTENANCE_INTERVAL,
+        pool_lazy_prefill: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor.
+
+        Initialize an asynchronous MySQL connection pool. The keyword arguments
+        are the ones of `mysql.connector.pooling.MySQLConnectionPool`, the rest of
+        the keywords arguments, kwargs, are configuration arguments for
+        `mysql.connector.aio.MySQLConnection` instances. No connection is opened
+        before `open()` or `get_connection()` are called.
+
+        Args:
+            pool_name: The pool name. If this argument is not given, Connector/Python
+                       automatically generates the name, composed from whichever of
+                       the host, port, user, and database connection arguments are
+                       given in kwargs, in that order.
+            pool_size:  The pool size. If this argument is not given, the default is 5.
+            pool_reset_session: Whether to reset the session, using
+                                `cmd_reset_connection()` or `reset_session()`,
+                                when the connection is returned to the pool.
+            pool_acquire_timeout: Default number of seconds `get_connection()` waits
+                                  for a connection when the pool is exhausted. If
+                                  this argument is not given, the default is 0 (do
+                                  not wait).
+            pool_min_size: Number of connections kept open by the pool. If this
+                           argument is not given, the default is `pool_size`.
+            pool_max_size: Maximum number of connections opened by the pool. If
+                           this argument is not given, the default is `pool_size`.
+            pool_max_idle_time: Number of seconds after which an idle connection is
+                                closed, as long as `pool_min_size` connections
+                                remain open. If this argument is not given, idle
+                                connections are never closed.
+            pool_max_lifetime: Number of seconds after which a connection is
+                               closed and replaced. If this argument is not given,
+                               connections never expire.
+            pool_validation_interval: Number of seconds a connection must have
+                                      been unused before `get_connection()`
+                                      pings the server to check it is still
+                                      available. If this argument is not given,
+                                      the default is 0 (always ping). When
+                                      `None`, connections are never pinged.
+            pool_health_check_interval: Number of seconds between the background
+                                        health checks, which close idle and
+                                        expired connections, ping the ones idle
+                                        for longer than this interval and open
+                                        the missing ones. When `None`, no health
+                                        check is done.
+            pool_lazy_prefill: Whether `open()` returns as soon as the first
+                               connection is open, the others being opened in
+                               the background. If this argument is not given,
+                               the default is False (wait for all the
+                               connections).
+            **kwargs: Optional additional connection arguments, as described in [1].
+
+        References:
+            [1]: https://dev.mysql.com/doc/connector-python/en/connector-python-connectargs.html
+        """
+        self._pool_size: Optional[int] = None
+        self._pool_min_size: int = 0
+        self._pool_max_size: int = 0
+        self._pool_name: Optional[str] = None
+        self._acquire_timeout: float = 0
+        self._max_idle_time: Optional[float] = None
+        self._max_lifetime: Optional[float] = None
+        self._validation_interval: Optional[float] = 0
+        self._health_check_interval: Optional[float] = None
+        self._reset_session = pool_reset_session
+        self._lazy_prefill = pool_lazy_prefill
+        self._set_pool_size(pool_size)
+        self._set_pool_limits(pool_min_size, pool_max_size)
+        self._set_pool_name(pool_name or generate_pool_name(**kwargs))
+        self._set_acquire_timeout(pool_acquire_timeout)
+        self._set_connection_lifetimes(pool_max_idle_time, pool_max_lifetime)
+        self._set_validation_interval(pool_validation_interval)
+        self._set_health_check_interval(pool_health_check_interval)
+        self._cnx_config: Dict[str, Any] = {}
+        # Idle connections, the most recently returned one is handed out first so
+        # the least used ones can reach pool_max_idle_time
+        self._idle: Deque[MySQLConnectionAbstract] = deque()
+        # Number of connections opened (or being opened) by the pool
+        self._cnx_count: int = 0
+        # Monotonic times at which the pool connections were opened, at which the
+        # idle connections were returned to the pool and at which the connections
+        # were last known to be usable
+        self._cnx_opened_at: Dict[MySQLConnectionAbstract, float] = {}
+        self._cnx_idle_since: Dict[MySQLConnectionAbstract, float] = {}
+        self._cnx_last_used: Dict[MySQLConnectionAbstract, float] = {}
+        self._waiters: Deque[asyncio.Future] = deque()
+        # Number of connections being opened to fill the pool
+        self._cnx_prefilling: int = 0
+        self._config_version = uuid4()
+        self._prefill_task: Optional[asyncio.Future] = None
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._closed: bool = False
+        self._metrics = PoolMetrics()
+
+        if kwargs:
+            self.set_config(**kwargs)
+
+    async def __aenter__(self) -> MySQLConnectionPool:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def pool_name(self) -> str:
+        """Returns the name of the connection pool."""
+        return self._pool_name
+
+    @property
+    def pool_size(self) -> int:
+        """Returns number of connections managed by the pool."""
+        return self._pool_size
+
+    @property
+    def pool_min_size(self) -> int:
+        """Returns number of connections kept open by the pool."""
+        return self._pool_min_size
+
+    @property
+    def pool_max_size(self) -> int:
+        """Returns maximum number of connections opened by the pool."""
+        return self._pool_max_size
+
+    @property
+    def reset_session(self) -> bool:
+        """Returns whether to reset session."""
+        return self._reset_session
+
+    @property
+    def acquire_timeout(self) -> float:
+        """Returns the default number of seconds to wait for a connection."""
+        return self._acquire_timeout
+
+    @property
+    def validation_interval(self) -> Optional[float]:
+        """Returns the idle time after which a connection is pinged on checkout."""
+        return self._validation_interval
+
+    @property
+    def closed(self) -> bool:
+        """Returns whether the pool is closed."""
+        return self._closed
+
+    def set_config(self, **kwargs: Any) -> None:
+        """Set the connection configuration for `MySQLConnection` instances.
+
+        Connections opened with a previous configuration are replaced when they
+        are checked out next.
+
+        Args:
+            **kwargs: Connection arguments - for a complete list of possible
+                      arguments, see [1].
+
+        Raises:
+            PoolError: When a connection argument is not valid, missing
+                       or not supported by `MySQLConnection`.
+
+        References:
+            [1]: https://dev.mysql.com/doc/connector-python/en/connector-python-connectargs.html
+        """
+        if not kwargs:
+            return
+
+        try:
+            MySQLConnection(**kwargs)
+        except (AttributeError, TypeError) as err:
+            raise PoolError(f"Connection configuration not valid: {err}") from err
+        self._cnx_config = kwargs
+        self._config_version = uuid4()
+
+    def _set_pool_size(self, pool_size: int) -> None:
+        """Set the size of the pool
+
+        Raises an AttributeError when the pool_size is not valid. Invalid size
+        is 0, negative or higher than pooling.CNX_POOL_MAXSIZE.
+        """
+        if pool_size <= 0 or pool_size > CNX_POOL_MAXSIZE:
+            raise AttributeError(
+                "Pool size should be higher than 0 and lower or equal to "
+                f"{CNX_POOL_MAXSIZE}"
+            )
+        self._pool_size = pool_size
+
+    def _set_pool_limits(
+        self, pool_min_size: Optional[int], pool_max_size: Optional[int]
+    ) -> None:
+        """Set the minimum and maximum number of connections of the pool
+
+        Both default to the pool size.
+
+        Raises an AttributeError when pool_max_size is not higher than 0, or
+        pool_min_size is negative or higher than pool_max_size.
+        """
+        if pool_max_size is None:
+            pool_max_size = self._pool_size
+        if (
+            not isinstance(pool_max_size, int)
+            or isinstance(pool_max_size, bool)
+            or pool_max_size <= 0
+        ):
+            raise AttributeError("Pool max size should be higher than 0")
+        if pool_min_size is None:
+            pool_min_size = min(self._pool_size, pool_max_size)
+        if (
+            not isinstance(pool_min_size, int)
+            or isinstance(pool_min_size, bool)
+            or not 0 <= pool_min_size <= pool_max_size
+        ):
+            raise AttributeError(
+                "Pool min size should be higher or equal to 0 and lower or equal "
+                f"to the pool max size ({pool_max_size})"
+            )
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+
+    def _set_acquire_timeout(self, acquire_timeout: float) -> None:
+        """Set the default time to wait for a connection when the pool is exhausted.
+
+        Raises an AttributeError when acquire_timeout is not a positive number.
+        """
+        if (
+            not isinstance(acquire_timeout, (int, float))
+            or isinstance(acquire_timeout, bool)
+            or acquire_timeout < 0
+        ):
+            raise AttributeError(
+                "pool_acquire_timeout must be a positive number, "
+                f"found: '{acquire_timeout}'"
+            )
+        self._acquire_timeout = acquire_timeout
+
+    def _set_connection_lifetimes(
+        self, max_idle_time: Optional[float], max_lifetime: Optional[float]
+    ) -> None:
+        """Set the time after which idle and old connections are closed
+
+        Raises an AttributeError when a time is given and is not a positive number.
+        """
+        for name, value in (
+            ("pool_max_idle_time", max_idle_time),
+            ("pool_max_lifetime", max_lifetime),
+        ):
+            if value is not None and (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or value <= 0
+            ):
+                raise AttributeError(
+                    f"{name} must be a number higher than 0, found: '{value}'"
+                )
+        self._max_idle_time = max_idle_time
+        self._max_lifetime = max_lifetime
+
+    def _set_validation_interval(self, validation_interval: Optional[float]) -> None:
+        """Set the idle time after which a connection is pinged on checkout
+
+        Raises an AttributeError when validation_interval is given and is not a
+        positive number.
+        """
+        if validation_interval is not None and (
+            not isinstance(validation_interval, (int, float))
+            or isinstance(validation_interval, bool)
+            or validation_interval < 0
+        ):
+            raise AttributeError(
+                "pool_validation_interval must be a positive number, "
+                f"found: '{validation_interval}'"
+            )
+        self._validation_interval = validation_interval
+
+    def _set_health_check_interval(
+        self, health_check_interval: Optional[float]
+    ) -> None:
+        """Set the time between the background health checks
+
+        Raises an AttributeError when health_check_interval is given and is not a
+        number higher than 0.
+        """
+        if health_check_interval is not None and (
+            not isinstance(health_check_interval, (int, float))
+            or isinstance(health_check_interval, bool)
+            or health_check_interval <= 0
+        ):
+            raise AttributeError(
+                "pool_health_check_interval must be a number higher than 0, "
+                f"found: '{health_check_interval}'"
+            )
+        self._health_check_interval = health_check_interval
+
+    def _set_pool_name(self, pool_name: str) -> None:
+        r"""Set the name of the pool.
+
+        This method checks the validity and sets the name of the pool.
+
+        Raises an AttributeError when pool_name contains illegal characters
+        ([^a-zA-Z0-9._\-*$#]) or is longer than pooling.CNX_POOL_MAXNAMESIZE.
+        """
+        if CNX_POOL_NAMEREGEX.search(pool_name):
+            raise AttributeError(f"Pool name '{pool_name}' contains illegal characters")
+        if len(pool_name) > CNX_POOL_MAXNAMESIZE:
+            raise AttributeError(f"Pool name '{pool_name}' is too long")
+        self._pool_name = pool_name
+
+    async def open(self) -> None:
+        """Open the pool.
+
+        Opens `pool_min_size` connections concurrently and starts the background
+        health checks. With `pool_lazy_prefill`, returns once the first connection
+        is open, the others being opened in the background. Calling open() on an
+        opened pool has no effect.
+
+        Raises:
+            PoolError: When the pool is closed or no configuration is set.
+        """
+        if self._closed:
+            raise PoolError("Connection pool is closed")
+        if not self._cnx_config:
+            raise PoolError("Connection configuration not available")
+
+        missing = max(self._pool_min_size - self._cnx_count, 0)
+        if self._lazy_prefill and missing:
+            await self.add_connection()
+            # Connections failing to open are opened again later, on demand or
+            # by the health checks
+            self._prefill_task = self._prefill(missing - 1)
+        else:
+            for result in await self._prefill(missing):
+                if isinstance(result, BaseException):
+                    raise result
+
+        if self._health_check_interval and self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(
+                _run_pool_maintenance(weakref.ref(self), self._health_check_interval),
+                name=f"{self._pool_name}-maintenance",
+            )
+
+    async def close(self) -> None:
+        """Close the pool.
+
+        Stops the health checks and closes the idle connections. The connections
+        in use are closed when they are returned to the pool, and the coroutines
+        waiting for a connection get a `PoolError`.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        for task in (self._prefill_task, self._maintenance_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+        self._prefill_task = self._maintenance_task = None
+        # Release the slots of the connections cancelled before being opened
+        self._cnx_count -= self._cnx_prefilling
+        self._cnx_prefilling = 0
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(PoolError("Connection pool is closed"))
+
+        closing = list(self._idle)
+        self._idle.clear()
+        for cnx in closing:
+            self._forget_connection(cnx)
+            self._cnx_count -= 1
+        self._metrics.increment("connections_closed", len(closing))
+        await asyncio.gather(*(cnx.close() for cnx in closing))
+
+    def _is_expired(self, cnx: MySQLConnectionAbstract, now: float) -> bool:
+        """Check whether a connection is older than pool_max_lifetime."""
+        return bool(self._max_lifetime) and (
+            now - self._cnx_opened_at.get(cnx, now) > self._max_lifetime
+        )
+
+    def _needs_validation(self, cnx: MySQLConnectionAbstract, now: float) -> bool:
+        """Check whether a connection must be pinged before being handed out
+
+        Connections whose last use is unknown, such as the ones which failed to
+        be reset, are always pinged unless validation is disabled.
+        """
+        if self._validation_interval is None:
+            return False
+        last_used = self._cnx_last_used.get(cnx)
+        return last_used is None or now - last_used >= self._validation_interval
+
+    def _mark_used(self, cnx: MySQLConnectionAbstract, usable: bool) -> None:
+        """Record whether a connection returned to the pool is known to be usable."""
+        if usable:
+            self._cnx_last_used[cnx] = time.monotonic()
+        else:
+            self._cnx_last_used.pop(cnx, None)
+
+    def _serve_waiter(self, cnx: Optional[MySQLConnectionAbstract]) -> bool:
+        """Hand a connection, or a free slot, to the coroutine waiting the longest.
+
+        Returns False when no coroutine is waiting.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(cnx)
+                return True
+        return False
+
+    def _release_slot(self) -> None:
+        """Release the slot of a connection that was closed or could not be opened
+
+        If coroutines are waiting for a connection, the slot is handed to the one
+        waiting the longest which opens a new connection.
+        """
+        if self._closed or not self._serve_waiter(None):
+            self._cnx_count -= 1
+
+    def _forget_connection(self, cnx: MySQLConnectionAbstract) -> None:
+        """Remove the bookkeeping of a connection closed by the pool."""
+        self._cnx_opened_at.pop(cnx, None)
+        self._cnx_idle_since.pop(cnx, None)
+        self._cnx_last_used.pop(cnx, None)
+
+    async def _open_connection(self) -> MySQLConnectionAbstract:
+        """Open a new connection for a slot already reserved in the pool
+
+        The slot is released when the connection can not be opened.
+
+        Raises `PoolError` or any error raised while connecting.
+        """
+        try:
+            if not self._cnx_config:
+                raise PoolError("Connection configuration not available")
+            cnx = MySQLConnection(**self._cnx_config)
+            await cnx.connect()
+        except BaseException:
+            self._release_slot()
+            self._metrics.increment("connections_failed")
+            raise
+
+        self._metrics.increment("connections_created")
+        cnx.pool_config_version = self._config_version
+        self._cnx_opened_at[cnx] = self._cnx_last_used[cnx] = time.monotonic()
+        return cnx
+
+    async def _close_connection(
+        self, cnx: MySQLConnectionAbstract, connected: bool = True
+    ) -> None:
+        """Close a connection removed from the pool
+
+        Connections which are not connected anymore are shut down without
+        sending a `QUIT` command to the server.
+        """
+        self._forget_connection(cnx)
+        self._metrics.increment("connections_closed")
+        if connected:
+            await cnx.close()
+        else:
+            await cnx.shutdown()
+
+    def _queue_connection(self, cnx: MySQLConnectionAbstract) -> None:
+        """Put connection back in the idle connections
+
+        If coroutines are waiting for a connection, it is handed straight to the
+        one waiting the longest instead.
+
+        Raises `PoolError` on errors.
+        """
+        if not isinstance(cnx, MySQLConnectionAbstract):
+            raise PoolError(
+                "Connection instance not subclass of MySQLConnectionAbstract"
+            )
+
+        if self._serve_waiter(cnx):
+            return
+
+        if len(self._idle) >= self._pool_max_size:
+            raise PoolError("Failed adding connection; queue is full")
+        self._idle.append(cnx)
+        self._cnx_idle_since[cnx] = time.monotonic()
+
+    async def add_connection(
+        self, cnx: Optional[MySQLConnectionAbstract] = None
+    ) -> None:
+        """Adds a connection to the pool.
+
+        This method opens a `MySQLConnection` using the configuration passed when
+        initializing the `MySQLConnectionPool` instance or using the `set_config()`
+        method. If cnx is a `MySQLConnection` instance, it is added to the pool.
+        Connections given back to a closed pool are closed.
+
+        Args:
+            cnx: The `MySQLConnectionAbstract` subclass object to be added to
+                 the pool. If this argument is missing (aka `None`), the pool
+                 creates a new connection and adds it.
+
+        Raises:
+            PoolError: When no configuration is set, when no more
+                       connection can be added (maximum reached) or when the connection
+                       can not be instantiated.
+        """
+        if cnx is not None and cnx in self._cnx_opened_at:
+            # A connection of the pool given back
+            if self._closed:
+                self._release_slot()
+                await self._close_connection(cnx)
+            else:
+                self._queue_connection(cnx)
+            return
+
+        if self._closed:
+            raise PoolError("Connection pool is closed")
+        if not self._cnx_config:
+            raise PoolError("Connection configuration not available")
+        if self._cnx_count >= self._pool_max_size:
+            raise PoolError("Failed adding connection; queue is full")
+        if cnx is not None and not isinstance(cnx, MySQLConnectionAbstract):
+            raise PoolError(
+                "Connection instance not subclass of MySQLConnectionAbstract"
+            )
+        self._cnx_count += 1
+
+        if not cnx:
+            cnx = await self._open_connection()
+
+        self._cnx_opened_at.setdefault(cnx, time.monotonic())
+        self._queue_connection(cnx)
+
+    async def _prefill_connection(self) -> None:
+        """Open a connection for a slot reserved by _prefill() and queue it."""
+        try:
+            cnx = await self._open_connection()
+        finally:
+            self._cnx_prefilling -= 1
+        if self._closed:
+            self._release_slot()
+            await self._close_connection(cnx)
+        else:
+            self._queue_connection(cnx)
+
+    def _prefill(self, count: int) -> asyncio.Future:
+        """Start opening `count` connections concurrently to add them to the pool
+
+        The slots of the connections are reserved at once, and coroutines calling
+        get_connection() meanwhile wait for the connections being opened.
+
+        Returns a future of the outcome of each connection, the errors raised
+        while connecting being returned rather than raised.
+        """
+        count = max(min(count, self._pool_max_size - self._cnx_count), 0)
+        self._cnx_count += count
+        self._cnx_prefilling += count
+        return asyncio.gather(
+            *(self._prefill_connection() for _ in range(count)),
+            return_exceptions=True,
+        )
+
+    async def _acquire_connection(
+        self, timeout: float
+    ) -> Optional[MySQLConnectionAbstract]:
+        """Take an idle connection out of the pool.
+
+        When there is no idle connection but the pool has not reached its
+        maximum size, a slot is reserved and `None` is returned: the caller must
+        open a new connection. Otherwise, wait up to `timeout` seconds for a
+        connection to be returned. While the pool is being filled, coroutines
+        also wait, whatever the timeout, for the connections being opened.
+        Waiting coroutines are served in FIFO order.
+
+        Raises `PoolError` when no connection is available in time.
+        """
+        if not self._waiters:
+            if self._idle:
+                cnx = self._idle.pop()
+                self._cnx_idle_since.pop(cnx, None)
+                return cnx
+
+            if self._cnx_config and self._cnx_count < self._pool_max_size:
+                self._cnx_count += 1
+                return None
+
+        # Each connection being opened will serve one of the waiting coroutines
+        prefilling = len(self._waiters) < self._cnx_prefilling
+        if timeout <= 0 and not prefilling:
+            raise PoolError("Failed getting connection; pool exhausted")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait((waiter,), timeout=None if prefilling else timeout)
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # Served while being cancelled, give the connection or slot back
+                cnx = waiter.result()
+                if cnx is None:
+                    self._release_slot()
+                else:
+                    self._queue_connection(cnx)
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+
+        if waiter.cancelled():
+            raise PoolError(
+                f"Failed getting connection; pool exhausted (waited {timeout}s)"
+            )
+        return waiter.result()
+
+    async def get_connection(
+        self, timeout: Optional[float] = None
+    ) -> PooledMySQLConnection:
+        """Gets a connection from the pool.
+
+        This method returns a PooledMySQLConnection instance which has a reference
+        to the pool that created it, and the next available MySQL connection.
+
+        When there is no idle connection, a new one is opened as long as the pool
+        has less than `pool_max_size` connections. Otherwise, the calling coroutine
+        waits until a connection is returned to the pool or `timeout` expires.
+        Connections are handed out to the waiting coroutines in the order they
+        called this method.
+
+        When the MySQL connection is older than `pool_max_lifetime`, was opened
+        with a previous configuration, or was not used for
+        `pool_validation_interval` seconds and is not connected anymore, it is
+        replaced by a new connection.
+
+        Args:
+            timeout: Number of seconds to wait for a connection when the pool is
+                     exhausted. If this argument is not given, the pool's
+                     `pool_acquire_timeout` is used.
+
+        Returns:
+            A `PooledMySQLConnection` instance.
+
+        Raises:
+            PoolError: On errors, or when no connection is available in time.
+        """
+        if self._closed:
+            raise PoolError("Connection pool is closed")
+        if timeout is None:
+            timeout = self._acquire_timeout
+
+        started = time.monotonic()
+        try:
+            cnx = await self._acquire_connection(timeout)
+        except PoolError:
+            if not self._closed:
+                self._metrics.increment("checkout_timeouts")
+            raise
+        if cnx is None:
+            return self._checkout(await self._open_connection(), started)
+
+        now = time.monotonic()
+        stale = self._config_version != cnx.pool_config_version or self._is_expired(
+            cnx, now
+        )
+        try:
+            if not stale and (
+                not self._needs_validation(cnx, now) or await cnx.is_connected()
+            ):
+                self._cnx_last_used[cnx] = now
+                return self._checkout(cnx, started)
+            # The connection is replaced by a new one in the same slot
+            await self._close_connection(cnx, connected=stale)
+        except BaseException:
+            if cnx in self._cnx_opened_at:
+                self._forget_connection(cnx)
+                self._metrics.increment("connections_closed")
+            self._release_slot()
+            await cnx.shutdown()
+            raise
+
+        return self._checkout(await self._open_connection(), started)
+
+    def _checkout(
+        self, cnx: MySQLConnectionAbstract, started: float
+    ) -> PooledMySQLConnection:
+        """Hand out a connection, recording the time spent getting it."""
+        pcnx = PooledMySQLConnection(self, cnx)
+        self._metrics.increment("checkouts")
+        self._metrics.record("wait_time", pcnx._checkout_time - started)
+        return pcnx
+
+    def get_metrics(self) -> PoolMetricsType:
+        """Returns a snapshot of the metrics of the pool.
+
+        Besides the counters and histograms described in
+        `mysql.connector.pooling.PoolMetrics`, the snapshot holds the number of
+        connections opened by the pool (`size`), the idle ones (`idle`), the ones
+        handed out (`in_use`), the number of coroutines waiting for a connection
+        (`waiting`) and `max_size`.
+
+        Returns:
+            A dictionary of metrics, see `mysql.connector.types.PoolMetricsType`.
+        """
+        metrics = self._metrics.snapshot()
+        metrics.update(
+            size=self._cnx_count,
+            idle=len(self._idle),
+            in_use=self._cnx_count - len(self._idle),
+            waiting=len(self._waiters),
+            max_size=self._pool_max_size,
+        )
+        return metrics
+
+    async def _maintain(self) -> None:
+        """Run the health checks of the pool
+
+        Idle connections older than pool_max_lifetime are closed, as are the ones
+        idle for longer than pool_max_idle_time as long as pool_min_size
+        connections remain. The other idle connections unused for longer than the
+        health check interval are pinged, and closed when not connected anymore.
+        New connections are then opened up to pool_min_size.
+        """
+        if self._closed:
+            return
+
+        now = time.monotonic()
+        closing: List[MySQLConnectionAbstract] = []
+        checking: List[MySQLConnectionAbstract] = []
+        keep: Deque[MySQLConnectionAbstract] = deque()
+        # Go through the connections from the least recently used one
+        for cnx in self._idle:
+            last_used = self._cnx_last_used.get(cnx)
+            if self._is_expired(cnx, now) or (
+                self._max_idle_time
+                and now - self._cnx_idle_since.get(cnx, now) > self._max_idle_time
+                and self._cnx_count - len(closing) > self._pool_min_size
+            ):
+                closing.append(cnx)
+            elif self._health_check_interval and (
+                last_used is None or now - last_used >= self._health_check_interval
+            ):
+                checking.append(cnx)
+            else:
+                keep.append(cnx)
+        self._idle = keep
+        for cnx in closing:
+            self._forget_connection(cnx)
+            self._cnx_count -= 1
+        self._metrics.increment("connections_closed", len(closing))
+        await asyncio.gather(*(cnx.close() for cnx in closing))
+
+        # Connections being pinged are out of the pool so they are not handed out
+        connected = await asyncio.gather(*(cnx.is_connected() for cnx in checking))
+        now = time.monotonic()
+        for cnx, is_connected in zip(reversed(checking), reversed(connected)):
+            if not is_connected or self._closed:
+                self._release_slot()
+                await self._close_connection(cnx, connected=is_connected)
+                continue
+            self._cnx_last_used[cnx] = now
+            if self._serve_waiter(cnx):
+                self._cnx_idle_since.pop(cnx, None)
+            else:
+                # Back in front of the idle connections, with its idle time kept
+                self._idle.appendleft(cnx)
+
+        missing = 0
+        if self._cnx_config and not self._closed:
+            missing = max(self._pool_min_size - self._cnx_count, 0)
+            self._cnx_count += missing
+        results = await asyncio.gather(
+            *(self._open_connection() for _ in range(missing)), return_exceptions=True
+        )
+        for cnx in results:
+            if isinstance(cnx, BaseException):
+                continue  # Retried in the next run, the slot was released
+            if self._closed:
+                self._release_slot()
+                await self._close_connection(cnx)
+            else:
+                self._queue_connection(cnx)
@@ -34,7 +34,7 @@ import struct
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..constants import ClientFlag, ServerCmd
+from ..constants import DEFAULT_ZSTD_COMPRESSION_LEVEL, ClientFlag, ServerCmd
 from ..errors import InterfaceError, ProgrammingError, get_exception
 from ..logger import logger
 from ..protocol import (
@@ -136,6 +136,7 @@ class MySQLProtocol(_MySQLProtocol):
         is_change_user_request: bool = False,
         ssl_enabled: bool = False,
         plugin_config: Optional[Dict[str, Any]] = None,
+        zstd_compression_level: int = DEFAULT_ZSTD_COMPRESSION_LEVEL,
     ) -> Tuple[bytes, MySQLAuthPlugin]:
         """Make a MySQL Authentication packet.
 
@@ -156,6 +157,8 @@ class MySQLProtocol(_MySQLProtocol):
             plugin_config: Custom configuration to be passed to the auth plugin
                            when invoked. The parameters defined here will override
                            the one defined in the auth plugin itself.
+            zstd_compression_level: Compression level sent to the server when the
+                                    zstd compression algorithm is negotiated.
 
         Returns:
             handshake_response: Handshake response as per [1].
@@ -242,6 +245,10 @@ class MySQLProtocol(_MySQLProtocol):
         if (client_flags & ClientFlag.CONNECT_ARGS) and conn_attrs is not None:
             response_payload.append(MySQLProtocol.make_conn_attrs(conn_attrs))
 
+        # zstd compression level
+        if client_flags & ClientFlag.ZSTD_COMPRESSION_ALGORITHM:
+            response_payload.append(int1store(zstd_compression_level))
+
         return b"".join(response_payload), auth_strategy
 
     # pylint: disable=invalid-overridden-method
@@ -259,6 +266,7 @@ class MySQLProtocol(_MySQLProtocol):
         rows = []
         eof = None
         values = None
+        decode_row = self._get_binary_row_decoder(columns, charset)
         i = 0
         while True:
             if eof or i == count:
@@ -269,7 +277,7 @@ class MySQLProtocol(_MySQLProtocol):
                 values = None
             elif packet[4] == 0:
                 eof = None
-                values = self._parse_binary_values(columns, packet[5:], charset)
+                values = decode_row(packet, 5)
             if eof is None and values is not None:
                 rows.append(values)
             elif eof is None and values is None:
@@ -299,19 +307,22 @@ class MySQLProtocol(_MySQLProtocol):
                 break
             packet = await sock.read()
             if packet.startswith(b"\xff\xff\xff"):
-                datas = [packet[4:]]
+                # Append the payloads to one buffer, without intermediate slices
+                datas = bytearray(memoryview(packet)[4:])
                 packet = await sock.read()
                 while packet.startswith(b"\xff\xff\xff"):
-                    datas.append(packet[4:])
+                    datas += memoryview(packet)[4:]
                     packet = await sock.read()
-                datas.append(packet[4:])
-                rowdata = read_lc_string_list(bytearray(b"").join(datas))
-            elif packet[4] == 254 and packet[0] < 7:
+                datas += memoryview(packet)[4:]
+                rowdata = read_lc_string_list(datas)
+            elif packet[4] == 254:
+                # EOF, or OK when CLIENT_DEPRECATE_EOF is set; a row starting
+                # with 0xFE spans multiple packets and is handled above
                 eof = self.parse_eof(packet)
                 rowdata = None
             else:
                 eof = None
-                rowdata = read_lc_string_list(packet[4:])
+                rowdata = read_lc_string_list(packet, 4)
             if eof is None and rowdata is not None:
                 rows.append(rowdata)
             elif eof is None and rowdata is None:
@@ -33,6 +33,7 @@ import copy
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from .constants import DEFAULT_ZSTD_COMPRESSION_LEVEL
 from .errors import InterfaceError, NotSupportedError, get_exception
 from .logger import logger
 from .plugins import MySQLAuthPlugin, get_auth_plugin
@@ -302,6 +303,7 @@ class MySQLAuthenticator:
         auth_plugin_class: Optional[str] = None,
         conn_attrs: Optional[Dict[str, str]] = None,
         is_change_user_request: bool = False,
+        zstd_compression_level: int = DEFAULT_ZSTD_COMPRESSION_LEVEL,
         **plugin_config: Any,
     ) -> bytes:
         """Performs the authentication phase.
@@ -324,6 +326,8 @@ class MySQLAuthenticator:
                                than the authorization plugin name).
             conn_attrs: Connection attributes.
             is_change_user_request: Whether is a `change user request` operation or not.
+            zstd_compression_level: Compression level sent to the server when the
+                                    zstd compression algorithm is negotiated.
             plugin_config: Custom configuration to be passed to the auth plugin
                            when invoked. The parameters defined here will override the
                            ones defined in the auth plugin itself.
@@ -359,6 +363,7 @@ class MySQLAuthenticator:
             is_change_user_request=is_change_user_request,
             ssl_enabled=self.ssl_enabled,
             plugin_config=self.plugin_config,
+            zstd_compression_level=zstd_compression_level,
         )
 
         # client sends transaction response
@@ -45,8 +45,10 @@ from typing import (
     TYPE_CHECKING,
     Any,
     BinaryIO,
+    Callable,
     Dict,
     Generator,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -60,11 +62,14 @@ from . import version
 from .abstracts import MySQLConnectionAbstract
 from .authentication import MySQLAuthenticator, get_auth_plugin
 from .constants import (
+    RE_SQL_SET_SESSION_TRACK,
     ClientFlag,
+    CursorType,
     FieldType,
     RefreshOption,
     ServerCmd,
     ServerFlag,
+    SessionTrackType,
     flag_is_set,
 )
 from .conversion import MySQLConverter
@@ -94,7 +99,7 @@ from .errors import (
     get_exception,
 )
 from .logger import logger
-from .network import MySQLSocket, MySQLTCPSocket, MySQLUnixSocket
+from .network import MySQLSocket, MySQLTCPSocket, MySQLUnixSocket, negotiate_compression
 from .opentelemetry.constants import OTEL_ENABLED
 from .opentelemetry.context_propagation import with_context_propagation
 from .protocol import MySQLProtocol
@@ -154,6 +159,9 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._have_next_result: bool = False
         self._raw: bool = False
         self._in_transaction: bool = False
+        self._session_state: Dict[str, Any] = {}
+        self._stmt_bound_types: Dict[int, bytes] = {}
+        self._local_infile_source: Optional[Tuple[str, BinaryIO]] = None
 
         self._prepared_statements: Any = None
 
@@ -164,6 +172,9 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._query_attrs_supported: int = False
 
         self._columns_desc: List[DescriptionType] = []
+        self._row_decoder: Optional[
+            Callable[[Tuple[Optional[bytes], ...]], Tuple[Any, ...]]
+        ] = None
         self._mfa_nfactor: int = 1
 
         self._authenticator: MySQLAuthenticator = MySQLAuthenticator()
@@ -240,6 +251,24 @@ class MySQLConnection(MySQLConnectionAbstract):
         if handshake["capabilities"] & ClientFlag.MULTI_FACTOR_AUTHENTICATION:
             self.set_client_flags([ClientFlag.MULTI_FACTOR_AUTHENTICATION])
 
+        if handshake["capabilities"] & ClientFlag.DEPRECATE_EOF:
+            self.set_client_flags([ClientFlag.DEPRECATE_EOF])
+        else:
+            self._client_flags &= ~ClientFlag.DEPRECATE_EOF
+
+        if handshake["capabilities"] & ClientFlag.SESSION_TRACK:
+            self.set_client_flags([ClientFlag.SESSION_TRACK])
+        else:
+            self._client_flags &= ~ClientFlag.SESSION_TRACK
+
+        self._compression_algorithm, compression_flag = negotiate_compression(
+            self._compression_algorithms, self._compress, handshake["capabilities"]
+        )
+        self._client_flags &= ~(
+            ClientFlag.COMPRESS | ClientFlag.ZSTD_COMPRESSION_ALGORITHM
+        )
+        self._client_flags |= compression_flag
+
         self._handshake = handshake
 
     def _do_auth(
@@ -307,6 +336,7 @@ class MySQLConnection(MySQLConnectionAbstract):
             oci_config_profile=self._oci_config_profile,
             webauthn_callback=self._webauthn_callback,
             fido_callback=self._fido_callback,
+            zstd_compression_level=self._zstd_compression_level,
         )
         self._handle_ok(ok_pkt)
 
@@ -349,6 +379,10 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         self._protocol = MySQLProtocol()
         self._socket = self._get_connection()
+        self._session_state = {}
+        self._stmt_bound_types = {}
+        if self._prepared_statements is not None:
+            self._prepared_statements.clear()
         try:
             self._socket.open_connection()
 
@@ -367,9 +401,14 @@ class MySQLConnection(MySQLConnectionAbstract):
             )
             self.set_converter_class(self._converter_class)
 
-            if self._client_flags & ClientFlag.COMPRESS:
+            if self._compression_algorithm:
                 # update the network layer accordingly
-                self._socket.switch_to_compressed_mode()
+                self._socket.switch_to_compressed_mode(
+                    self._compression_algorithm, self._zstd_compression_level
+                )
+            elif self._read_buffer_size:
+                # read packets through a read-ahead buffer
+                self._socket.switch_to_buffered_mode(self._read_buffer_size)
 
             self._socket.set_connection_timeout(None)
         except Exception:
@@ -516,6 +555,53 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         self._have_next_result = flag_is_set(ServerFlag.MORE_RESULTS_EXISTS, flags)
         self._in_transaction = flag_is_set(ServerFlag.STATUS_IN_TRANS, flags)
+        self._session_state["autocommit"] = flag_is_set(
+            ServerFlag.STATUS_AUTOCOMMIT, flags
+        )
+
+    def _reset_session_state(self) -> None:
+        """Forget the session state served from the session state trackers
+
+        autocommit is kept, it is taken from the server status flags.
+        """
+        self._session_state = {"autocommit": self._session_state.get("autocommit")}
+
+    def _check_session_track(self, statements: bytes) -> None:
+        """Forget the session state when statements reconfigure the trackers
+
+        Changes of the session_track_* variables are only reported when they
+        are tracked themselves.
+        """
+        if len(self._session_state) > 1 and RE_SQL_SET_SESSION_TRACK.match(statements):
+            self._reset_session_state()
+
+    def _handle_session_track(self, packet: OkPacketType) -> None:
+        """Handle the session state information found in MySQL OK packets
+
+        This method keeps the session state cache up to date using the
+        changes reported by the server when CLIENT_SESSION_TRACK is set.
+        The current database and the tracked system variables are then
+        served from the cache instead of querying the server.
+        """
+        if flag_is_set(ServerFlag.STATUS_DB_DROPPED, packet.get("status_flag", 0)):
+            self._session_state.pop("database", None)
+        session_track: List[Tuple[int, Any]] = packet.get(  # type: ignore[assignment]
+            "session_track", []
+        )
+        for track_type, value in session_track:
+            if track_type == SessionTrackType.SCHEMA:
+                self._session_state["database"] = value or None
+                if self._prepared_statements is not None:
+                    # Statements keep using the database they were prepared in
+                    self._prepared_statements.invalidate()
+            elif track_type == SessionTrackType.SYSTEM_VARIABLES:
+                name, value = value
+                if name.startswith("session_track_"):
+                    # Tracking was reconfigured, cached values can't be trusted
+                    self._reset_session_state()
+                elif name != "autocommit":
+                    # autocommit is taken from the server status flags
+                    self._session_state[name] = value
 
     @property
     def in_transaction(self) -> bool:
@@ -534,6 +620,7 @@ class MySQLConnection(MySQLConnectionAbstract):
         if packet[4] == 0:
             ok_pkt = self._protocol.parse_ok(packet)
             self._handle_server_status(ok_pkt["status_flag"])
+            self._handle_session_track(ok_pkt)
             return ok_pkt
         if packet[4] == 255:
             raise get_exception(packet)
@@ -551,13 +638,35 @@ class MySQLConnection(MySQLConnectionAbstract):
         if packet[4] == 254:
             eof = self._protocol.parse_eof(packet)
             self._handle_server_status(eof["status_flag"])
+            self._handle_session_track(eof)
             return eof
         if packet[4] == 255:
             raise get_exception(packet)
         raise InterfaceError("Expected EOF packet")
 
+    def _is_cursor_status(self, packet: bytes) -> bool:
+        """Check whether a packet is the EOF packet reporting an open cursor
+
+        Rows of a binary result set have a 0x00 header, the EOF (or OK)
+        packet has a 0xFE header and is never split in several packets.
+
+        Returns True or False.
+        """
+        if packet[4] != 254 or packet.startswith(b"\xff\xff\xff"):
+            return False
+        eof = self._protocol.parse_eof(packet)
+        return flag_is_set(ServerFlag.STATUS_CURSOR_EXISTS, eof["status_flag"])
+
     def _handle_load_data_infile(self, filename: str) -> OkPacketType:
         """Handle a LOAD DATA INFILE LOCAL request"""
+        if (
+            self._local_infile_source is not None
+            and filename == self._local_infile_source[0]
+        ):
+            # Rows sent by the cursor's load_rows(), not read from the file system
+            return self._handle_ok(
+                self._send_data(self._local_infile_source[1], send_empty_packet=True)
+            )
         file_name = os.path.abspath(filename)
         if os.path.islink(file_name):
             raise OperationalError("Use of symbolic link is not allowed")
@@ -638,12 +747,15 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._columns_desc = [
             None,
         ] * column_count
+        self._row_decoder = None
         for i in range(0, column_count):
             self._columns_desc[i] = self._protocol.parse_column(
                 self._socket.recv(), self.python_charset
             )
 
-        eof = self._handle_eof(self._socket.recv())
+        eof: EofPacketType = {}
+        if not self._client_flags & ClientFlag.DEPRECATE_EOF:
+            eof = self._handle_eof(self._socket.recv())
         self.unread_result = True
         return {"columns": self._columns_desc, "eof": eof}
 
@@ -714,8 +826,12 @@ class MySQLConnection(MySQLConnectionAbstract):
             and rows
             and hasattr(self, "converter")
         ):
-            row_to_python = self.converter.row_to_python
-            rows = [row_to_python(row, self._columns_desc) for row in rows]
+            if self._row_decoder is None:
+                # Built once per result set, get_rows() is called for each row
+                # by unbuffered cursors
+                self._row_decoder = self.converter.make_row_decoder(self._columns_desc)
+            decode_row = self._row_decoder
+            rows = [decode_row(row) for row in rows]
 
         if eof_p is not None:
             self._handle_server_status(
@@ -723,6 +839,7 @@ class MySQLConnection(MySQLConnectionAbstract):
                 if "status_flag" in eof_p
                 else eof_p["server_status"]
             )
+            self._handle_session_track(eof_p)
             self.unread_result = False
 
         return rows, eof_p
@@ -731,6 +848,8 @@ class MySQLConnection(MySQLConnectionAbstract):
         """Consume results"""
         if self.unread_result:
             self.get_rows()
+            if self._prepared_statements is not None:
+                self._prepared_statements.unpin_unread_result()
 
     def cmd_init_db(self, database: str) -> OkPacketType:
         """Change the current database
@@ -741,9 +860,12 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         Returns a dict()
         """
-        return self._handle_ok(
+        ok_pkt = self._handle_ok(
             self._send_cmd(ServerCmd.INIT_DB, database.encode("utf-8"))
         )
+        if self._prepared_statements is not None:
+            self._prepared_statements.invalidate()
+        return ok_pkt
 
     @with_context_propagation
     def cmd_query(
@@ -771,6 +893,7 @@ class MySQLConnection(MySQLConnectionAbstract):
             if isinstance(query, str):
                 query = query.encode("utf-8")
             query = bytearray(query)
+        self._check_session_track(query)
         # Prepare query attrs
         charset = self.charset if self.charset != "utf8mb4" else "utf8"
         packet = bytearray()
@@ -892,6 +1015,7 @@ class MySQLConnection(MySQLConnectionAbstract):
             if isinstance(statements, str):
                 statements = statements.encode("utf8")
             statements = bytearray(statements)
+        self._check_session_track(statements)
 
         if self._client_flags & ClientFlag.CLIENT_QUERY_ATTRIBUTES:
             # int<lenenc>    parameter_count    Number of parameters
@@ -1061,6 +1185,11 @@ class MySQLConnection(MySQLConnectionAbstract):
             self._oci_config_file = oci_config_file
 
         self._oci_config_profile = oci_config_profile
+        self._session_state = {}
+        self._stmt_bound_types = {}
+        if self._prepared_statements is not None:
+            # The server deallocates the prepared statements on change user
+            self._prepared_statements.clear()
 
         ok_pkt = self._authenticator.authenticate(
             sock=self._socket,
@@ -1094,14 +1223,75 @@ class MySQLConnection(MySQLConnectionAbstract):
 
     @property
     def database(self) -> str:
-        """Get the current database"""
-        return self.info_query("SELECT DATABASE()")[0]  # type: ignore[return-value]
+        """Get the current database
+
+        The value is served from the session state cache when the server
+        tracks changes of the current database.
+        """
+        if "database" in self._session_state:
+            return self._session_state["database"]
+        if not self._client_flags & ClientFlag.SESSION_TRACK:
+            return self.info_query("SELECT DATABASE()")[0]  # type: ignore[return-value]
+        database, tracked = self.info_query(
+            "SELECT DATABASE(), @@session.session_track_schema"
+        )
+        if tracked == 1:
+            self._session_state["database"] = database
+        return database  # type: ignore[return-value]
 
     @database.setter
     def database(self, value: str) -> None:
         """Set the current database"""
         self.cmd_init_db(value)
 
+    @property
+    def autocommit(self) -> bool:
+        """Get whether autocommit is on or off
+
+        The value is taken from the server status flags sent with every OK
+        and EOF packet.
+        """
+        value = self._session_state.get("autocommit")
+        if value is None:
+            value = self.info_query("SELECT @@session.autocommit")[0] == 1
+        return value
+
+    @autocommit.setter
+    def autocommit(self, value: bool) -> None:
+        """Toggle autocommit"""
+        switch = "ON" if value else "OFF"
+        self.cmd_query(f"SET @@session.autocommit = {switch}")
+        self._autocommit = value
+
+    @property
+    def time_zone(self) -> str:
+        """Get the current time zone
+
+        The value is served from the session state cache when the server
+        tracks changes of the time_zone system variable.
+        """
+        if "time_zone" in self._session_state:
+            return self._session_state["time_zone"]
+        if not self._client_flags & ClientFlag.SESSION_TRACK:
+            return self.info_query(  # type: ignore[return-value]
+                "SELECT @@session.time_zone"
+            )[0]
+        time_zone, tracked = self.info_query(
+            "SELECT @@session.time_zone, @@session.session_track_system_variables"
+        )
+        if isinstance(tracked, str) and (
+            tracked == "*"
+            or "time_zone" in [name.strip() for name in tracked.split(",")]
+        ):
+            self._session_state["time_zone"] = time_zone
+        return time_zone  # type: ignore[return-value]
+
+    @time_zone.setter
+    def time_zone(self, value: str) -> None:
+        """Set the time zone"""
+        self.cmd_query(f"SET @@session.time_zone = '{value}'")
+        self._time_zone = value
+
     def is_connected(self) -> bool:
         """Reports whether the connection to MySQL Server is available
 
@@ -1209,6 +1399,7 @@ class MySQLConnection(MySQLConnectionAbstract):
         cursor_class: Optional[Type[MySQLCursor]] = None,  # type: ignore[override]
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        fetch_size: Optional[int] = None,
     ) -> MySQLCursor:
         """Instantiates and returns a cursor
 
@@ -1224,6 +1415,9 @@ class MySQLConnection(MySQLConnectionAbstract):
         cursor_class parameter, but it needs to be a subclass of
         mysql.connector.cursor.CursorBase.
 
+        Prepared cursors given a fetch_size open a read-only cursor on the
+        server and fetch the rows in batches of fetch_size rows.
+
         Raises ProgrammingError when cursor_class is not a subclass of
         CursorBase. Raises ValueError when cursor is not available.
 
@@ -1238,6 +1432,10 @@ class MySQLConnection(MySQLConnectionAbstract):
                 raise ProgrammingError(
                     "Cursor class needs be to subclass of cursor.CursorBase"
                 )
+            if fetch_size is not None:
+                if not issubclass(cursor_class, MySQLCursorPrepared):
+                    raise ValueError("fetch_size requires a prepared cursor")
+                return (cursor_class)(self, fetch_size=fetch_size)
             return (cursor_class)(self)
 
         buffered = buffered if buffered is not None else self._buffered
@@ -1269,7 +1467,11 @@ class MySQLConnection(MySQLConnectionAbstract):
             20: MySQLCursorPreparedDict,
             24: MySQLCursorPreparedNamedTuple,
         }
+        if fetch_size is not None and not prepared:
+            raise ValueError("fetch_size requires a prepared cursor")
         try:
+            if fetch_size is not None:
+                return (types[cursor_type])(self, fetch_size=fetch_size)
             return (types[cursor_type])(self)
         except KeyError:
             args = ("buffered", "raw", "dictionary", "named_tuple", "prepared")
@@ -1359,7 +1561,9 @@ class MySQLConnection(MySQLConnectionAbstract):
                 self._socket.recv(), self.python_charset
             )
 
-        eof = self._handle_eof(self._socket.recv())
+        eof: EofPacketType = {}
+        if not self._client_flags & ClientFlag.DEPRECATE_EOF:
+            eof = self._handle_eof(self._socket.recv())
         return (column_count, columns, eof)
 
     def cmd_stmt_fetch(self, statement_id: int, rows: int = 1) -> None:
@@ -1373,6 +1577,34 @@ class MySQLConnection(MySQLConnectionAbstract):
         self._send_cmd(ServerCmd.STMT_FETCH, packet, expect_response=False)
         self.unread_result = True
 
+    def get_prepared_statement(
+        self, statement: bytes
+    ) -> Mapping[str, Union[int, List[DescriptionType]]]:
+        """Get a prepared statement using the prepared statement cache
+
+        The statement is served from the cache when possible, otherwise it
+        is prepared and added to the cache. A statement pinned by a cursor
+        reading its result is not shared: it is prepared again, and the new
+        statement replaces it in the cache. Statements evicted from the cache
+        or invalidated are deallocated on the server once they are no longer
+        pinned. Without cache, this method is the same as cmd_stmt_prepare().
+
+        Returns a dict()
+        """
+        cache = self._prepared_statements
+        if cache is None:
+            return self.cmd_stmt_prepare(statement)
+
+        for stale in cache.pop_stale():
+            self.cmd_stmt_close(stale["statement_id"])
+
+        prepared = cache.get(statement)
+        if prepared is None:
+            prepared = self.cmd_stmt_prepare(statement)
+            for evicted in cache.put(statement, prepared):
+                self.cmd_stmt_close(evicted["statement_id"])
+        return prepared
+
     def cmd_stmt_prepare(
         self, statement: bytes
     ) -> Mapping[str, Union[int, List[DescriptionType]]]:
@@ -1395,7 +1627,8 @@ class MySQLConnection(MySQLConnectionAbstract):
                         self._socket.recv(), self.python_charset
                     )
                 )
-            self._handle_eof(self._socket.recv())
+            if not self._client_flags & ClientFlag.DEPRECATE_EOF:
+                self._handle_eof(self._socket.recv())
         if result["num_columns"] > 0:
             for _ in range(0, result["num_columns"]):
                 result["columns"].append(
@@ -1403,14 +1636,47 @@ class MySQLConnection(MySQLConnectionAbstract):
                         self._socket.recv(), self.python_charset
                     )
                 )
-            self._handle_eof(self._socket.recv())
+            if not self._client_flags & ClientFlag.DEPRECATE_EOF:
+                self._handle_eof(self._socket.recv())
 
         return result
 
     @with_context_propagation
-    def cmd_stmt_execute(
+    def _make_stmt_execute(
         self,
         statement_id: int,
+        data: Sequence[BinaryProtocolType],
+        parameters: Sequence,
+        flags: int,
+        long_data_used: Dict[int, Tuple[bool]],
+    ) -> bytes:
+        """Make the COM_STMT_EXECUTE packet of a prepared statement"""
+        if self._client_flags & ClientFlag.CLIENT_QUERY_ATTRIBUTES:
+            return self._protocol.make_stmt_execute(
+                statement_id,
+                data,
+                tuple(parameters),
+                flags,
+                long_data_used,
+                self.charset,
+                self.query_attrs,
+                self._converter_str_fallback,
+                self._stmt_bound_types,
+            )
+        return self._protocol.make_stmt_execute(
+            statement_id,
+            data,
+            tuple(parameters),
+            flags,
+            long_data_used,
+            self.charset,
+            converter_str_fallback=self._converter_str_fallback,
+            bound_types=self._stmt_bound_types,
+        )
+
+    def cmd_stmt_execute(
+        self,
+        statement_id: int,  # type: ignore[override]
         data: Sequence[BinaryProtocolType] = (),
         parameters: Sequence = (),
         flags: int = 0,
@@ -1434,31 +1700,117 @@ class MySQLConnection(MySQLConnectionAbstract):
                 "This version of the server does not support Query Attributes",
                 category=Warning,
             )
-        if self._client_flags & ClientFlag.CLIENT_QUERY_ATTRIBUTES:
-            execute_packet = self._protocol.make_stmt_execute(
-                statement_id,
-                data,
-                tuple(parameters),
-                flags,
-                long_data_used,
-                self.charset,
-                self.query_attrs,
-                self._converter_str_fallback,
-            )
-        else:
-            execute_packet = self._protocol.make_stmt_execute(
-                statement_id,
-                data,
-                tuple(parameters),
-                flags,
-                long_data_used,
-                self.charset,
-                converter_str_fallback=self._converter_str_fallback,
-            )
-        packet = self._send_cmd(ServerCmd.STMT_EXECUTE, packet=execute_packet)
-        result = self._handle_binary_result(packet)
+        execute_packet = self._make_stmt_execute(
+            statement_id, data, parameters, flags, long_data_used
+        )
+        try:
+            packet = self._send_cmd(ServerCmd.STMT_EXECUTE, packet=execute_packet)
+            result = self._handle_binary_result(packet)
+            if (
+                flags & CursorType.READ_ONLY
+                and isinstance(result, tuple)
+                and self._client_flags & ClientFlag.DEPRECATE_EOF
+            ):
+                # An open cursor is reported after the metadata, even when
+                # the EOF packets are deprecated. Without a cursor, the rows
+                # or the end of the result set follow and are read later.
+                packet = self._socket.recv()
+                if self._is_cursor_status(packet):
+                    result = (result[0], result[1], self._handle_eof(packet))
+                else:
+                    self._socket.unread(packet)
+        except Error:
+            # The server might not have bound the types, send them next time
+            self._stmt_bound_types.pop(statement_id, None)
+            raise
         return result
 
+    def cmd_stmt_execute_pipelined(
+        self,
+        statement_id: int,
+        seq_data: Iterable[Sequence[BinaryProtocolType]],
+        parameters: Sequence = (),
+        window: int = 128,
+    ) -> List[Union[OkPacketType, Error]]:
+        """Execute a prepared MySQL statement once for each set of data
+
+        The COM_STMT_EXECUTE packets are sent back to back, without waiting
+        for the response of the previous one, keeping at most window packets
+        in flight. seq_data is consumed lazily, each set of data is only
+        taken when its packet can be sent. The responses are read in order.
+
+        The statement must not return a result set, and long data (file-like
+        objects) can not be used as parameters.
+
+        When the server returns an error, no more packets are sent and the
+        exception is returned in place of the OK packet. The packets already
+        sent after the failing one have been executed by the server; their
+        responses are read and returned as well. When taking or converting
+        the next set of data fails, the responses of the packets in flight
+        are read before the exception is raised.
+
+        Returns a list of OK packets or Error exceptions, in the order of
+        seq_data.
+        """
+        if window < 1:
+            raise ValueError("window must be a positive integer")
+        self.handle_unread_result()
+        if not self._query_attrs_supported and self._query_attrs:
+            warnings.warn(
+                "This version of the server does not support Query Attributes",
+                category=Warning,
+            )
+
+        results: List[Union[OkPacketType, Error]] = []
+        in_flight = 0
+        try:
+            for data in seq_data:
+                if in_flight == window:
+                    results.append(self._handle_pipelined_result(statement_id))
+                    in_flight -= 1
+                    if isinstance(results[-1], Error):
+                        break
+                if any(isinstance(value, IOBase) for value in data):
+                    raise ValueError("Long data can not be sent in a pipeline")
+                packet = self._protocol.make_command(
+                    ServerCmd.STMT_EXECUTE,
+                    self._make_stmt_execute(statement_id, data, parameters, 0, {}),
+                )
+                try:
+                    self._socket.send(packet, 0, 0)
+                except AttributeError as err:
+                    raise OperationalError("MySQL Connection not available") from err
+                in_flight += 1
+        except Exception:
+            # Keep the connection usable, the packets in flight were executed
+            try:
+                while in_flight:
+                    self._handle_pipelined_result(statement_id)
+                    in_flight -= 1
+            except (AttributeError, Error):
+                # The connection is not available anymore
+                pass
+            raise
+        while in_flight:
+            results.append(self._handle_pipelined_result(statement_id))
+            in_flight -= 1
+        return results
+
+    def _handle_pipelined_result(self, statement_id: int) -> Union[OkPacketType, Error]:
+        """Read the response of a pipelined COM_STMT_EXECUTE
+
+        Returns the OK packet, or the exception of the error packet.
+        """
+        packet = self._socket.recv()
+        if packet[4] == 255:
+            # The server might not have bound the types, send them next time
+            self._stmt_bound_types.pop(statement_id, None)
+            # An error packet never maps to errors.Warning
+            return get_exception(packet)  # type: ignore[return-value]
+        if packet[4] != 0:
+            raise InterfaceError("Pipelined statements can not return a result set")
+        return self._handle_ok(packet)
+
     def cmd_stmt_close(self, statement_id: int) -> None:  # type: ignore[override]
         """Deallocate a prepared MySQL statement
 
@@ -1466,6 +1818,7 @@ class MySQLConnection(MySQLConnectionAbstract):
         statement_id. Note that the MySQL server does not return
         anything.
         """
+        self._stmt_bound_types.pop(statement_id, None)
         self._send_cmd(
             ServerCmd.STMT_CLOSE,
             int4store(statement_id),
@@ -1518,6 +1871,7 @@ class MySQLConnection(MySQLConnectionAbstract):
 
         Returns a dict()
         """
+        self._stmt_bound_types.pop(statement_id, None)
         self._handle_ok(self._send_cmd(ServerCmd.STMT_RESET, int4store(statement_id)))
 
     def cmd_reset_connection(self) -> bool:
@@ -1530,6 +1884,11 @@ class MySQLConnection(MySQLConnectionAbstract):
         """
         try:
             self._handle_ok(self._send_cmd(ServerCmd.RESET_CONNECTION))
+            self._reset_session_state()
+            self._stmt_bound_types = {}
+            if self._prepared_statements is not None:
+                # The server deallocates the prepared statements on reset
+                self._prepared_statements.clear()
             self._post_connection()
             return True
         except (NotSupportedError, OperationalError):
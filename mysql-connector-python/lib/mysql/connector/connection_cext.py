@@ -34,6 +34,7 @@ import os
 import platform
 import socket
 import sys
+import warnings
 
 from typing import (
     Any,
@@ -55,6 +56,7 @@ from .conversion import MySQLConverter
 from .errors import (
     InterfaceError,
     InternalError,
+    NotSupportedError,
     OperationalError,
     ProgrammingError,
     get_mysql_exception,
@@ -241,6 +243,19 @@ class CMySQLConnection(MySQLConnectionAbstract):
         return bool(self._server_status & ServerFlag.STATUS_IN_TRANS)
 
     def _open_connection(self) -> None:
+        if self._read_buffer_size:
+            warnings.warn(
+                "The read_buffer_size option is ignored by the C extension, "
+                "use use_pure=True to read packets through a read-ahead buffer",
+                category=Warning,
+            )
+        if self._compression_algorithms and "zstd" in self._compression_algorithms:
+            warnings.warn(
+                "The zstd compression algorithm and the zstd_compression_level "
+                "option are ignored by the C extension, zlib is used when "
+                "compression is enabled, use use_pure=True to compress with zstd",
+                category=Warning,
+            )
         charset_name = self._character_set.get_info(self._charset_id)[0]
         # pylint: disable=c-extension-no-member
         self._cmysql = _mysql_connector.MySQL(
@@ -319,6 +334,9 @@ class CMySQLConnection(MySQLConnectionAbstract):
         if os.name == "nt" and self._auth_plugin_class == "MySQLKerberosAuthPlugin":
             cnx_kwargs["use_kerberos_gssapi"] = True
 
+        if self._prepared_statements is not None:
+            self._prepared_statements.clear()
+
         try:
             self._cmysql.connect(**cnx_kwargs)
             self._cmysql.converter_str_fallback = self._converter_str_fallback
@@ -545,6 +563,9 @@ class CMySQLConnection(MySQLConnectionAbstract):
             raise get_mysql_exception(
                 msg=err.msg, errno=err.errno, sqlstate=err.sqlstate
             ) from err
+        if self._prepared_statements is not None:
+            # Statements keep using the database they were prepared in
+            self._prepared_statements.invalidate()
 
     def fetch_eof_columns(
         self, prep_stmt: Optional[CMySQLPrepStmt] = None
@@ -594,6 +615,30 @@ class CMySQLConnection(MySQLConnectionAbstract):
 
         return None
 
+    def get_prepared_statement(self, statement: bytes) -> CMySQLPrepStmt:
+        """Get a prepared statement using the prepared statement cache
+
+        The statement is served from the cache when possible, otherwise it
+        is prepared and added to the cache. A statement pinned by a cursor
+        reading its result is not shared: it is prepared again, and the new
+        statement replaces it in the cache. Statements evicted from the cache
+        or invalidated are deallocated on the server once they are no longer
+        pinned. Without cache, this method is the same as cmd_stmt_prepare().
+        """
+        cache = self._prepared_statements
+        if cache is None:
+            return self.cmd_stmt_prepare(statement)
+
+        for stale in cache.pop_stale():
+            self.cmd_stmt_close(stale)
+
+        prepared = cache.get(statement)
+        if prepared is None:
+            prepared = self.cmd_stmt_prepare(statement)
+            for evicted in cache.put(statement, prepared):
+                self.cmd_stmt_close(evicted)
+        return prepared
+
     def cmd_stmt_prepare(self, statement: bytes) -> CMySQLPrepStmt:
         """Prepares the SQL statement"""
         if not self._cmysql:
@@ -694,6 +739,7 @@ class CMySQLConnection(MySQLConnectionAbstract):
         cursor_class: Optional[Type[CMySQLCursor]] = None,  # type: ignore[override]
         dictionary: Optional[bool] = None,
         named_tuple: Optional[bool] = None,
+        fetch_size: Optional[int] = None,
     ) -> CMySQLCursor:
         """Instantiates and returns a cursor using C Extension
 
@@ -720,12 +766,18 @@ class CMySQLConnection(MySQLConnectionAbstract):
         :param cursor_class: Use a custom cursor class
         :param dictionary: Rows are returned as dictionary
         :param named_tuple: Rows are returned as named tuple
+        :param fetch_size: Not supported by the C Extension
         :return: Subclass of CMySQLCursor
         :rtype: CMySQLCursor or subclass
         """
         self.handle_unread_result(prepared)
         if not self.is_connected():
             raise OperationalError("MySQL Connection not available.")
+        if fetch_size is not None:
+            raise NotSupportedError(
+                "Server-side cursors (fetch_size) are not supported by the "
+                "C Extension, use use_pure=True"
+            )
         if cursor_class is not None:
             if not issubclass(cursor_class, CMySQLCursor):
                 raise ProgrammingError(
@@ -854,6 +906,8 @@ class CMySQLConnection(MySQLConnectionAbstract):
         This method consume the result by reading (consuming) all rows.
         """
         self._cmysql.consume_result()
+        if self._prepared_statements is not None:
+            self._prepared_statements.unpin_unread_result()
 
     def cmd_change_user(
         self,
@@ -887,6 +941,9 @@ class CMySQLConnection(MySQLConnectionAbstract):
 
         self._charset_id = charset
         self._user = username  # updating user accordingly
+        if self._prepared_statements is not None:
+            # The server deallocates the prepared statements on change user
+            self._prepared_statements.clear()
         self._post_connection()
 
     def cmd_reset_connection(self) -> bool:
@@ -899,6 +956,9 @@ class CMySQLConnection(MySQLConnectionAbstract):
         """
         res = self._cmysql.reset_connection()
         if res:
+            if self._prepared_statements is not None:
+                # The server deallocates the prepared statements on reset
+                self._prepared_statements.clear()
             self._post_connection()
         return res
 
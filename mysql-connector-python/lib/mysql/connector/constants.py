@@ -28,6 +28,7 @@
 
 """Various MySQL constants and character sets."""
 
+import re
 import warnings
 
 from abc import ABC, ABCMeta
@@ -40,6 +41,15 @@ NET_BUFFER_LENGTH: int = 8192
 MAX_MYSQL_TABLE_COLUMNS: int = 4096
 # Flag used to send the Query Attributes with 0 (or more) parameters.
 PARAMETER_COUNT_AVAILABLE: int = 8
+# SET statement assigning a session_track_* variable, quoted strings and comments
+# are skipped
+RE_SQL_SET_SESSION_TRACK = re.compile(
+    rb"""\s*(?:/\*.*?\*/\s*)*SET\s"""
+    rb"""(?:[^'"/]|/(?!\*)|/\*.*?\*/|'[^'\\]*(?:\\.[^'\\]*)*'"""
+    rb"""|"[^"\\]*(?:\\.[^"\\]*)*")*?"""
+    rb"""\bsession_track_\w+`?\s*:?=""",
+    re.I | re.S,
+)
 
 DEFAULT_CONFIGURATION: Dict[str, Optional[Union[str, bool, int]]] = {
     "database": None,
@@ -94,9 +104,28 @@ DEFAULT_CONFIGURATION: Dict[str, Optional[Union[str, bool, int]]] = {
     "webauthn_callback": None,
     "kerberos_auth_mode": None,
     "init_command": None,
+    "read_buffer_size": None,
+    "prepared_statement_cache_size": None,
+    "compression_algorithms": None,
+    "zstd_compression_level": None,
 }
 
-CNX_POOL_ARGS: Tuple[str, str, str] = ("pool_name", "pool_size", "pool_reset_session")
+COMPRESSION_ALGORITHMS: Tuple[str, ...] = ("zlib", "zstd", "uncompressed")
+
+DEFAULT_ZSTD_COMPRESSION_LEVEL: int = 3
+
+CNX_POOL_ARGS: Tuple[str, ...] = (
+    "pool_name",
+    "pool_size",
+    "pool_reset_session",
+    "pool_acquire_timeout",
+    "pool_min_size",
+    "pool_max_size",
+    "pool_max_idle_time",
+    "pool_max_lifetime",
+    "pool_validation_interval",
+    "pool_lazy_prefill",
+)
 
 TLS_VERSIONS: List[str] = ["TLSv1.2", "TLSv1.3"]
 
@@ -522,6 +551,7 @@ class ClientFlag(_Flags):
     SESION_TRACK: int = 1 << 23  # deprecated
     SESSION_TRACK: int = 1 << 23
     DEPRECATE_EOF: int = 1 << 24
+    ZSTD_COMPRESSION_ALGORITHM: int = 1 << 26
     CLIENT_QUERY_ATTRIBUTES: int = 1 << 27
     SSL_VERIFY_SERVER_CERT: int = 1 << 30
     REMEMBER_OPTIONS: int = 1 << 31
@@ -566,6 +596,10 @@ class ClientFlag(_Flags):
             "Capable of handling server state change information",
         ),
         "DEPRECATE_EOF": (1 << 24, "Client no longer needs EOF packet"),
+        "ZSTD_COMPRESSION_ALGORITHM": (
+            1 << 26,
+            "Can use zstd compression protocol",
+        ),
         "CLIENT_QUERY_ATTRIBUTES": (
             1 << 27,
             "Support optional extension for query parameters",
@@ -750,6 +784,51 @@ class ShutdownType(_Constants):
     }
 
 
+class SessionTrackType(_Constants):
+    """MySQL Session State Tracker types
+
+    Types of the session state information found in OK packets when the
+    client flag CLIENT_SESSION_TRACK is set.
+    """
+
+    _prefix: str = "SESSION_TRACK_"
+    SYSTEM_VARIABLES: int = 0
+    SCHEMA: int = 1
+    STATE_CHANGE: int = 2
+    GTIDS: int = 3
+    TRANSACTION_CHARACTERISTICS: int = 4
+    TRANSACTION_STATE: int = 5
+
+    desc: Dict[str, Tuple[int, str]] = {
+        "SYSTEM_VARIABLES": (0, "Session system variables"),
+        "SCHEMA": (1, "Current schema"),
+        "STATE_CHANGE": (2, "Session state changes"),
+        "GTIDS": (3, "GTIDs"),
+        "TRANSACTION_CHARACTERISTICS": (4, "Transaction characteristics"),
+        "TRANSACTION_STATE": (5, "Transaction state"),
+    }
+
+
+class CursorType(_Constants):
+    """MySQL Cursor types
+
+    Cursor types used in the flags of the COM_STMT_EXECUTE server command.
+    """
+
+    _prefix: str = "CURSOR_TYPE_"
+    NO_CURSOR: int = 0
+    READ_ONLY: int = 1
+    FOR_UPDATE: int = 2
+    SCROLLABLE: int = 4
+
+    desc: Dict[str, Tuple[int, str]] = {
+        "NO_CURSOR": (0, "No server-side cursor"),
+        "READ_ONLY": (1, "Read-only server-side cursor"),
+        "FOR_UPDATE": (2, "Updatable server-side cursor (not supported)"),
+        "SCROLLABLE": (4, "Scrollable server-side cursor (not supported)"),
+    }
+
+
 class CharacterSet:
     """MySQL supported character sets and collations
 
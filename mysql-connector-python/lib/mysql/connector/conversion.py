@@ -251,15 +251,7 @@ class MySQLConverter(MySQLConverterBase):
             return None
 
         if not self._cache_field_types:
-            self._cache_field_types = {}
-            for name, info in FieldType.desc.items():
-                try:
-                    self._cache_field_types[info[0]] = getattr(
-                        self, f"_{name.lower()}_to_python"
-                    )
-                except AttributeError:
-                    # We ignore field types which has no method
-                    pass
+            self._build_cache_field_types()
 
         try:
             return self._cache_field_types[vtype[1]](value, vtype)
@@ -453,6 +445,92 @@ class MySQLConverter(MySQLConverterBase):
 
         return None
 
+    def make_row_decoder(
+        self, fields: List[DescriptionType]
+    ) -> Callable[[Tuple[Optional[bytes], ...]], Tuple[PythonProducedType, ...]]:
+        """Make a function converting MySQL text result rows to Python types
+
+        The conversion of each column is looked up once using the field type
+        information in the fields argument, instead of for every value as done
+        by row_to_python(). The returned function is meant to be used for all
+        the rows of a result set.
+
+        When row_to_python() is overridden, the returned function calls it.
+
+        Returns a callable taking a row and returning a tuple.
+        """
+        if type(self).row_to_python is not MySQLConverter.row_to_python:
+            return lambda row: self.row_to_python(row, fields)
+
+        converters = tuple(self._make_column_converter(field) for field in fields)
+
+        def decode_row(
+            row: Tuple[Optional[bytes], ...]
+        ) -> Tuple[PythonProducedType, ...]:
+            try:
+                return tuple(
+                    [
+                        None if value is None else convert(value)
+                        for convert, value in zip(converters, row)
+                    ]
+                )
+            except (ValueError, TypeError):
+                # Let row_to_python() report the field which failed
+                return self.row_to_python(row, fields)
+
+        return decode_row
+
+    def _make_column_converter(
+        self, field: DescriptionType
+    ) -> Callable[[bytes], PythonProducedType]:
+        """Get the function converting the non-NULL values of a column"""
+        if not self._cache_field_types:
+            self._build_cache_field_types()
+
+        convert = self._cache_field_types.get(field[1])
+        if convert is None:
+            # If one type is not defined, we just return the value as str
+            def decode_utf8(value: bytes) -> StrOrBytes:
+                try:
+                    return value.decode("utf-8")
+                except UnicodeDecodeError:
+                    return value
+
+            return decode_utf8
+        if convert is MySQLConverter._int_to_python:
+            return int
+        if convert is MySQLConverter._float_to_python:
+            return float
+        if (
+            getattr(convert, "__func__", None) is MySQLConverter._string_to_python
+            and field[1] != FieldType.JSON
+            and not field[7] & FieldFlag.SET
+        ):
+            if self.charset == "binary" or field[8] == 63 or not self.use_unicode:
+                return lambda value: value
+            charset = self.charset
+
+            def decode_string(value: bytes) -> StrOrBytes:
+                try:
+                    return value.decode(charset)
+                except UnicodeDecodeError:
+                    return value
+
+            return decode_string
+        return lambda value: convert(value, field)
+
+    def _build_cache_field_types(self) -> None:
+        """Map the field types to their conversion method"""
+        self._cache_field_types = {}
+        for name, info in FieldType.desc.items():
+            try:
+                self._cache_field_types[info[0]] = getattr(
+                    self, f"_{name.lower()}_to_python"
+                )
+            except AttributeError:
+                # We ignore field types which has no method
+                pass
+
     def row_to_python(
         self, row: Tuple[bytes, ...], fields: List[DescriptionType]
     ) -> Tuple[PythonProducedType, ...]:
@@ -468,15 +546,7 @@ class MySQLConverter(MySQLConverterBase):
         result: List[PythonProducedType] = [None] * len(fields)
 
         if not self._cache_field_types:
-            self._cache_field_types = {}
-            for name, info in FieldType.desc.items():
-                try:
-                    self._cache_field_types[info[0]] = getattr(
-                        self, f"_{name.lower()}_to_python"
-                    )
-                except AttributeError:
-                    # We ignore field types which has no method
-                    pass
+            self._build_cache_field_types()
 
         for field in fields:
             field_type = field[1]
@@ -38,12 +38,15 @@ import weakref
 
 from collections import deque, namedtuple
 from decimal import Decimal
+from functools import lru_cache
+from io import IOBase
 from typing import (
     TYPE_CHECKING,
     Any,
     Deque,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
     NoReturn,
@@ -54,7 +57,9 @@ from typing import (
 )
 
 from .abstracts import NAMED_TUPLE_CACHE, MySQLCursorAbstract
-from .constants import ServerFlag
+from .charsets import MYSQL_CHARACTER_SETS, MYSQL_CHARACTER_SETS_57
+from .constants import ClientFlag, CursorType, ServerFlag
+from .custom_types import HexLiteral
 from .errors import (
     Error,
     InterfaceError,
@@ -78,6 +83,7 @@ from .types import (
 
 if TYPE_CHECKING:
     from .connection import MySQLConnection
+    from .conversion import MySQLConverter
 
 
 SQL_COMMENT = r"\/\*.*?\*\/"
@@ -111,11 +117,34 @@ RE_SQL_SPLIT_STMTS = re.compile(
 RE_SQL_FIND_PARAM = re.compile(b"""%s(?=(?:[^"'`]*["'`][^"'`]*["'`])*[^"'`]*$)""")
 RE_SQL_PYTHON_REPLACE_PARAM = re.compile(r"%\(.*?\)s")
 RE_SQL_PYTHON_CAPTURE_PARAM_NAME = re.compile(r"%\((.*?)\)s")
+RE_SQL_USER_VARIABLE = re.compile(r"@[\w$.]+")
 
 ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
 MAX_RESULTS = 4294967295
 
+# Bytes of a COM_QUERY packet kept for the command and the query attributes when
+# a statement is split to fit in max_allowed_packet
+QUERY_PACKET_OVERHEAD = 1024
+
+# Joins the statements of a batch, the newline ends a trailing end-of-line comment
+MULTI_STATEMENT_SEPARATOR = b"\n;"
+
+# Number of statements kept parsed by each of the query template caches
+QUERY_TEMPLATE_CACHE_SIZE = 256
+
+# Longer statements, usually holding their values inline, are parsed each time
+# instead of being kept in the query template caches
+QUERY_TEMPLATE_CACHE_MAX_LENGTH = 8192
+
+# File name requested by the server for the rows sent by load_rows()
+LOAD_DATA_ROWS_FILE = "<rows>"
+
+# Names of the character sets the rows of load_rows() can be encoded in
+LOAD_DATA_CHARSETS = frozenset(
+    info[0] for info in MYSQL_CHARACTER_SETS + MYSQL_CHARACTER_SETS_57 if info
+)
+
 
 def is_eol_comment(stmt: bytes) -> bool:
     """Checks if statement is an end-of-line comment.
@@ -182,61 +211,366 @@ def parse_multi_statement_query(multi_stmt: bytes) -> Deque[bytes]:
     return executed_list
 
 
-class _ParamSubstitutor:
-    """
-    Substitutes parameters into SQL statement.
+def batch_insert_statements(
+    stmt: bytes, fmt: bytes, rows: Iterable[bytes], max_allowed_packet: int
+) -> Generator[bytes, None, None]:
+    """Builds the multi-row INSERT statements inserting the given rows.
+
+    The first occurrence of `fmt`, the row of values of the INSERT statement
+    `stmt`, is replaced by as many rows as fit in `max_allowed_packet`. The rows
+    are consumed as the statements are built, so only one statement is held in
+    memory at a time.
+
+    A row too large to fit in a statement on its own is sent alone, leaving it to
+    the server to reject it.
+
+    Args:
+        stmt: The INSERT statement.
+        fmt: The row of values of the statement to replace.
+        rows: The rows of values, with their parameters substituted.
+        max_allowed_packet: The maximum size of a packet sent to the server.
+
+    Returns:
+        A generator of statements.
     """
+    head, tail = stmt.split(fmt, 1)
+    max_size = max_allowed_packet - QUERY_PACKET_OVERHEAD - len(head) - len(tail)
+    values: List[bytes] = []
+    size = -1
+    for row in rows:
+        if values and size + len(row) + 1 > max_size:
+            yield b"".join((head, b",".join(values), tail))
+            values, size = [], -1
+        values.append(row)
+        size += len(row) + 1
+    if values:
+        yield b"".join((head, b",".join(values), tail))
+
+
+def batch_statements(
+    stmts: Iterable[bytes], batch_size: int, max_allowed_packet: int
+) -> Generator[List[bytes], None, None]:
+    """Groups statements in batches sent as multi-statement queries.
+
+    A batch holds at most `batch_size` statements, and no more than fit in
+    `max_allowed_packet` once joined by MULTI_STATEMENT_SEPARATOR. A statement
+    too large to fit on its own makes a batch alone, leaving it to the server to
+    reject it.
 
-    def __init__(self, params: Sequence[bytes]) -> None:
-        self.params: Sequence[bytes] = params
-        self.index: int = 0
+    Args:
+        stmts: The statements, with their parameters substituted.
+        batch_size: The maximum number of statements of a batch.
+        max_allowed_packet: The maximum size of a packet sent to the server.
 
-    def __call__(self, matchobj: re.Match) -> bytes:
-        index = self.index
-        self.index += 1
-        try:
-            return bytes(self.params[index])
-        except IndexError:
-            raise ProgrammingError(
-                "Not enough parameters for the SQL statement"
-            ) from None
+    Returns:
+        A generator of lists of statements.
+    """
+    max_size = max_allowed_packet - QUERY_PACKET_OVERHEAD
+    sep_size = len(MULTI_STATEMENT_SEPARATOR)
+    batch: List[bytes] = []
+    size = -sep_size
+    for stmt in stmts:
+        # Terminators would make empty statements once joined
+        stmt = stmt.rstrip(b" \t\r\n;")
+        if batch and (
+            len(batch) == batch_size or size + sep_size + len(stmt) > max_size
+        ):
+            yield batch
+            batch, size = [], -sep_size
+        batch.append(stmt)
+        size += sep_size + len(stmt)
+    if batch:
+        yield batch
+
+
+def quote_identifier(identifier: str) -> str:
+    """Quotes an identifier with backticks, doubling the backticks in it."""
+    return "`" + identifier.replace("`", "``") + "`"
+
+
+def load_data_statement(
+    table: str, columns: Optional[Sequence[str]], charset: str
+) -> str:
+    """Builds the LOAD DATA LOCAL INFILE statement loading the rows of load_rows().
+
+    The table and column names are quoted. A table name in the `db.table` form
+    is split at its first dot, and a column name like `@var` is used as a user
+    variable.
 
-    @property
-    def remaining(self) -> int:
-        """Returns number of parameters remaining to be substituted"""
-        return len(self.params) - self.index
+    Args:
+        table: The table the rows are loaded in.
+        columns: The columns, or user variables, the fields are assigned to.
+        charset: The character set the fields are encoded in.
 
+    Returns:
+        The LOAD DATA LOCAL INFILE statement.
 
-def _bytestr_format_dict(bytestr: bytes, value_dict: Dict[bytes, bytes]) -> bytes:
+    Raises:
+        ProgrammingError: If the character set is unknown.
     """
-    >>> _bytestr_format_dict(b'%(a)s', {b'a': b'foobar'})
-    b'foobar
-    >>> _bytestr_format_dict(b'%%(a)s', {b'a': b'foobar'})
-    b'%%(a)s'
-    >>> _bytestr_format_dict(b'%%%(a)s', {b'a': b'foobar'})
-    b'%%foobar'
-    >>> _bytestr_format_dict(b'%(x)s %(y)s',
-    ...                      {b'x': b'x=%(y)s', b'y': b'y=%(x)s'})
-    b'x=%(y)s y=%(x)s'
+    if charset not in LOAD_DATA_CHARSETS:
+        raise ProgrammingError(f"Unknown character set '{charset}'")
+    stmt = (
+        f"LOAD DATA LOCAL INFILE '{LOAD_DATA_ROWS_FILE}' INTO TABLE "
+        f"{'.'.join(quote_identifier(name) for name in table.split('.', 1))} "
+        f"CHARACTER SET {charset}"
+    )
+    if columns:
+        names = (
+            column
+            if RE_SQL_USER_VARIABLE.fullmatch(column)
+            else quote_identifier(column)
+            for column in columns
+        )
+        stmt += f" ({','.join(names)})"
+    return stmt
+
+
+def _escape_load_data_field(value: bytes) -> bytes:
+    """Escapes a field as expected by LOAD DATA with the default ESCAPED BY."""
+    return (
+        value.replace(b"\\", b"\\\\")
+        .replace(b"\t", b"\\t")
+        .replace(b"\n", b"\\n")
+        .replace(b"\r", b"\\r")
+    )
+
+
+class LoadDataRowsReader:
+    """File-like object reading rows as the data of LOAD DATA LOCAL INFILE.
+
+    The rows are converted using the connection's converter and encoded as they
+    are read, in the default format of LOAD DATA: fields terminated by a tab,
+    lines terminated by a newline, special characters escaped with a backslash
+    and NULL written as `\\N`. Rows given as dictionaries are read in the order
+    of `columns`.
+
+    An error converting a row ends the data, like the end of a file, and is kept
+    in `error` to be raised once the server acknowledged the rows loaded so far.
     """
 
-    def replace(matchobj: re.Match) -> bytes:
-        """Replace pattern."""
-        value: Optional[bytes] = None
-        groups = matchobj.groupdict()
-        if groups["conversion_type"] == b"%":
-            value = b"%"
-        if groups["conversion_type"] == b"s":
-            key = groups["mapping_key"]
-            value = value_dict[key]
+    def __init__(
+        self,
+        rows: Iterable[Union[ParamsSequenceType, ParamsDictType]],
+        converter: MySQLConverter,
+        columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        self._rows: Iterator[Union[ParamsSequenceType, ParamsDictType]] = iter(rows)
+        self._to_mysql = converter.to_mysql
+        self._columns = columns
+        self._buffer = bytearray()
+        self.error: Optional[Error] = None
+
+    def _encode_field(self, value: MySQLConvertibleType) -> bytes:
+        """Encodes a field of a row."""
+        value = self._to_mysql(value)
         if value is None:
-            raise ValueError(
-                f"Unsupported conversion_type: {groups['conversion_type']}"
+            return b"\\N"
+        if isinstance(value, HexLiteral):
+            # Only escape the single byte characters, as the trailing byte of a
+            # multibyte character can be a backslash
+            encoded = (char.encode(value.charset) for char in value.original)
+            return b"".join(
+                _escape_load_data_field(char) if len(char) == 1 else char
+                for char in encoded
             )
-        return value
+        if isinstance(value, (bytes, bytearray)):
+            return _escape_load_data_field(value)
+        return str(value).encode("ascii")
 
-    stmt = RE_PY_MAPPING_PARAM.sub(replace, bytestr)
-    return stmt
+    def _encode_row(self, row: Union[ParamsSequenceType, ParamsDictType]) -> bytes:
+        """Encodes a row as a line of the data."""
+        if isinstance(row, dict):
+            if not self._columns:
+                raise ValueError("columns are required for rows given as dict")
+            row = [row[column] for column in self._columns]
+        return b"\t".join([self._encode_field(value) for value in row]) + b"\n"
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to `size` bytes of the data, or all of it if `size` is negative.
+
+        Returns an empty bytes object when all rows were read.
+        """
+        buf = self._buffer
+        while (size < 0 or len(buf) < size) and self.error is None:
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                break
+            try:
+                buf += self._encode_row(row)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                self.error = ProgrammingError(f"Failed processing rows; {err}")
+                self.error.__cause__ = err
+        if size < 0 or len(buf) <= size:
+            data = bytes(buf)
+            buf.clear()
+        else:
+            data = bytes(buf[:size])
+            del buf[:size]
+        return data
+
+
+def encode_operation(operation: StrOrBytes, charset: str) -> bytes:
+    """Encodes an operation, raising ProgrammingError when it can't be encoded."""
+    if not isinstance(operation, str):
+        return operation
+    try:
+        return operation.encode(charset)
+    except UnicodeEncodeError as err:
+        raise ProgrammingError(str(err)) from err
+
+
+@lru_cache(maxsize=QUERY_TEMPLATE_CACHE_SIZE)
+def _compile_format_template(operation: StrOrBytes, charset: str) -> Tuple[bytes, ...]:
+    """Cached implementation of `compile_format_template()`."""
+    return tuple(encode_operation(operation, charset).split(b"%s"))
+
+
+def compile_format_template(operation: StrOrBytes, charset: str) -> Tuple[bytes, ...]:
+    """Compiles a statement using the `%s` parameter style.
+
+    The statement is encoded and split at its placeholders. The templates of the
+    most recently used statements are cached, unless they are longer than
+    `QUERY_TEMPLATE_CACHE_MAX_LENGTH`.
+
+    Args:
+        operation: The statement, as str or bytes.
+        charset: The Python character set used to encode the statement.
+
+    Returns:
+        The literal fragments of the statement surrounding the placeholders.
+    """
+    if len(operation) > QUERY_TEMPLATE_CACHE_MAX_LENGTH:
+        return _compile_format_template.__wrapped__(operation, charset)
+    return _compile_format_template(operation, charset)
+
+
+@lru_cache(maxsize=QUERY_TEMPLATE_CACHE_SIZE)
+def _compile_mapping_template(
+    operation: StrOrBytes, charset: str
+) -> Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]:
+    """Cached implementation of `compile_mapping_template()`."""
+    stmt = encode_operation(operation, charset)
+    fragments: List[bytes] = []
+    names: List[bytes] = []
+    fragment = b""
+    pos = 0
+    for match in RE_PY_MAPPING_PARAM.finditer(stmt):
+        fragment += stmt[pos : match.start()]
+        pos = match.end()
+        conversion_type = match.group("conversion_type")
+        if conversion_type == b"%":
+            fragment += b"%"
+        elif conversion_type == b"s":
+            fragments.append(fragment)
+            names.append(match.group("mapping_key"))
+            fragment = b""
+        else:
+            raise ValueError(f"Unsupported conversion_type: {conversion_type.decode()}")
+    fragments.append(fragment + stmt[pos:])
+    return tuple(fragments), tuple(names)
+
+
+def compile_mapping_template(
+    operation: StrOrBytes, charset: str
+) -> Tuple[Tuple[bytes, ...], Tuple[bytes, ...]]:
+    """Compiles a statement using the `%(name)s` parameter style.
+
+    The statement is encoded and split at its placeholders, and `%(name)%` is
+    replaced by `%`. The templates of the most recently used statements are
+    cached, unless they are longer than `QUERY_TEMPLATE_CACHE_MAX_LENGTH`.
+
+    Args:
+        operation: The statement, as str or bytes.
+        charset: The Python character set used to encode the statement.
+
+    Returns:
+        The literal fragments of the statement surrounding the placeholders, and
+        the names of the placeholders.
+
+    Raises:
+        ValueError: If a placeholder uses another conversion type.
+    """
+    if len(operation) > QUERY_TEMPLATE_CACHE_MAX_LENGTH:
+        return _compile_mapping_template.__wrapped__(operation, charset)
+    return _compile_mapping_template(operation, charset)
+
+
+def _remove_comments(match: re.Match) -> str:
+    """Remove comments from INSERT statements.
+
+    This function is used while removing comments from INSERT
+    statements. If the matched string is a comment not enclosed
+    by quotes, it returns an empty string, else the string itself.
+    """
+    if match.group(1):
+        return ""
+    return match.group(2)
+
+
+@lru_cache(maxsize=QUERY_TEMPLATE_CACHE_SIZE)
+def _compile_insert_template(operation: str, charset: str) -> Tuple[bytes, bytes]:
+    """Cached implementation of `compile_insert_template()`."""
+    tmp = re.sub(
+        RE_SQL_ON_DUPLICATE,
+        "",
+        re.sub(RE_SQL_COMMENT, _remove_comments, operation),
+    )
+
+    matches = re.search(RE_SQL_INSERT_VALUES, tmp)
+    if not matches:
+        raise InterfaceError(
+            "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
+        )
+    stmt = encode_operation(operation, charset)
+    return stmt, matches.group(1).encode(charset)
+
+
+def compile_insert_template(operation: str, charset: str) -> Tuple[bytes, bytes]:
+    """Compiles an INSERT statement to be rewritten as a multi-row INSERT.
+
+    The templates of the most recently used statements are cached, unless they are
+    longer than `QUERY_TEMPLATE_CACHE_MAX_LENGTH`.
+
+    Args:
+        operation: The INSERT statement.
+        charset: The Python character set used to encode the statement.
+
+    Returns:
+        The encoded statement and its row of values.
+
+    Raises:
+        InterfaceError: If the row of values is not found.
+    """
+    if len(operation) > QUERY_TEMPLATE_CACHE_MAX_LENGTH:
+        return _compile_insert_template.__wrapped__(operation, charset)
+    return _compile_insert_template(operation, charset)
+
+
+def substitute_params(
+    fragments: Sequence[bytes], values: Sequence[Union[bytes, bytearray]]
+) -> bytes:
+    """Substitutes the values of the parameters in a compiled statement.
+
+    Args:
+        fragments: The literal fragments of the statement.
+        values: The values, converted and quoted, of the placeholders.
+
+    Returns:
+        The statement.
+
+    Raises:
+        ProgrammingError: If the number of values doesn't match the placeholders.
+    """
+    if len(values) != len(fragments) - 1:
+        if len(values) < len(fragments) - 1:
+            raise ProgrammingError("Not enough parameters for the SQL statement")
+        raise ProgrammingError("Not all parameters were used in the SQL statement")
+    parts: List[Union[bytes, bytearray]] = [b""] * (2 * len(fragments) - 1)
+    parts[::2] = fragments
+    parts[1::2] = values
+    return b"".join(parts)
 
 
 class CursorBase(MySQLCursorAbstract):
@@ -454,6 +788,7 @@ class MySQLCursor(CursorBase):
             None,
             None,
         )
+        self._prefetched: Deque[RowType] = deque()
         self._binary: bool = False
 
         if connection is not None:
@@ -478,6 +813,7 @@ class MySQLCursor(CursorBase):
         """Reset the cursor to default"""
         self._rowcount: int = -1
         self._nextrow = (None, None)
+        self._prefetched = deque()
         self._stored_results: List[MySQLCursor] = []
         self._warnings: Optional[List[WarningType]] = None
         self._warning_count: int = 0
@@ -528,9 +864,7 @@ class MySQLCursor(CursorBase):
 
         return True
 
-    def _process_params_dict(
-        self, params: ParamsDictType
-    ) -> Dict[bytes, Union[bytes, Decimal]]:
+    def _process_params_dict(self, params: ParamsDictType) -> Dict[bytes, bytes]:
         """Process query parameters given as dictionary"""
         res: Dict[bytes, Any] = {}
         try:
@@ -551,9 +885,7 @@ class MySQLCursor(CursorBase):
             ) from err
         return res
 
-    def _process_params(
-        self, params: ParamsSequenceType
-    ) -> Tuple[Union[bytes, Decimal], ...]:
+    def _process_params(self, params: ParamsSequenceType) -> Tuple[bytes, ...]:
         """Process query parameters."""
         res = params[:]
         try:
@@ -678,6 +1010,39 @@ class MySQLCursor(CursorBase):
             if not stmt.upper().startswith(b"CALL") or "columns" not in result:
                 stmt = executed_list.popleft() if executed_list else b"stmt_overflow!"
 
+    def _prepare_statement(
+        self,
+        operation: StrOrBytes,
+        params: Optional[ParamsSequenceOrDictType] = None,
+    ) -> bytes:
+        """Prepares the statement for execution
+
+        Converts the operation to bytes and substitutes the parameters in
+        the placeholders.
+
+        Raises ProgrammingError when the operation can not be encoded, or
+        the parameters are missing or of an invalid type.
+        """
+        if isinstance(operation, bytearray):
+            operation = bytes(operation)
+        charset = self._connection.python_charset
+        if not params:
+            return encode_operation(operation, charset)
+
+        if isinstance(params, dict):
+            values = self._process_params_dict(params)
+            fragments, names = compile_mapping_template(operation, charset)
+            return substitute_params(fragments, [values[name] for name in names])
+        if isinstance(params, (list, tuple)):
+            return substitute_params(
+                compile_format_template(operation, charset),
+                self._process_params(params),
+            )
+        raise ProgrammingError(
+            f"Could not process parameters: {type(params).__name__}({params}),"
+            " it must be of type list, tuple or dict"
+        )
+
     def execute(
         self,
         operation: StrOrBytes,
@@ -713,31 +1078,7 @@ class MySQLCursor(CursorBase):
         self._connection.handle_unread_result()
 
         self._reset_result()
-        stmt: StrOrBytes = ""
-
-        try:
-            if not isinstance(operation, (bytes, bytearray)):
-                stmt = operation.encode(self._connection.python_charset)
-            else:
-                stmt = operation
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise ProgrammingError(str(err)) from err
-
-        if params:
-            if isinstance(params, dict):
-                stmt = _bytestr_format_dict(stmt, self._process_params_dict(params))
-            elif isinstance(params, (list, tuple)):
-                psub = _ParamSubstitutor(self._process_params(params))
-                stmt = RE_PY_PARAM.sub(psub, stmt)
-                if psub.remaining != 0:
-                    raise ProgrammingError(
-                        "Not all parameters were used in the SQL statement"
-                    )
-            else:
-                raise ProgrammingError(
-                    f"Could not process parameters: {type(params).__name__}({params}),"
-                    " it must be of type list, tuple or dict"
-                )
+        stmt = self._prepare_statement(operation, params)
 
         self._executed = stmt
         if multi:
@@ -755,63 +1096,51 @@ class MySQLCursor(CursorBase):
         return None
 
     def _batch_insert(
-        self, operation: str, seq_params: Sequence[ParamsSequenceOrDictType]
-    ) -> Optional[bytes]:
-        """Implements multi row insert"""
-
-        def remove_comments(match: re.Match) -> str:
-            """Remove comments from INSERT statements.
-
-            This function is used while removing comments from INSERT
-            statements. If the matched string is a comment not enclosed
-            by quotes, it returns an empty string, else the string itself.
-            """
-            if match.group(1):
-                return ""
-            return match.group(2)
-
-        tmp = re.sub(
-            RE_SQL_ON_DUPLICATE,
-            "",
-            re.sub(RE_SQL_COMMENT, remove_comments, operation),
-        )
-
-        matches = re.search(RE_SQL_INSERT_VALUES, tmp)
-        if not matches:
-            raise InterfaceError(
-                "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
-            )
-        fmt = matches.group(1).encode(self._connection.python_charset)
-        values = []
+        self, operation: str, seq_params: Iterable[ParamsSequenceOrDictType]
+    ) -> Optional[Generator[bytes, None, None]]:
+        """Implements multi row insert
+
+        Returns a generator of the multi-row INSERT statements, each one holding as
+        many rows as fit in the connection's `max_allowed_packet`, or None when the
+        statement can not be rewritten. All the parameter sets are converted
+        before returning, so that an invalid one raises before any row is inserted.
+        """
+        charset = self._connection.python_charset
+        stmt, fmt = compile_insert_template(operation, charset)
+        if fmt not in stmt:
+            return None
 
-        try:
-            stmt = operation.encode(self._connection.python_charset)
-            for params in seq_params:
-                tmp = fmt
-                if isinstance(params, dict):
-                    tmp = _bytestr_format_dict(tmp, self._process_params_dict(params))
-                else:
-                    psub = _ParamSubstitutor(self._process_params(params))
-                    tmp = RE_PY_PARAM.sub(psub, tmp)
-                    if psub.remaining != 0:
-                        raise ProgrammingError(
-                            "Not all parameters were used in the SQL statement"
+        def rows() -> Generator[bytes, None, None]:
+            """Substitute the parameters in the row of values."""
+            try:
+                for params in seq_params:
+                    if isinstance(params, dict):
+                        values = self._process_params_dict(params)
+                        fragments, names = compile_mapping_template(fmt, charset)
+                        yield substitute_params(
+                            fragments, [values[name] for name in names]
                         )
-                values.append(tmp)
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b",".join(values), 1)
-                self._executed = stmt
-                return stmt
-            return None
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise ProgrammingError(str(err)) from err
-        except Error:
-            raise
-        except Exception as err:
-            raise InterfaceError(f"Failed executing the operation; {err}") from None
+                    else:
+                        yield substitute_params(
+                            compile_format_template(fmt, charset),
+                            self._process_params(params),
+                        )
+            except (UnicodeDecodeError, UnicodeEncodeError) as err:
+                raise ProgrammingError(str(err)) from err
+            except Error:
+                raise
+            except Exception as err:
+                raise InterfaceError(f"Failed executing the operation; {err}") from None
+
+        return batch_insert_statements(
+            stmt, fmt, list(rows()), self._connection.max_allowed_packet
+        )
 
     def executemany(
-        self, operation: str, seq_params: Sequence[ParamsSequenceOrDictType]
+        self,
+        operation: str,
+        seq_params: Sequence[ParamsSequenceOrDictType],
+        batch_size: Optional[int] = None,
     ) -> Optional[Generator[MySQLCursor, None, None]]:
         """Execute the given operation multiple times
 
@@ -829,11 +1158,29 @@ class MySQLCursor(CursorBase):
         cursor.executemany(stmt, data)
 
         INSERT statements are optimized by batching the data, that is
-        using the MySQL multiple rows syntax.
+        using the MySQL multiple rows syntax. The rows are sent in as many
+        statements as needed to fit in the connection's `max_allowed_packet`.
+        All the parameter sets are converted before the first statement is
+        sent. When a statement fails, the rows inserted by the previous ones
+        are kept unless the transaction is rolled back.
+
+        Other statements are executed once per parameter set, unless
+        batch_size is given. Then, up to batch_size statements are sent at
+        once in a multi-statement query fitting in max_allowed_packet, and
+        the operation must be a single statement. When a statement fails,
+        the following ones in its batch are not executed. The error raised
+        tells which parameter set failed, and rowcount holds the rows
+        affected by the statements executed before it.
 
         Results are discarded. If they are needed, consider looping over
         data using the execute() method.
         """
+        if batch_size is not None and (
+            not isinstance(batch_size, int)
+            or isinstance(batch_size, bool)
+            or batch_size < 1
+        ):
+            raise ValueError("batch_size must be a positive integer")
         if not operation or not seq_params:
             return None
         self._connection.handle_unread_result()
@@ -848,10 +1195,23 @@ class MySQLCursor(CursorBase):
             if not seq_params:
                 self._rowcount = 0
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                self._executed = stmt
-                return self.execute(stmt)
+            stmts = self._batch_insert(operation, seq_params)
+            if stmts is not None:
+                rowcnt, last_insert_id = 0, None
+                for stmt in stmts:
+                    self.execute(stmt)
+                    rowcnt += self._rowcount
+                    if last_insert_id is None:
+                        # The ID generated for the first row, as when the rows
+                        # are inserted by one statement
+                        last_insert_id = self._last_insert_id
+                self._rowcount = rowcnt
+                self._last_insert_id = last_insert_id
+                return None
+
+        if batch_size:
+            self._execute_batched(operation, seq_params, batch_size)
+            return None
 
         rowcnt = 0
         try:
@@ -865,6 +1225,94 @@ class MySQLCursor(CursorBase):
         self._rowcount = rowcnt
         return None
 
+    def _execute_batched(
+        self,
+        operation: str,
+        seq_params: Iterable[ParamsSequenceOrDictType],
+        batch_size: int,
+    ) -> None:
+        """Execute the operation with the parameter sets in multi-statement batches
+
+        The results of each batch are read through the iterator returned by
+        execute() with multi=True, adding up rowcount.
+        """
+        stmts = (self._prepare_statement(operation, params) for params in seq_params)
+        rowcnt = index = 0
+        try:
+            for batch in batch_statements(
+                stmts, batch_size, self._connection.max_allowed_packet
+            ):
+                stmt = MULTI_STATEMENT_SEPARATOR.join(batch)
+                try:
+                    for _ in self.execute(stmt, multi=True):
+                        if self.with_rows and self._have_unread_result():
+                            self.fetchall()
+                        rowcnt += self._rowcount
+                        # The result sets of a procedure are followed by its status
+                        in_call = self._executed.upper().startswith(b"CALL")
+                        if self._description is None or not in_call:
+                            index += 1
+                except Error as err:
+                    raise err.__class__(
+                        msg=f"{err.msg} (executing parameter set {index})",
+                        errno=err.errno,
+                        sqlstate=err.sqlstate,
+                    ) from err
+        except (ValueError, TypeError) as err:
+            raise InterfaceError(f"Failed executing the operation; {err}") from None
+        finally:
+            self._rowcount = rowcnt
+
+    def load_rows(
+        self,
+        table: str,
+        rows: Iterable[Union[ParamsSequenceType, ParamsDictType]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Loads rows in a table using LOAD DATA LOCAL INFILE
+
+        The rows are streamed to the server as the data of a LOAD DATA LOCAL
+        INFILE statement, converted and encoded as they are consumed, so rows
+        can be an iterator and no file is written. The values are converted
+        like the parameters of execute(). Rows given as dictionaries are
+        read in the order of columns.
+
+        The connection must be opened with allow_local_infile or
+        allow_local_infile_in_path, and local_infile must be enabled on the
+        server. The rows are not subject to allow_local_infile_in_path.
+
+        Example: Loading the employees returned by a generator
+
+        cursor.load_rows("employees", read_employees(), ("name", "phone"))
+
+        The table and column names are quoted, a table name in the `db.table`
+        form is split at its first dot. The number of rows loaded is available
+        in rowcount. If a row can't be converted, the rows before it are
+        loaded and ProgrammingError is raised.
+        """
+        try:
+            if not self._connection:
+                raise ProgrammingError
+        except (ProgrammingError, ReferenceError) as err:
+            raise ProgrammingError("Cursor is not connected") from err
+
+        if not self._connection.isset_client_flag(ClientFlag.LOCAL_FILES):
+            raise NotSupportedError(
+                "load_rows() requires the allow_local_infile or "
+                "allow_local_infile_in_path connection option"
+            )
+
+        reader = LoadDataRowsReader(rows, self._connection.converter, columns)
+        # pylint: disable=protected-access
+        self._connection._local_infile_source = (LOAD_DATA_ROWS_FILE, reader)
+        try:
+            self.execute(load_data_statement(table, columns, self._connection.charset))
+        finally:
+            self._connection._local_infile_source = None
+        # pylint: enable=protected-access
+        if reader.error is not None:
+            raise reader.error
+
     def stored_results(self) -> Iterator[MySQLCursor]:
         """Returns an iterator for stored results
 
@@ -1092,34 +1540,88 @@ class MySQLCursor(CursorBase):
 
         return row
 
+    def _read_rows(self, count: int, raw: bool = False) -> None:
+        """Reads rows of the result set ahead
+
+        Reads up to count rows with a single get_rows() call, looking one
+        row ahead so the end of the result set is handled as soon as its
+        last row is read.
+        """
+        rows = []
+        if self._nextrow[0]:
+            rows.append(self._nextrow[0])
+            self._nextrow = (None, None)
+        (tmp, eof) = self._connection.get_rows(
+            count=count - len(rows) + 1,
+            binary=self._binary,
+            columns=self.description,
+            raw=raw,
+        )
+        rows.extend(tmp)
+        if eof is None:
+            self._nextrow = (rows.pop(), None)
+        else:
+            self._handle_eof(eof)
+        self._prefetched.extend(rows)
+
+    def _fetch_rows(
+        self, size: int, raw: bool = False, prefetch: int = 1
+    ) -> List[RowType]:
+        """Returns up to size rows of the result set
+
+        The rows are taken from the ones read ahead, and the missing ones,
+        at least prefetch of them, are read in a single batch.
+        """
+        missing = size - len(self._prefetched)
+        if missing > 0 and self._have_unread_result():
+            self._read_rows(max(missing, prefetch), raw)
+        rows = [
+            self._prefetched.popleft() for _ in range(min(size, len(self._prefetched)))
+        ]
+        if rows:
+            if self._rowcount == -1:
+                self._rowcount = 0
+            self._rowcount += len(rows)
+        return rows
+
+    def _fetch_remaining_rows(self, raw: Optional[bool] = None) -> List[RowType]:
+        """Returns the rows read ahead and the rest of the result set"""
+        rows = list(self._prefetched)
+        self._prefetched.clear()
+        if self._have_unread_result():
+            (tmp, eof) = self._connection.get_rows(raw=raw)
+            if self._nextrow[0]:
+                rows.append(self._nextrow[0])
+            rows.extend(tmp)
+            self._handle_eof(eof)
+        return rows
+
     def fetchone(self) -> Optional[RowType]:
         """Return next row of a query result set.
 
+        Up to arraysize rows are read from the server at once, and returned
+        by the next calls.
+
         Returns:
             tuple or None: A row from query result set.
         """
         self._check_executed()
-        return self._fetch_row()
+        rows = self._fetch_rows(1, raw=self._raw, prefetch=self.arraysize)
+        return rows[0] if rows else None
 
     def fetchmany(self, size: Optional[int] = None) -> List[RowType]:
         """Return the next set of rows of a query result set.
 
         When no more rows are available, it returns an empty list.
         The number of rows returned can be specified using the size argument,
-        which defaults to one.
+        which defaults to arraysize. The rows are read from the server in
+        a single batch.
 
         Returns:
             list: The next set of rows of a query result set.
         """
         self._check_executed()
-        res = []
-        cnt = size or self.arraysize
-        while cnt > 0 and self._have_unread_result():
-            cnt -= 1
-            row = self.fetchone()
-            if row:
-                res.append(row)
-        return res
+        return self._fetch_rows(size or self.arraysize, raw=self._raw)
 
     def fetchall(self) -> List[RowType]:
         """Return all rows of a query result set.
@@ -1128,14 +1630,10 @@ class MySQLCursor(CursorBase):
             list: A list of tuples with all rows of a query result set.
         """
         self._check_executed()
-        if not self._have_unread_result():
+        if not self._prefetched and not self._have_unread_result():
             return []
 
-        (rows, eof) = self._connection.get_rows()
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-
-        self._handle_eof(eof)
+        rows = self._fetch_remaining_rows()
         rowcount = len(rows)
         if rowcount >= 0 and self._rowcount == -1:
             self._rowcount = 0
@@ -1259,14 +1757,10 @@ class MySQLCursorBuffered(MySQLCursor):
             list: The next set of rows of a query result set.
         """
         self._check_executed()
-        res = []
-        cnt = size or self.arraysize
-        while cnt > 0:
-            cnt -= 1
-            row = self.fetchone()
-            if row:
-                res.append(row)
-
+        if self._rows is None:
+            return []
+        res = self._rows[self._next_row : self._next_row + (size or self.arraysize)]
+        self._next_row += len(res)
         return res
 
     @property
@@ -1281,15 +1775,6 @@ class MySQLCursorRaw(MySQLCursor):
 
     _raw: bool = True
 
-    def fetchone(self) -> Optional[RowType]:
-        """Return next row of a query result set.
-
-        Returns:
-            tuple or None: A row from query result set.
-        """
-        self._check_executed()
-        return self._fetch_row(raw=True)
-
     def fetchall(self) -> List[RowType]:
         """Return all rows of a query result set.
 
@@ -1297,12 +1782,9 @@ class MySQLCursorRaw(MySQLCursor):
             list: A list of tuples with all rows of a query result set.
         """
         self._check_executed()
-        if not self._have_unread_result():
+        if not self._prefetched and not self._have_unread_result():
             return []
-        (rows, eof) = self._connection.get_rows(raw=True)
-        if self._nextrow[0]:
-            rows.insert(0, self._nextrow[0])
-        self._handle_eof(eof)
+        rows = self._fetch_remaining_rows(raw=True)
         rowcount = len(rows)
         if rowcount >= 0 and self._rowcount == -1:
             self._rowcount = 0
@@ -1352,9 +1834,19 @@ class MySQLCursorBufferedRaw(MySQLCursorBuffered):
 
 
 class MySQLCursorPrepared(MySQLCursor):
-    """Cursor using MySQL Prepared Statements"""
+    """Cursor using MySQL Prepared Statements
+
+    When fetch_size is given, statements returning a result set open a
+    read-only cursor on the server, and rows are fetched in batches of
+    fetch_size rows using COM_STMT_FETCH. The connection can be used by
+    other statements between batches.
+    """
 
-    def __init__(self, connection: Optional[MySQLConnection] = None):
+    def __init__(
+        self,
+        connection: Optional[MySQLConnection] = None,
+        fetch_size: Optional[int] = None,
+    ):
         super().__init__(connection)
         self._rows: Optional[List[RowType]] = None
         self._next_row: int = 0
@@ -1363,20 +1855,61 @@ class MySQLCursorPrepared(MySQLCursor):
         self._have_result: Optional[bool] = None
         self._last_row_sent: bool = False
         self._cursor_exists: bool = False
+        self._stmt_reset_needed: bool = False
+        if fetch_size is not None and (
+            not isinstance(fetch_size, int)
+            or isinstance(fetch_size, bool)
+            or fetch_size < 1
+        ):
+            raise ValueError("fetch_size must be a positive integer")
+        self._fetch_size: Optional[int] = fetch_size
+        self._fetched_rows: Deque[RowType] = deque()
+
+    @property
+    def fetch_size(self) -> Optional[int]:
+        """Number of rows fetched at once from the server-side cursor"""
+        return self._fetch_size
 
     def reset(self, free: bool = True) -> None:
         if self._prepared:
-            try:
-                self._connection.cmd_stmt_close(self._prepared["statement_id"])
-            except Error:
-                # We tried to deallocate, but it's OK when we fail.
-                pass
+            if self._connection.prepared_statement_cache is None:
+                try:
+                    self._connection.cmd_stmt_close(self._prepared["statement_id"])
+                except Error:
+                    # We tried to deallocate, but it's OK when we fail.
+                    pass
+            elif self._cursor_exists and not self._last_row_sent:
+                try:
+                    # Close the server-side cursor of the cached statement
+                    self._connection.cmd_stmt_reset(self._prepared["statement_id"])
+                except Error:
+                    pass
+            # Cached statements are kept for reuse and deallocated on eviction
+            self._pin_prepared(False)
             self._prepared = None
         self._last_row_sent = False
         self._cursor_exists = False
+        self._stmt_reset_needed = False
+        self._fetched_rows.clear()
+
+    def _pin_prepared(self, pinned: bool) -> None:
+        """Pins or unpins the cached prepared statement of the cursor
+
+        The statement is pinned while its result set is not read, so other
+        cursors prepare their own statement instead of closing the open
+        server-side cursor or discarding the pending rows.
+        """
+        cache = self._connection.prepared_statement_cache
+        if cache is None or not self._prepared:
+            return
+        if pinned:
+            cache.pin(self._prepared, self, unread_result=not self._cursor_exists)
+        else:
+            cache.unpin(self._prepared, self)
 
     def _handle_noresultset(self, res: ResultType) -> None:
         self._handle_server_status(res.get("status_flag", res.get("server_status", 0)))
+        self._pin_prepared(False)
         super()._handle_noresultset(res)
 
     def _handle_server_status(self, flags: int) -> None:
@@ -1388,6 +1921,7 @@ class MySQLCursorPrepared(MySQLCursor):
 
     def _handle_eof(self, eof: EofPacketType) -> None:
         self._handle_server_status(eof.get("status_flag", eof.get("server_status", 0)))
+        self._pin_prepared(self._cursor_exists and not self._last_row_sent)
         super()._handle_eof(eof)
 
     def callproc(self, procname: Any, args: Any = ()) -> NoReturn:
@@ -1424,10 +1958,65 @@ class MySQLCursorPrepared(MySQLCursor):
             self._connection.unread_result = True
             self._have_result = True
 
-            if "status_flag" in result[2]:  # type: ignore[operator]
-                self._handle_server_status(result[2]["status_flag"])
-            elif "server_status" in result[2]:  # type: ignore[operator]
-                self._handle_server_status(result[2]["server_status"])
+            # No status means that no cursor was opened on the server
+            eof: EofPacketType = result[2]  # type: ignore[assignment]
+            self._handle_server_status(
+                eof.get("status_flag", eof.get("server_status", 0))
+            )
+            if self._cursor_exists:
+                # Rows stay on the server until fetched with COM_STMT_FETCH
+                self._connection.unread_result = False
+            self._pin_prepared(True)
+
+    def _fetch_from_server_cursor(self) -> Optional[RowType]:
+        """Returns the next row from the server-side cursor
+
+        Rows are fetched in batches of fetch_size rows when the rows fetched
+        previously have been consumed.
+
+        Returns a tuple or None.
+        """
+        if not self._fetched_rows:
+            if not self._cursor_exists:
+                # No cursor was opened, the rows were sent right away
+                return self._fetch_row(raw=self._raw) or None
+            if self._last_row_sent:
+                return None
+            self._connection.handle_unread_result()
+            self._connection.cmd_stmt_fetch(
+                self._prepared["statement_id"], self._fetch_size
+            )
+            (rows, eof) = self._connection.get_rows(
+                binary=self._binary, columns=self.description, raw=self._raw
+            )
+            self._fetched_rows.extend(rows)
+            self._handle_eof(eof)
+            if not self._fetched_rows:
+                return None
+        if self._rowcount == -1:
+            self._rowcount = 1
+        else:
+            self._rowcount += 1
+        return self._fetched_rows.popleft()
+
+    def _check_params(self, params: ParamsSequenceType) -> None:
+        """Check the parameters given to the prepared statement
+
+        Raises ProgrammingError when the parameters are not a tuple or list,
+        or when their number does not match the statement.
+        """
+        if not isinstance(params, (tuple, list)):
+            raise ProgrammingError(
+                errno=1210,
+                msg=f"Incorrect type of argument: {type(params).__name__}({params})"
+                ", it must be of type tuple or list the argument given to "
+                "the prepared statement",
+            )
+        if len(self._prepared["parameters"]) != len(params):
+            raise ProgrammingError(
+                errno=1210,
+                msg="Incorrect number of arguments executing prepared statement",
+            )
 
     def execute(
         self,
@@ -1467,8 +2056,9 @@ class MySQLCursorPrepared(MySQLCursor):
             # Convert %(name)s to ? before sending it to MySQL
             operation = re.sub(RE_SQL_PYTHON_REPLACE_PARAM, "?", operation)
 
-        if operation is not self._executed:
-            if self._prepared:
+        cache = self._connection.prepared_statement_cache
+        if operation is not self._executed or cache is not None:
+            if self._prepared and cache is None:
                 self._connection.cmd_stmt_close(self._prepared["statement_id"])
             self._executed = operation
 
@@ -1482,35 +2072,48 @@ class MySQLCursorPrepared(MySQLCursor):
                 operation = re.sub(RE_SQL_FIND_PARAM, b"?", operation)
 
             try:
-                self._prepared = self._connection.cmd_stmt_prepare(operation)
+                if cache is not None:
+                    # The cached statement may have been evicted or invalidated,
+                    # or be pinned by another cursor
+                    self._pin_prepared(False)
+                    prepared = self._connection.get_prepared_statement(operation)
+                else:
+                    prepared = self._connection.cmd_stmt_prepare(operation)
             except Error:
                 self._executed = None
                 raise
-
-        self._connection.cmd_stmt_reset(self._prepared["statement_id"])
+            if prepared is not self._prepared:
+                # A freshly prepared statement has nothing to reset
+                self._prepared = prepared
+                self._stmt_reset_needed = self._cursor_exists = False
+
+        if (
+            self._stmt_reset_needed
+            or self._cursor_exists
+            and not self._last_row_sent
+            or self._connection.unread_result
+        ):
+            # Discard long data, open server-side cursor or pending result set,
+            # otherwise COM_STMT_RESET is a wasted round trip
+            self._connection.cmd_stmt_reset(self._prepared["statement_id"])
+            self._stmt_reset_needed = False
 
         if self._prepared["parameters"] and not params:
             return
         if params:
-            if not isinstance(params, (tuple, list)):
-                raise ProgrammingError(
-                    errno=1210,
-                    msg=f"Incorrect type of argument: {type(params).__name__}({params})"
-                    ", it must be of type tuple or list the argument given to "
-                    "the prepared statement",
-                )
-            if len(self._prepared["parameters"]) != len(params):
-                raise ProgrammingError(
-                    errno=1210,
-                    msg="Incorrect number of arguments executing prepared statement",
-                )
+            self._check_params(params)
 
         if params is None:
             params = ()
+        if any(isinstance(param, IOBase) for param in params):
+            # Sent using COM_STMT_SEND_LONG_DATA, discarded by COM_STMT_RESET
+            self._stmt_reset_needed = True
+        self._fetched_rows.clear()
         res = self._connection.cmd_stmt_execute(
             self._prepared["statement_id"],
             data=params,
             parameters=self._prepared["parameters"],
+            flags=CursorType.READ_ONLY if self._fetch_size else CursorType.NO_CURSOR,
         )
         self._handle_result(res)
 
@@ -1518,6 +2121,7 @@ class MySQLCursorPrepared(MySQLCursor):
         self,
         operation: str,
         seq_params: Sequence[ParamsSequenceType],
+        pipeline_size: Optional[int] = None,
     ) -> None:
         """Prepare and execute a MySQL Prepared Statement many times
 
@@ -1527,19 +2131,106 @@ class MySQLCursorPrepared(MySQLCursor):
         If the cursor instance already had a prepared statement, it is
         first closed.
 
-        executemany() simply calls execute().
-        """
+        executemany() simply calls execute(), unless pipeline_size is given.
+        Then, when the statement does not return a result set, the remaining
+        parameter sets are sent without waiting for the response of the
+        previous one, keeping at most pipeline_size executions in flight.
+        When an execution fails, the remaining parameter sets are not sent,
+        but the ones already in flight are still executed by the server. The
+        error raised tells which parameter set failed, and rowcount holds the
+        rows affected by the successful executions. The parameter sets are
+        taken from seq_params as they are sent; an invalid one stops the
+        pipeline the same way, its error is raised once the executions in
+        flight are done.
+        """
+        if pipeline_size is not None and (
+            not isinstance(pipeline_size, int)
+            or isinstance(pipeline_size, bool)
+            or pipeline_size < 1
+        ):
+            raise ValueError("pipeline_size must be a positive integer")
         rowcnt = 0
         try:
-            for params in seq_params:
+            params_iter = iter(seq_params)
+            for params in params_iter:
                 self.execute(operation, params)
                 if self.with_rows and self._have_unread_result():
                     self.fetchall()
                 rowcnt += self._rowcount
+                if pipeline_size and not self.with_rows and not self._stmt_reset_needed:
+                    self._rowcount = rowcnt
+                    self._execute_pipelined(operation, params_iter, pipeline_size)
+                    return
         except (ValueError, TypeError) as err:
             raise InterfaceError(f"Failed executing the operation; {err}") from None
         self._rowcount = rowcnt
 
+    def _execute_pipelined(
+        self,
+        operation: StrOrBytes,
+        seq_params: Iterator[ParamsSequenceOrDictType],
+        pipeline_size: int,
+    ) -> None:
+        """Execute the prepared statement with the remaining parameter sets
+
+        The first parameter set has already been executed, and the number of
+        rows it affected is in rowcount.
+        """
+        if isinstance(operation, bytes):
+            operation = operation.decode(self._connection.python_charset)
+        replacement_keys = re.findall(RE_SQL_PYTHON_CAPTURE_PARAM_NAME, operation)
+        indexes: List[int] = []
+        invalid: List[ProgrammingError] = []
+
+        def seq_data() -> Iterator[ParamsSequenceType]:
+            # Parameter sets are checked as they are sent, an invalid one ends
+            # the pipeline and is reported once the previous ones are executed
+            for index, params in enumerate(seq_params, start=1):
+                try:
+                    if isinstance(params, dict):
+                        try:
+                            params = tuple(params[key] for key in replacement_keys)
+                        except KeyError as err:
+                            raise ProgrammingError(
+                                "Not all placeholders were found in the parameters "
+                                "dict"
+                            ) from err
+                    if self._prepared["parameters"] and not params:
+                        continue
+                    if params:
+                        self._check_params(params)
+                except ProgrammingError as err:
+                    invalid.append(err)
+                    return
+                indexes.append(index)
+                yield params or ()
+
+        results = self._connection.cmd_stmt_execute_pipelined(
+            self._prepared["statement_id"],
+            seq_data(),
+            self._prepared["parameters"],
+            window=pipeline_size,
+        )
+        rowcnt = self._rowcount
+        error = None
+        for index, result in zip(indexes, results):
+            if isinstance(result, Error):
+                if error is None:
+                    error = (index, result)
+                continue
+            self._handle_noresultset(result)
+            rowcnt += self._rowcount
+        self._rowcount = rowcnt
+        if error:
+            index, exc = error
+            raise exc.__class__(
+                msg=f"{exc.msg} (executing parameter set {index})",
+                errno=exc.errno,
+                sqlstate=exc.sqlstate,
+            ) from exc
+        if invalid:
+            raise invalid[0]
+
     def fetchone(self) -> Optional[RowType]:
         """Return next row of a query result set.
 
@@ -1547,6 +2238,8 @@ class MySQLCursorPrepared(MySQLCursor):
             tuple or None: A row from query result set.
         """
         self._check_executed()
+        if self._fetch_size:
+            return self._fetch_from_server_cursor()
         if self._cursor_exists:
             self._connection.cmd_stmt_fetch(self._prepared["statement_id"])
         return self._fetch_row() or None
@@ -1564,6 +2257,14 @@ class MySQLCursorPrepared(MySQLCursor):
         self._check_executed()
         res = []
         cnt = size or self.arraysize
+        if self._fetch_size:
+            while cnt > 0:
+                cnt -= 1
+                row = self._fetch_from_server_cursor()
+                if row is None:
+                    break
+                res.append(row)
+            return res
         while cnt > 0 and self._have_unread_result():
             cnt -= 1
             row = self._fetch_row()
@@ -1578,6 +2279,8 @@ class MySQLCursorPrepared(MySQLCursor):
             list: A list of tuples with all rows of a query result set.
         """
         self._check_executed()
+        if self._fetch_size:
+            return list(iter(self._fetch_from_server_cursor, None))
         rows = []
         if self._nextrow[0]:
             rows.append(self._nextrow[0])
@@ -1626,6 +2329,21 @@ class MySQLCursorDict(MySQLCursor):
         """
         return self._row_to_python(super().fetchone(), self.description)
 
+    def fetchmany(
+        self, size: Optional[int] = None
+    ) -> List[Optional[Dict[str, RowItemType]]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of dictionaries with the next set of rows of a query
+                  result set where column names are used as keys.
+        """
+        return [
+            self._row_to_python(row, self.description)
+            for row in super().fetchmany(size)
+            if row
+        ]
+
     def fetchall(self) -> List[Optional[Dict[str, RowItemType]]]:
         """Return all rows of a query result set.
 
@@ -1685,6 +2403,18 @@ class MySQLCursorNamedTuple(MySQLCursor):
             else row
         )
 
+    def fetchmany(self, size: Optional[int] = None) -> List[Optional[RowType]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of tuples with the next set of rows of a query result set.
+        """
+        return [
+            self._row_to_python(row, self.description)
+            for row in super().fetchmany(size)
+            if row
+        ]
+
     def fetchall(self) -> List[Optional[RowType]]:
         """Return all rows of a query result set.
 
@@ -1715,6 +2445,17 @@ class MySQLCursorBufferedDict(MySQLCursorDict, MySQLCursorBuffered):
             return self._row_to_python(row, self.description)
         return None
 
+    def fetchmany(
+        self, size: Optional[int] = None
+    ) -> List[Optional[Dict[str, RowItemType]]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of dictionaries with the next set of rows of a query
+                  result set.
+        """
+        return super().fetchmany(size)
+
     def fetchall(self) -> List[Optional[Dict[str, RowItemType]]]:
         """Return all rows of a query result set.
 
@@ -1747,6 +2488,15 @@ class MySQLCursorBufferedNamedTuple(MySQLCursorNamedTuple, MySQLCursorBuffered):
             return self._row_to_python(row, self.description)
         return None
 
+    def fetchmany(self, size: Optional[int] = None) -> List[Optional[RowType]]:
+        """Return the next set of rows of a query result set.
+
+        Returns:
+            list: A list of named tuples with the next set of rows of a query
+                  result set.
+        """
+        return super().fetchmany(size)
+
     def fetchall(self) -> List[Optional[RowType]]:
         """Return all rows of a query result set.
 
@@ -1780,46 +2530,12 @@ class MySQLCursorPreparedDict(MySQLCursorDict, MySQLCursorPrepared):  # type: ig
     4. MySQLCursor (base class)
     """
 
-    def fetchmany(self, size: Optional[int] = None) -> List[Dict[str, RowItemType]]:
-        """Return the next set of rows of a query result set.
-
-        When no more rows are available, it returns an empty list.
-        The number of rows returned can be specified using the size argument,
-        which defaults to one.
-
-        Returns:
-            list: The next set of rows of a query result set represented
-                  as a list of dictionaries where column names are used as keys.
-        """
-        return [
-            self._row_to_python(row, self.description)
-            for row in super().fetchmany(size=size)
-            if row
-        ]
-
 
 class MySQLCursorPreparedNamedTuple(MySQLCursorNamedTuple, MySQLCursorPrepared):
     """
     This class is a blend of features from MySQLCursorNamedTuple and MySQLCursorPrepared
     """
 
-    def fetchmany(self, size: Optional[int] = None) -> List[RowType]:
-        """Return the next set of rows of a query result set.
-
-        When no more rows are available, it returns an empty list.
-        The number of rows returned can be specified using the size argument,
-        which defaults to one.
-
-        Returns:
-            list: The next set of rows of a query result set represented
-                  as a list of named tuples where column names are used as names.
-        """
-        return [
-            self._row_to_python(row, self.description)
-            for row in super().fetchmany(size=size)
-            if row
-        ]
-
 
 class MySQLCursorPreparedRaw(MySQLCursorPrepared):
     """
@@ -1834,6 +2550,8 @@ class MySQLCursorPreparedRaw(MySQLCursorPrepared):
         Returns:
             tuple or None: A row from query result set.
         """
+        if self._fetch_size:
+            return super().fetchone()
         self._check_executed()
         if self._cursor_exists:
             self._connection.cmd_stmt_fetch(self._prepared["statement_id"])
@@ -1849,6 +2567,8 @@ class MySQLCursorPreparedRaw(MySQLCursorPrepared):
         Returns:
             list: The next set of rows of a query result set.
         """
+        if self._fetch_size:
+            return super().fetchmany(size)
         self._check_executed()
         res = []
         cnt = size or self.arraysize
@@ -1865,6 +2585,8 @@ class MySQLCursorPreparedRaw(MySQLCursorPrepared):
         Returns:
             list: A list of tuples with all rows of a query result set.
         """
+        if self._fetch_size:
+            return super().fetchall()
         self._check_executed()
         rows = []
         if self._nextrow[0]:
@@ -41,6 +41,7 @@ from typing import (
     Any,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
     NoReturn,
@@ -57,6 +58,7 @@ from .types import (
     CextEofPacketType,
     CextResultType,
     DescriptionType,
+    ParamsDictType,
     ParamsSequenceOrDictType,
     ParamsSequenceType,
     RowItemType,
@@ -75,16 +77,19 @@ from .abstracts import (
     MySQLCursorAbstract,
 )
 from .cursor import (
-    RE_PY_PARAM,
-    RE_SQL_COMMENT,
+    MULTI_STATEMENT_SEPARATOR,
     RE_SQL_FIND_PARAM,
     RE_SQL_INSERT_STMT,
-    RE_SQL_INSERT_VALUES,
-    RE_SQL_ON_DUPLICATE,
     RE_SQL_PYTHON_CAPTURE_PARAM_NAME,
     RE_SQL_PYTHON_REPLACE_PARAM,
+    batch_insert_statements,
+    batch_statements,
+    compile_format_template,
+    compile_insert_template,
+    encode_operation,
     is_eol_comment,
     parse_multi_statement_query,
+    substitute_params,
 )
 from .errorcode import CR_NO_RESULT_SET
 from .errors import (
@@ -101,32 +106,6 @@ if TYPE_CHECKING:
 ERR_NO_RESULT_TO_FETCH = "No result set to fetch from"
 
 
-class _ParamSubstitutor:
-
-    """
-    Substitutes parameters into SQL statement.
-    """
-
-    def __init__(self, params: Sequence[bytes]) -> None:
-        self.params: Sequence[bytes] = params
-        self.index: int = 0
-
-    def __call__(self, matchobj: object) -> bytes:
-        index = self.index
-        self.index += 1
-        try:
-            return self.params[index]
-        except IndexError:
-            raise ProgrammingError(
-                "Not enough parameters for the SQL statement"
-            ) from None
-
-    @property
-    def remaining(self) -> int:
-        """Returns number of parameters remaining to be substituted"""
-        return len(self.params) - self.index
-
-
 class CMySQLCursor(MySQLCursorAbstract):
 
     """Default cursor for interacting with MySQL using C Extension"""
@@ -325,6 +304,30 @@ class CMySQLCursor(MySQLCursorAbstract):
             except StopIteration:
                 return
 
+    def _prepare_statement(
+        self,
+        operation: StrOrBytes,
+        params: ParamsSequenceOrDictType = (),
+    ) -> bytes:
+        """Prepare the statement for execution
+
+        Converts the operation to bytes and substitutes the parameters in
+        the placeholders.
+        """
+        if isinstance(operation, bytearray):
+            operation = bytes(operation)
+        charset = self._cnx.python_charset
+        if not params:
+            return encode_operation(operation, charset)
+
+        prepared = self._cnx.prepare_for_mysql(params)
+        if isinstance(prepared, dict):
+            stmt = encode_operation(operation, charset)
+            for key, value in prepared.items():
+                stmt = stmt.replace(f"%({key})s".encode(), value)
+            return stmt
+        return substitute_params(compile_format_template(operation, charset), prepared)
+
     def execute(
         self,
         operation: StrOrBytes,
@@ -346,29 +349,8 @@ class CMySQLCursor(MySQLCursorAbstract):
             raise ProgrammingError("Cursor is not connected", 2055) from err
         self._cnx.handle_unread_result()
 
-        stmt = b""
         self.reset()
-
-        try:
-            if isinstance(operation, str):
-                stmt = operation.encode(self._cnx.python_charset)
-            else:
-                stmt = operation
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise ProgrammingError(str(err)) from err
-
-        if params:
-            prepared = self._cnx.prepare_for_mysql(params)
-            if isinstance(prepared, dict):
-                for key, value in prepared.items():
-                    stmt = stmt.replace(f"%({key})s".encode(), value)
-            elif isinstance(prepared, (list, tuple)):
-                psub = _ParamSubstitutor(prepared)
-                stmt = RE_PY_PARAM.sub(psub, stmt)
-                if psub.remaining != 0:
-                    raise ProgrammingError(
-                        "Not all parameters were used in the SQL statement"
-                    )
+        stmt = self._prepare_statement(operation, params)
 
         try:
             result = self._cnx.cmd_query(
@@ -393,68 +375,51 @@ class CMySQLCursor(MySQLCursorAbstract):
     def _batch_insert(
         self,
         operation: str,
-        seq_params: Sequence[ParamsSequenceOrDictType],
-    ) -> Optional[bytes]:
-        """Implements multi row insert"""
-
-        def remove_comments(match: re.Match) -> str:
-            """Remove comments from INSERT statements.
-
-            This function is used while removing comments from INSERT
-            statements. If the matched string is a comment not enclosed
-            by quotes, it returns an empty string, else the string itself.
-            """
-            if match.group(1):
-                return ""
-            return match.group(2)
-
-        tmp = re.sub(
-            RE_SQL_ON_DUPLICATE,
-            "",
-            re.sub(RE_SQL_COMMENT, remove_comments, operation),
-        )
+        seq_params: Iterable[ParamsSequenceOrDictType],
+    ) -> Optional[Generator[bytes, None, None]]:
+        """Implements multi row insert
+
+        Returns a generator of the multi-row INSERT statements, each one holding as
+        many rows as fit in the connection's `max_allowed_packet`, or None when the
+        statement can not be rewritten. All the parameter sets are converted
+        before returning, so that an invalid one raises before any row is inserted.
+        """
 
-        matches = re.search(RE_SQL_INSERT_VALUES, tmp)
-        if not matches:
-            raise InterfaceError(
-                "Failed rewriting statement for multi-row INSERT. Check SQL syntax"
-            )
-        fmt = matches.group(1).encode(self._cnx.python_charset)
-        values = []
+        charset = self._cnx.python_charset
+        stmt, fmt = compile_insert_template(operation, charset)
+        if fmt not in stmt:
+            return None
 
-        try:
-            stmt = operation.encode(self._cnx.python_charset)
-            for params in seq_params:
-                tmp = fmt
-                prepared = self._cnx.prepare_for_mysql(params)
-                if isinstance(prepared, dict):
-                    for key, value in prepared.items():
-                        tmp = tmp.replace(
-                            f"%({key})s".encode(), value  # type: ignore[arg-type]
-                        )
-                elif isinstance(prepared, (list, tuple)):
-                    psub = _ParamSubstitutor(prepared)
-                    tmp = RE_PY_PARAM.sub(psub, tmp)  # type: ignore[call-overload]
-                    if psub.remaining != 0:
-                        raise ProgrammingError(
-                            "Not all parameters were used in the SQL statement"
+        def rows() -> Generator[bytes, None, None]:
+            """Substitute the parameters in the row of values."""
+            try:
+                for params in seq_params:
+                    tmp = fmt
+                    prepared = self._cnx.prepare_for_mysql(params)
+                    if isinstance(prepared, dict):
+                        for key, value in prepared.items():
+                            tmp = tmp.replace(
+                                f"%({key})s".encode(), value  # type: ignore[arg-type]
+                            )
+                    elif isinstance(prepared, (list, tuple)):
+                        tmp = substitute_params(
+                            compile_format_template(fmt, charset), prepared
                         )
-                values.append(tmp)
+                    yield tmp
+            except (UnicodeDecodeError, UnicodeEncodeError) as err:
+                raise ProgrammingError(str(err)) from err
+            except Exception as err:
+                raise InterfaceError(f"Failed executing the operation; {err}") from None
 
-            if fmt in stmt:
-                stmt = stmt.replace(fmt, b",".join(values), 1)  # type: ignore[arg-type]
-                self._executed = stmt
-                return stmt
-            return None
-        except (UnicodeDecodeError, UnicodeEncodeError) as err:
-            raise ProgrammingError(str(err)) from err
-        except Exception as err:
-            raise InterfaceError(f"Failed executing the operation; {err}") from None
+        return batch_insert_statements(
+            stmt, fmt, list(rows()), self._cnx.max_allowed_packet
+        )
 
     def executemany(
         self,
         operation: str,
         seq_params: Sequence[ParamsSequenceOrDictType],
+        batch_size: Optional[int] = None,
     ) -> Optional[Generator[CMySQLCursor, None, None]]:
         """Execute the given operation multiple times
 
@@ -472,11 +437,29 @@ class CMySQLCursor(MySQLCursorAbstract):
         cursor.executemany(stmt, data)
 
         INSERT statements are optimized by batching the data, that is
-        using the MySQL multiple rows syntax.
+        using the MySQL multiple rows syntax. The rows are sent in as many
+        statements as needed to fit in the connection's `max_allowed_packet`.
+        All the parameter sets are converted before the first statement is
+        sent. When a statement fails, the rows inserted by the previous ones
+        are kept unless the transaction is rolled back.
+
+        Other statements are executed once per parameter set, unless
+        batch_size is given. Then, up to batch_size statements are sent at
+        once in a multi-statement query fitting in max_allowed_packet, and
+        the operation must be a single statement. When a statement fails,
+        the following ones in its batch are not executed. The error raised
+        tells which parameter set failed, and rowcount holds the rows
+        affected by the statements executed before it.
 
         Results are discarded! If they are needed, consider looping over
         data using the execute() method.
         """
+        if batch_size is not None and (
+            not isinstance(batch_size, int)
+            or isinstance(batch_size, bool)
+            or batch_size < 1
+        ):
+            raise ValueError("batch_size must be a positive integer")
         if not operation or not seq_params:
             return None
 
@@ -487,18 +470,35 @@ class CMySQLCursor(MySQLCursorAbstract):
             raise ProgrammingError("Cursor is not connected") from err
         self._cnx.handle_unread_result()
 
-        if not isinstance(seq_params, (list, tuple)):
-            raise ProgrammingError("Parameters for query must be list or tuple.")
+        try:
+            _ = iter(seq_params)
+        except TypeError as err:
+            raise ProgrammingError("Parameters for query must be an Iterable") from err
 
         # Optimize INSERTs by batching them
         if re.match(RE_SQL_INSERT_STMT, operation):
             if not seq_params:
                 self._rowcount = 0
                 return None
-            stmt = self._batch_insert(operation, seq_params)
-            if stmt is not None:
-                self._executed = stmt
-                return self.execute(stmt)
+            stmts = self._batch_insert(operation, seq_params)
+            if stmts is not None:
+                affected_rows, last_insert_id = 0, None
+                for stmt in stmts:
+                    self.execute(stmt)
+                    affected_rows += self._affected_rows
+                    if last_insert_id is None:
+                        # The ID generated for the first row, as when the rows
+                        # are inserted by one statement
+                        last_insert_id = self._last_insert_id
+                self._rowcount = -1
+                self._affected_rows = affected_rows
+                if last_insert_id is not None:
+                    self._last_insert_id = last_insert_id
+                return None
+
+        if batch_size:
+            self._execute_batched(operation, seq_params, batch_size)
+            return None
 
         rowcnt = 0
         try:
@@ -518,6 +518,67 @@ class CMySQLCursor(MySQLCursorAbstract):
         self._rowcount = rowcnt
         return None
 
+    def _execute_batched(
+        self,
+        operation: str,
+        seq_params: Iterable[ParamsSequenceOrDictType],
+        batch_size: int,
+    ) -> None:
+        """Execute the operation with the parameter sets in multi-statement batches
+
+        The results of each batch are read through the iterator returned by
+        execute() with multi=True, adding up rowcount.
+        """
+        stmts = (self._prepare_statement(operation, params) for params in seq_params)
+        rowcnt = index = 0
+        try:
+            for batch in batch_statements(
+                stmts, batch_size, self._cnx.max_allowed_packet
+            ):
+                stmt = MULTI_STATEMENT_SEPARATOR.join(batch)
+                try:
+                    for _ in self.execute(stmt, multi=True):
+                        if self.with_rows and self._cnx.unread_result:
+                            self.fetchall()
+                        if self.description:
+                            rowcnt += self._rowcount
+                        else:
+                            rowcnt += self._affected_rows
+                        # The result sets of a procedure are followed by its status
+                        in_call = self._executed.upper().startswith(b"CALL")
+                        if not self.description or not in_call:
+                            index += 1
+                except MySQLInterfaceError as err:
+                    raise get_mysql_exception(
+                        msg=f"{err.msg} (executing parameter set {index})",
+                        errno=err.errno,
+                        sqlstate=err.sqlstate,
+                    ) from err
+                except Error as err:
+                    raise err.__class__(
+                        msg=f"{err.msg} (executing parameter set {index})",
+                        errno=err.errno,
+                        sqlstate=err.sqlstate,
+                    ) from err
+        except (ValueError, TypeError) as err:
+            raise InterfaceError(f"Failed executing the operation; {err}") from None
+        finally:
+            self._rowcount = rowcnt
+
+    def load_rows(
+        self,
+        table: str,
+        rows: Iterable[Union[ParamsSequenceType, ParamsDictType]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> NoReturn:
+        """Loads rows in a table using LOAD DATA LOCAL INFILE
+
+        Not supported with the C Extension.
+        """
+        raise NotSupportedError(
+            "load_rows() is not supported by the C Extension, use use_pure=True"
+        )
+
     @property
     def description(self) -> Optional[List[DescriptionType]]:
         """Returns description of columns in a result"""
@@ -1068,9 +1129,25 @@ class CMySQLCursorPrepared(CMySQLCursor):
         self._binary: bool = True
         self._stmt: Optional[CMySQLPrepStmt] = None
 
+    def _pin_stmt(self, pinned: bool) -> None:
+        """Pins or unpins the cached prepared statement of the cursor
+
+        The statement is pinned while its result set is not read, so other
+        cursors prepare their own statement instead of discarding the
+        pending rows.
+        """
+        cache = self._cnx.prepared_statement_cache
+        if cache is None or not self._stmt:
+            return
+        if pinned:
+            cache.pin(self._stmt, self, unread_result=True)
+        else:
+            cache.unpin(self._stmt, self)
+
     def _handle_eof(self) -> None:
         """Handle EOF packet"""
         self._nextrow = (None, None)
+        self._pin_stmt(False)
         self._handle_warnings()
 
     def _fetch_row(self, raw: bool = False) -> Optional[RowType]:
@@ -1128,14 +1205,19 @@ class CMySQLCursorPrepared(CMySQLCursor):
         """
         if self._stmt:
             self.reset()
-            self._cnx.cmd_stmt_close(self._stmt)
+            if self._cnx.prepared_statement_cache is None:
+                # Cached statements are deallocated on eviction
+                self._cnx.cmd_stmt_close(self._stmt)
             self._stmt = None
         super().close()
 
     def reset(self, free: bool = True) -> None:
         """Resets the prepared statement."""
-        if self._stmt:
+        cache = self._cnx.prepared_statement_cache
+        if self._stmt and (cache is None or cache.is_pinned(self._stmt, self)):
+            # A cached statement not pinned might be in use by another cursor
             self._cnx.cmd_stmt_reset(self._stmt)
+        self._pin_stmt(False)
         super().reset(free=free)
 
     def execute(
@@ -1187,8 +1269,9 @@ class CMySQLCursorPrepared(CMySQLCursor):
             # Convert %(name)s to ? before sending it to MySQL
             operation = re.sub(RE_SQL_PYTHON_REPLACE_PARAM, "?", operation)
 
-        if operation is not self._executed:
-            if self._stmt:
+        cache = self._cnx.prepared_statement_cache
+        if operation is not self._executed or cache is not None:
+            if self._stmt and cache is None:
                 self._cnx.cmd_stmt_close(self._stmt)
             self._executed = operation
 
@@ -1202,7 +1285,13 @@ class CMySQLCursorPrepared(CMySQLCursor):
                 operation = re.sub(RE_SQL_FIND_PARAM, b"?", operation)
 
             try:
-                self._stmt = self._cnx.cmd_stmt_prepare(operation)
+                if cache is not None:
+                    # The cached statement may have been evicted or invalidated,
+                    # or be pinned by another cursor
+                    self._pin_stmt(False)
+                    self._stmt = self._cnx.get_prepared_statement(operation)
+                else:
+                    self._stmt = self._cnx.cmd_stmt_prepare(operation)
             except Error:
                 self._executed = None
                 self._stmt = None
@@ -1231,6 +1320,7 @@ class CMySQLCursorPrepared(CMySQLCursor):
         res = self._cnx.cmd_stmt_execute(self._stmt, *params)
         if res:
             self._handle_result(res)
+        self._pin_stmt(bool(self._stmt.have_result_set))
 
     def executemany(
         self, operation: str, seq_params: Sequence[ParamsSequenceType]
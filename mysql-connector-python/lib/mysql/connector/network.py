@@ -36,7 +36,7 @@ import zlib
 
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Any, Deque, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple, Union
 
 try:
     import ssl
@@ -53,6 +53,18 @@ except ImportError:
     TLS_V1_3_SUPPORTED = False
     ssl = None
 
+try:
+    import zstandard as zstd
+
+    HAVE_ZSTD = True
+except ImportError:
+    HAVE_ZSTD = False
+
+from .constants import (
+    COMPRESSION_ALGORITHMS,
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
+    ClientFlag,
+)
 from .errors import (
     InterfaceError,
     NotSupportedError,
@@ -64,6 +76,138 @@ MIN_COMPRESS_LENGTH = 50
 MAX_PAYLOAD_LENGTH = 2**24 - 1
 PACKET_HEADER_LENGTH = 4
 COMPRESSED_PACKET_HEADER_LENGTH = 7
+MIN_READ_BUFFER_SIZE = 4096
+DEFAULT_READ_BUFFER_SIZE = 65536
+
+COMPRESSION_ALGORITHMS_ERROR = (
+    "compression_algorithms must be a list with one or more of the algorithms "
+    "in {1}, found: '{0}'"
+)
+
+
+def get_compression_codec(
+    algorithm: str = "zlib", level: Optional[int] = None
+) -> Tuple[Callable[[bytes], bytes], Callable[[bytes, int], bytes]]:
+    """Get the functions compressing and decompressing packet payloads.
+
+    Args:
+        algorithm: Compression algorithm, either `zlib` or `zstd`.
+        level: Compression level, only used by `zstd`.
+
+    Returns:
+        A `(compress, decompress)` tuple. `decompress` takes the compressed
+        payload and the length of the uncompressed payload.
+
+    Raises:
+        NotSupportedError: If the algorithm is unknown or the `zstandard` package
+                           is not installed.
+    """
+    if algorithm == "zlib":
+        return zlib.compress, lambda payload, _: zlib.decompress(payload)
+    if algorithm == "zstd":
+        if not HAVE_ZSTD:
+            raise NotSupportedError(
+                "The zstd compression algorithm requires the 'zstandard' package"
+            )
+        compressor = zstd.ZstdCompressor(level=level or DEFAULT_ZSTD_COMPRESSION_LEVEL)
+        decompressor = zstd.ZstdDecompressor()
+        return compressor.compress, lambda payload, size: decompressor.decompress(
+            payload, max_output_size=size
+        )
+    raise NotSupportedError(f"Unsupported compression algorithm '{algorithm}'")
+
+
+def validate_compression_options(
+    compression_algorithms: Optional[Union[str, Sequence[str]]],
+    zstd_compression_level: Optional[int],
+) -> Tuple[Optional[Tuple[str, ...]], int]:
+    """Validate the compression_algorithms and zstd_compression_level options.
+
+    Args:
+        compression_algorithms: Algorithms to negotiate, in order of preference,
+                                as a sequence or a comma-separated string.
+        zstd_compression_level: Compression level used by `zstd`.
+
+    Returns:
+        A `(compression_algorithms, zstd_compression_level)` tuple, with the
+        algorithms in lower case, or `None` when they are not given, and the
+        default level when it is not given.
+
+    Raises:
+        AttributeError: If an option is not valid.
+    """
+    algorithms = compression_algorithms
+    if algorithms is not None:
+        if isinstance(algorithms, str):
+            algorithms = algorithms.split(",")
+        try:
+            algorithms = tuple(name.strip().lower() for name in algorithms)
+        except (AttributeError, TypeError):
+            algorithms = ()
+        if not algorithms or not set(algorithms) <= set(COMPRESSION_ALGORITHMS):
+            raise AttributeError(
+                COMPRESSION_ALGORITHMS_ERROR.format(
+                    compression_algorithms, ", ".join(COMPRESSION_ALGORITHMS)
+                )
+            )
+
+    level = zstd_compression_level
+    if level is None:
+        level = DEFAULT_ZSTD_COMPRESSION_LEVEL
+    elif not isinstance(level, int) or isinstance(level, bool) or not 1 <= level <= 22:
+        raise AttributeError(
+            "zstd_compression_level must be an integer between 1 and 22, "
+            f"found: '{level}'"
+        )
+    return algorithms, level
+
+
+def negotiate_compression(
+    compression_algorithms: Optional[Tuple[str, ...]],
+    compress: bool,
+    server_capabilities: int,
+) -> Tuple[Optional[str], int]:
+    """Choose the compression algorithm used by a connection.
+
+    The algorithms in `compression_algorithms` are tried in order and the first
+    one supported by both ends is used (`zstd` also needs the `zstandard`
+    package). If none of them is available the connection falls back to `zlib`,
+    or to no compression when the server doesn't support `zlib` either. Without
+    `compression_algorithms`, `zlib` is used when `compress` is true.
+
+    The result only depends on the options and on the server, so each
+    handshake negotiates the compression again, for instance when reconnecting
+    to another server.
+
+    Args:
+        compression_algorithms: Validated `compression_algorithms` option.
+        compress: Whether the `compress` option is set.
+        server_capabilities: Capability flags sent by the server in the initial
+                             handshake.
+
+    Returns:
+        A `(algorithm, client_flag)` tuple: `zlib`, `zstd` or `None` when the
+        connection is not compressed, and the client flag requesting it or 0.
+    """
+    algorithms = compression_algorithms
+    if algorithms is None:
+        algorithms = ("zlib",) if compress else ()
+
+    available = {"uncompressed"}
+    if server_capabilities & ClientFlag.COMPRESS:
+        available.add("zlib")
+    if HAVE_ZSTD and server_capabilities & ClientFlag.ZSTD_COMPRESSION_ALGORITHM:
+        available.add("zstd")
+
+    algorithm = next((name for name in algorithms if name in available), None)
+    if algorithm is None and algorithms:
+        algorithm = "zlib" if "zlib" in available else "uncompressed"
+
+    if algorithm == "zlib":
+        return algorithm, ClientFlag.COMPRESS
+    if algorithm == "zstd":
+        return algorithm, ClientFlag.ZSTD_COMPRESSION_ALGORITHM
+    return None, 0
 
 
 def _strioerror(err: IOError) -> str:
@@ -242,13 +386,109 @@ class NetworkBrokerPlain(NetworkBroker):
             ) from err
 
 
+class NetworkBrokerBuffered(NetworkBrokerPlain):
+    """Broker class for MySQL socket communication using a read-ahead buffer.
+
+    Instead of issuing one `recv_into()` call for the header and another one for
+    the payload of every packet, the broker pulls as many bytes as the socket has
+    available (up to `buffer_size`) into a reusable buffer and splits out packets
+    from it. Packets which span chunk boundaries are completed with further reads,
+    and packets larger than the buffer (e.g. the `0xffffff` continuation packets
+    of a multi-packet row) are read straight into their own memory.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_READ_BUFFER_SIZE) -> None:
+        super().__init__()
+        buffer_size = max(buffer_size, MIN_READ_BUFFER_SIZE)
+        self._buffer: bytearray = bytearray(buffer_size)
+        self._buffer_view: memoryview = memoryview(self._buffer)
+        self._buffer_size: int = buffer_size
+        self._read_pos: int = 0  # position of the next unread byte
+        self._write_pos: int = 0  # end of the data pulled from the socket
+
+    @property
+    def buffered_size(self) -> int:
+        """Number of bytes read from the socket not yet handed out as packets."""
+        return self._write_pos - self._read_pos
+
+    def _fill_buffer(self, sock: socket.socket, size: int) -> None:
+        """Make sure at least `size` unread bytes are available in the buffer.
+
+        `size` must not be greater than the buffer size.
+        """
+        if self._read_pos + size > self._buffer_size:
+            # Not enough room left at the tail, move unread bytes to the front
+            remaining = self._write_pos - self._read_pos
+            self._buffer_view[:remaining] = self._buffer_view[
+                self._read_pos : self._write_pos
+            ]
+            self._read_pos, self._write_pos = 0, remaining
+
+        while self._write_pos - self._read_pos < size:
+            read = sock.recv_into(
+                self._buffer_view[self._write_pos :],
+                self._buffer_size - self._write_pos,
+            )
+            if read == 0:
+                raise InterfaceError(errno=2013)
+            self._write_pos += read
+
+    def _recv_chunk(self, sock: socket.socket, size: int = 0) -> bytearray:
+        """Read `size` bytes, taking them from the read-ahead buffer first."""
+        if size <= self._buffer_size:
+            self._fill_buffer(sock, size)
+            pkt = bytearray(self._buffer_view[self._read_pos : self._read_pos + size])
+            self._read_pos += size
+            return pkt
+
+        # The chunk doesn't fit in the buffer, drain what is buffered and read the
+        # remaining bytes directly into the chunk
+        pkt = bytearray(size)
+        pkt_view = memoryview(pkt)
+        buffered = self._write_pos - self._read_pos
+        pkt_view[:buffered] = self._buffer_view[self._read_pos : self._write_pos]
+        self._read_pos = self._write_pos = 0
+        pkt_view = pkt_view[buffered:]
+        size -= buffered
+        while size:
+            read = sock.recv_into(pkt_view, size)
+            if read == 0:
+                raise InterfaceError(errno=2013)
+            pkt_view = pkt_view[read:]
+            size -= read
+        return pkt
+
+    def recv(self, sock: socket.socket, address: str) -> bytearray:
+        """Receive `one` packet from the MySQL server.
+
+        The packet is sliced out of the read-ahead buffer, the socket is only read
+        when the buffer doesn't hold the whole packet.
+        """
+        try:
+            self._fill_buffer(sock, PACKET_HEADER_LENGTH)
+            pos = self._read_pos
+            buf = self._buffer
+            payload_len = buf[pos] | buf[pos + 1] << 8 | buf[pos + 2] << 16
+            self._pktnr = buf[pos + 3]
+            return self._recv_chunk(sock, size=PACKET_HEADER_LENGTH + payload_len)
+        except IOError as err:
+            raise OperationalError(
+                errno=2055, values=(address, _strioerror(err))
+            ) from err
+
+
 class NetworkBrokerCompressed(NetworkBrokerPlain):
-    """Broker class for MySQL socket communication."""
+    """Broker class for MySQL socket communication using compressed packets.
 
-    def __init__(self) -> None:
+    Payloads are compressed with the algorithm negotiated during the handshake,
+    `zlib` or `zstd`; the framing of the compressed packets is the same for both.
+    """
+
+    def __init__(self, algorithm: str = "zlib", level: Optional[int] = None) -> None:
         super().__init__()
         self._compressed_pktnr = -1
         self._queue_read: Deque[bytearray] = deque()
+        self._compress, self._decompress = get_compression_codec(algorithm, level)
 
     @staticmethod
     def _prepare_packets(payload: bytes, pktnr: int) -> List[bytes]:
@@ -282,7 +522,7 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
 
     def _send_pkt(self, sock: socket.socket, address: str, pkt: bytes) -> None:
         """Compress packet and write it to the comm channel."""
-        compressed_pkt = zlib.compress(pkt)
+        compressed_pkt = self._compress(pkt)
         pkt = (
             struct.pack("<I", len(compressed_pkt))[0:3]
             + struct.pack("<B", self._compressed_pktnr)
@@ -363,7 +603,7 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
         pkt = (
             compressed_pkt
             if uncompressed_pll == 0
-            else bytearray(zlib.decompress(compressed_pkt))
+            else bytearray(self._decompress(compressed_pkt, uncompressed_pll))
         )
 
         offset = 0
@@ -394,7 +634,7 @@ class NetworkBrokerCompressed(NetworkBrokerPlain):
                 pkt += (
                     compressed_pkt
                     if uncompressed_pll == 0
-                    else zlib.decompress(compressed_pkt)
+                    else self._decompress(compressed_pkt, uncompressed_pll)
                 )
 
             self._queue_read.append(pkt[offset : offset + PACKET_HEADER_LENGTH + pll])
@@ -450,10 +690,28 @@ class MySQLSocket(ABC):
         self._connection_timeout: Optional[int] = None
         self.server_host: Optional[str] = None
         self._netbroker: NetworkBroker = NetworkBrokerPlain()
+        self._unread_packet: Optional[bytearray] = None
 
-    def switch_to_compressed_mode(self) -> None:
-        """Enable network layer where transactions are made with compressed packets."""
-        self._netbroker = NetworkBrokerCompressed()
+    def switch_to_compressed_mode(
+        self, algorithm: str = "zlib", level: Optional[int] = None
+    ) -> None:
+        """Enable network layer where transactions are made with compressed packets.
+
+        Args:
+            algorithm: Compression algorithm, either `zlib` or `zstd`.
+            level: Compression level, only used by `zstd`.
+        """
+        self._netbroker = NetworkBrokerCompressed(algorithm, level)
+
+    def switch_to_buffered_mode(
+        self, buffer_size: int = DEFAULT_READ_BUFFER_SIZE
+    ) -> None:
+        """Enable network layer where packets are read through a read-ahead buffer.
+
+        Args:
+            buffer_size: Size in bytes of the chunks pulled from the socket.
+        """
+        self._netbroker = NetworkBrokerBuffered(buffer_size)
 
     def shutdown(self) -> None:
         """Shut down the socket before closing it."""
@@ -465,6 +723,7 @@ class MySQLSocket(ABC):
 
     def close_connection(self) -> None:
         """Close the socket."""
+        self._unread_packet = None
         try:
             self.sock.close()
         except (AttributeError, OSError):
@@ -634,8 +893,15 @@ class MySQLSocket(ABC):
 
     def recv(self) -> bytearray:
         """Get packet from the MySQL server comm channel."""
+        if self._unread_packet is not None:
+            packet, self._unread_packet = self._unread_packet, None
+            return packet
         return self._netbroker.recv(self.sock, self.address)
 
+    def unread(self, packet: bytearray) -> None:
+        """Push back a packet, returned by the next call to `recv()`."""
+        self._unread_packet = packet
+
     @abstractmethod
     def open_connection(self) -> None:
         """Open the socket."""
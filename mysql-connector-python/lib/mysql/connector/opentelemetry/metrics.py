@@ -0,0 +1,159 @@
+"""OpenTelemetry export of the connection pool metrics."""
+# mypy: disable-error-code="no-redef"
+# pylint: disable=protected-access
+
+from __future__ import annotations
+
+import weakref
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Union
+
+from ... import connector
+from ..version import VERSION_TEXT
+
+try:
+    # try to load otel from the system
+    from opentelemetry import metrics  # check api
+    from opentelemetry.sdk.metrics import MeterProvider  # check sdk
+except ImportError:
+    try:
+        # falling back to the bundled installation
+        from mysql.opentelemetry import metrics
+        from mysql.opentelemetry.sdk.metrics import MeterProvider
+    except ImportError as missing_dependencies_err:
+        raise connector.errors.ProgrammingError(
+            "Bundled installation has missing dependencies. "
+            "Please use `pip install mysql-connector-python[opentelemetry]`, "
+            "or for an editable install use `pip install -e '.[opentelemetry]'`, "
+            "to install the dependencies required by the bundled opentelemetry package."
+        ) from missing_dependencies_err
+
+if TYPE_CHECKING:
+    from ..aio.pooling import MySQLConnectionPool as AioMySQLConnectionPool
+    from ..pooling import MySQLConnectionPool
+
+POOL_NAME = "pool.name"
+"""Attribute holding the name of the pool the metrics belong to."""
+
+HISTOGRAMS = {
+    "wait_time": (
+        "db.client.connections.wait_time",
+        "The time it took to obtain a connection from the pool",
+    ),
+    "hold_time": (
+        "db.client.connections.use_time",
+        "The time between borrowing a connection and returning it to the pool",
+    ),
+}
+
+COUNTERS = {
+    "checkouts": (
+        "db.client.connections.checkouts",
+        "The number of connections handed out by the pool",
+    ),
+    "checkout_timeouts": (
+        "db.client.connections.timeouts",
+        "The number of connection requests which timed out",
+    ),
+    "connections_created": (
+        "db.client.connections.created",
+        "The number of connections opened by the pool",
+    ),
+    "connections_closed": (
+        "db.client.connections.closed",
+        "The number of connections closed by the pool",
+    ),
+    "connections_failed": (
+        "db.client.connections.failed",
+        "The number of connections the pool failed to open",
+    ),
+}
+
+
+def export_pool_metrics(
+    pool: Union[MySQLConnectionPool, AioMySQLConnectionPool],
+    meter_provider: Optional[MeterProvider] = None,
+) -> None:
+    """Exports the metrics of a connection pool through OpenTelemetry.
+
+    The pool counters and gauges are reported by observable instruments, read
+    when the metrics are collected, and the wait and use times are recorded in
+    histograms, in milliseconds. All of them have the `pool.name` attribute.
+    The instruments only hold a weak reference to the pool.
+
+    Args:
+        pool: A `mysql.connector.pooling.MySQLConnectionPool` or
+              `mysql.connector.aio.MySQLConnectionPool` instance.
+        meter_provider: The meter provider to use. If this argument is not given,
+                        the global meter provider is used.
+
+    Examples:
+        ```
+        >>> from mysql.connector.opentelemetry.metrics import export_pool_metrics
+        >>> cnxpool = mysql.connector.pooling.MySQLConnectionPool(**dbconfig)
+        >>> export_pool_metrics(cnxpool)
+        ```
+    """
+    meter = metrics.get_meter(__name__, VERSION_TEXT, meter_provider)
+    attrs = {POOL_NAME: pool.pool_name}
+    pool_ref = weakref.ref(pool)
+
+    def observe(
+        read: Callable[[Dict[str, Any]], Iterable[Any]]
+    ) -> Callable[[Any], Iterable[metrics.Observation]]:
+        def callback(_: Any) -> Iterable[metrics.Observation]:
+            cnx_pool = pool_ref()
+            if cnx_pool is None:
+                return []
+            return list(read(cnx_pool.get_metrics()))
+
+        return callback
+
+    def read_counter(key: str) -> Callable[[Dict[str, Any]], Iterable[Any]]:
+        return lambda snapshot: [metrics.Observation(snapshot[key], attrs)]
+
+    for key, (name, description) in COUNTERS.items():
+        meter.create_observable_counter(
+            name,
+            callbacks=[observe(read_counter(key))],
+            unit="{connection}",
+            description=description,
+        )
+    meter.create_observable_up_down_counter(
+        "db.client.connections.usage",
+        callbacks=[
+            observe(
+                lambda snapshot: [
+                    metrics.Observation(snapshot["idle"], {**attrs, "state": "idle"}),
+                    metrics.Observation(snapshot["in_use"], {**attrs, "state": "used"}),
+                ]
+            )
+        ],
+        unit="{connection}",
+        description="The number of connections that are currently in the state "
+        "described by the state attribute",
+    )
+    meter.create_observable_up_down_counter(
+        "db.client.connections.max",
+        callbacks=[
+            observe(lambda snapshot: [metrics.Observation(snapshot["max_size"], attrs)])
+        ],
+        unit="{connection}",
+        description="The maximum number of open connections allowed",
+    )
+    meter.create_observable_up_down_counter(
+        "db.client.connections.pending_requests",
+        callbacks=[
+            observe(lambda snapshot: [metrics.Observation(snapshot["waiting"], attrs)])
+        ],
+        unit="{request}",
+        description="The number of pending requests for an open connection",
+    )
+
+    histograms = {
+        key: meter.create_histogram(name, unit="ms", description=description)
+        for key, (name, description) in HISTOGRAMS.items()
+    }
+    pool._metrics.add_listener(
+        lambda key, duration: histograms[key].record(duration * 1000, attrs)
+    )
@@ -29,13 +29,30 @@
 """Implementing pooling of connections to MySQL servers."""
 from __future__ import annotations
 
+import bisect
 import queue
 import random
 import re
 import threading
+import time
+import weakref
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Dict, NoReturn, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import uuid4
 
 try:
@@ -61,12 +78,31 @@ from .errors import (
     ProgrammingError,
 )
 from .optionfiles import read_option_files
+from .types import HistogramType, PoolMetricsType
 
 if TYPE_CHECKING:
     from .abstracts import MySQLConnectionAbstract
 
 CONNECTION_POOL_LOCK = threading.RLock()
 CNX_POOL_MAXSIZE = 32
+CNX_POOL_MAINTENANCE_INTERVAL = 5.0
+# Maximum number of connections opened at the same time when filling a pool
+CNX_POOL_PREFILL_WORKERS = 8
+# Upper bounds, in seconds, of the buckets of the pool time histograms
+CNX_POOL_METRICS_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
 CNX_POOL_MAXNAMESIZE = 64
 CNX_POOL_NAMEREGEX = re.compile(r"[^a-zA-Z0-9._:\-*$#]")
 ERROR_NO_CEXT = "MySQL Connector/Python C Extension not available"
@@ -379,6 +415,7 @@ class PooledMySQLConnection:
             raise AttributeError("cnx should be a MySQLConnection")
         self._cnx_pool: MySQLConnectionPool = pool
         self._cnx: MySQLConnectionAbstract = cnx
+        self._checkout_time: float = time.monotonic()
 
     def __enter__(self) -> PooledMySQLConnection:
         return self
@@ -404,11 +441,19 @@ class PooledMySQLConnection:
         and reopened with the new configuration before being returned from the pool
         again in response to a connection request.
         """
+        cnx = self._cnx
+        usable = False
+        self._cnx_pool._metrics.record(
+            "hold_time", time.monotonic() - self._checkout_time
+        )
         try:
-            cnx = self._cnx
-            if self._cnx_pool.reset_session:
+            # Unlike reset_session(), cmd_reset_connection() does not ping the
+            # server first; reset_session() is only needed as a fallback
+            if self._cnx_pool.reset_session and not cnx.cmd_reset_connection():
                 cnx.reset_session()
+            usable = True
         finally:
+            self._cnx_pool._mark_used(cnx, usable)
             self._cnx_pool.add_connection(cnx)
             self._cnx = None
 
@@ -431,6 +476,127 @@ class PooledMySQLConnection:
         return self._cnx_pool.pool_name
 
 
+class _Histogram:
+    """Distribution of durations over fixed buckets."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds: Tuple[float, ...] = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> HistogramType:
+        """Returns the state of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "bounds": self.bounds,
+            "counts": tuple(self.counts),
+        }
+
+
+class PoolMetrics:
+    """Counters and time distributions of a connection pool
+
+    The pools record in a `PoolMetrics` instance the connections they hand out
+    (`checkouts`), the requests which could not get a connection in time
+    (`checkout_timeouts`), and the connections they opened
+    (`connections_created`), closed (`connections_closed`) or failed to open or
+    reopen (`connections_failed`). The time spent waiting for a connection, and
+    the time a connection was held before being returned, are recorded in
+    histograms.
+
+    Callables added with `add_listener()` are called with the name of the
+    histogram (`wait_time` or `hold_time`) and the duration, in seconds, of each
+    recorded value.
+    """
+
+    def __init__(self, bounds: Tuple[float, ...] = CNX_POOL_METRICS_BUCKETS) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(
+            (
+                "checkouts",
+                "checkout_timeouts",
+                "connections_created",
+                "connections_closed",
+                "connections_failed",
+            ),
+            0,
+        )
+        self._histograms: Dict[str, _Histogram] = {
+            "wait_time": _Histogram(bounds),
+            "hold_time": _Histogram(bounds),
+        }
+        self._listeners: List[Callable[[str, float], None]] = []
+
+    def add_listener(self, listener: Callable[[str, float], None]) -> None:
+        """Call `listener` for every value recorded in the histograms."""
+        self._listeners.append(listener)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[counter] += value
+
+    def record(self, histogram: str, duration: float) -> None:
+        """Record a duration, in seconds, in a histogram."""
+        with self._lock:
+            self._histograms[histogram].record(duration)
+        for listener in self._listeners:
+            listener(histogram, duration)
+
+    def snapshot(self) -> PoolMetricsType:
+        """Returns the counters and histograms."""
+        with self._lock:
+            metrics: PoolMetricsType = dict(self._counters)
+            for name, histogram in self._histograms.items():
+                metrics[name] = histogram.snapshot()
+        return metrics
+
+
+class _PoolWaiter:
+    """Thread waiting in a `MySQLConnectionPool` for a connection to be returned.
+
+    The waiter is served either a connection (`cnx`) or, when a connection of the
+    pool was closed, the slot left free to open a new one (`cnx` is `None`).
+    """
+
+    __slots__ = ("condition", "served", "cnx")
+
+    def __init__(self, lock: threading.RLock) -> None:
+        self.condition: threading.Condition = threading.Condition(lock)
+        self.served: bool = False
+        self.cnx: Optional[MySQLConnectionAbstract] = None
+
+
+def _run_pool_maintenance(
+    pool_ref: weakref.ReferenceType[MySQLConnectionPool],
+    stop: threading.Event,
+    interval: float,
+) -> None:
+    """Maintain a connection pool every `interval` seconds.
+
+    Runs in a daemon thread until `stop` is set or the pool is garbage collected.
+    """
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        pool._maintain()  # pylint: disable=protected-access
+        del pool
+
+
 class MySQLConnectionPool:
     """Class defining a pool of MySQL connections"""
 
@@ -439,6 +605,13 @@ class MySQLConnectionPool:
         pool_size: int = 5,
         pool_name: Optional[str] = None,
         pool_reset_session: bool = True,
+        pool_acquire_timeout: float = 0,
+        pool_min_size: Optional[int] = None,
+        pool_max_size: Optional[int] = None,
+        pool_max_idle_time: Optional[float] = None,
+        pool_max_lifetime: Optional[float] = None,
+        pool_validation_interval: Optional[float] = 0,
+        pool_lazy_prefill: bool = False,
         **kwargs: Any,
     ) -> None:
         """Constructor.
@@ -448,6 +621,13 @@ class MySQLConnectionPool:
         arguments, kwargs, are configuration arguments for MySQLConnection
         instances.
 
+        The pool opens `pool_min_size` connections up front, up to
+        `CNX_POOL_PREFILL_WORKERS` of them at the same time, and further ones on
+        demand, up to `pool_max_size`. When `pool_max_idle_time` or
+        `pool_max_lifetime` are given, a background thread closes the connections
+        idle for too long (keeping at least `pool_min_size` of them) and replaces
+        the ones older than their lifetime.
+
         Args:
             pool_name: The pool name. If this argument is not given, Connector/Python
                        automatically generates the name, composed from whichever of
@@ -456,6 +636,33 @@ class MySQLConnectionPool:
             pool_size:  The pool size. If this argument is not given, the default is 5.
             pool_reset_session: Whether to reset session variables when the connection
                                 is returned to the pool.
+            pool_acquire_timeout: Default number of seconds `get_connection()` waits
+                                  for a connection when the pool is exhausted. If
+                                  this argument is not given, the default is 0 (do
+                                  not wait).
+            pool_min_size: Number of connections kept open by the pool. If this
+                           argument is not given, the default is `pool_size`.
+            pool_max_size: Maximum number of connections opened by the pool. If
+                           this argument is not given, the default is `pool_size`.
+                           Unlike `pool_size`, it is not limited to
+                           `CNX_POOL_MAXSIZE`.
+            pool_max_idle_time: Number of seconds after which an idle connection is
+                                closed, as long as `pool_min_size` connections
+                                remain open. If this argument is not given, idle
+                                connections are never closed.
+            pool_max_lifetime: Number of seconds after which a connection is
+                               closed and replaced. If this argument is not given,
+                               connections never expire.
+            pool_validation_interval: Number of seconds a connection must have
+                                      been unused before `get_connection()`
+                                      pings the server to check it is still
+                                      available. If this argument is not given,
+                                      the default is 0 (always ping). When
+                                      `None`, connections are never pinged.
+            pool_lazy_prefill: Whether to return as soon as the first connection
+                               is open, the others being opened in the
+                               background. If this argument is not given, the
+                               default is False (wait for all the connections).
             **kwargs: Optional additional connection arguments, as described in [1].
 
         Examples:
@@ -472,23 +679,59 @@ class MySQLConnectionPool:
         References:
             [1]: https://dev.mysql.com/doc/connector-python/en/connector-python-connectargs.html
         """
+        # Protects the state of this pool only, network I/O is done without it
+        self._lock = threading.RLock()
         self._pool_size: Optional[int] = None
+        self._pool_min_size: int = 0
+        self._pool_max_size: int = 0
         self._pool_name: Optional[str] = None
+        self._acquire_timeout: float = 0
+        self._max_idle_time: Optional[float] = None
+        self._max_lifetime: Optional[float] = None
+        self._validation_interval: Optional[float] = 0
         self._reset_session = pool_reset_session
         self._set_pool_size(pool_size)
+        self._set_pool_limits(pool_min_size, pool_max_size)
         self._set_pool_name(pool_name or generate_pool_name(**kwargs))
+        self._set_acquire_timeout(pool_acquire_timeout)
+        self._set_connection_lifetimes(pool_max_idle_time, pool_max_lifetime)
+        self._set_validation_interval(pool_validation_interval)
         self._cnx_config: Dict[str, Any] = {}
-        self._cnx_queue: queue.Queue[MySQLConnectionAbstract] = queue.Queue(
-            self._pool_size
+        # Idle connections, the most recently returned one is handed out first so
+        # the least used ones can reach pool_max_idle_time
+        self._cnx_queue: queue.LifoQueue[MySQLConnectionAbstract] = queue.LifoQueue(
+            self._pool_max_size
         )
+        # Number of connections opened (or being opened) by the pool
+        self._cnx_count: int = 0
+        # Monotonic times at which the pool connections were opened, and at which
+        # the idle connections were returned to the pool
+        self._cnx_opened_at: Dict[MySQLConnectionAbstract, float] = {}
+        self._cnx_idle_since: Dict[MySQLConnectionAbstract, float] = {}
+        # Monotonic times at which the connections were last known to be usable
+        self._cnx_last_used: Dict[MySQLConnectionAbstract, float] = {}
+        self._waiters: Deque[_PoolWaiter] = deque()
+        # Number of connections being opened to fill the pool
+        self._cnx_prefilling: int = 0
         self._config_version = uuid4()
+        self._maintenance_thread: Optional[threading.Thread] = None
+        self._metrics = PoolMetrics()
 
         if kwargs:
             self.set_config(**kwargs)
-            cnt = 0
-            while cnt < self._pool_size:
-                self.add_connection()
-                cnt += 1
+            try:
+                if pool_lazy_prefill and self._pool_min_size:
+                    self.add_connection()
+                    self._prefill(self._pool_min_size - 1, background=True)
+                else:
+                    self._prefill(self._pool_min_size)
+            except Exception:
+                # The pool is not returned, close the connections opened so far
+                self._remove_connections()
+                raise
+
+        if self._max_idle_time or self._max_lifetime:
+            self._start_maintenance()
 
     @property
     def pool_name(self) -> str:
@@ -500,11 +743,31 @@ class MySQLConnectionPool:
         """Returns number of connections managed by the pool."""
         return self._pool_size
 
+    @property
+    def pool_min_size(self) -> int:
+        """Returns number of connections kept open by the pool."""
+        return self._pool_min_size
+
+    @property
+    def pool_max_size(self) -> int:
+        """Returns maximum number of connections opened by the pool."""
+        return self._pool_max_size
+
     @property
     def reset_session(self) -> bool:
         """Returns whether to reset session."""
         return self._reset_session
 
+    @property
+    def acquire_timeout(self) -> float:
+        """Returns the default number of seconds to wait for a connection."""
+        return self._acquire_timeout
+
+    @property
+    def validation_interval(self) -> Optional[float]:
+        """Returns the idle time after which a connection is pinged on checkout."""
+        return self._validation_interval
+
     def set_config(self, **kwargs: Any) -> None:
         """Set the connection configuration for `MySQLConnectionAbstract` subclass instances.
 
@@ -526,7 +789,7 @@ class MySQLConnectionPool:
         if not kwargs:
             return
 
-        with CONNECTION_POOL_LOCK:
+        with self._lock:
             try:
                 test_cnx = connect()
                 test_cnx.config(**kwargs)
@@ -550,6 +813,93 @@ class MySQLConnectionPool:
             )
         self._pool_size = pool_size
 
+    def _set_pool_limits(
+        self, pool_min_size: Optional[int], pool_max_size: Optional[int]
+    ) -> None:
+        """Set the minimum and maximum number of connections of the pool
+
+        Both default to the pool size.
+
+        Raises an AttributeError when pool_max_size is not higher than 0, or
+        pool_min_size is negative or higher than pool_max_size.
+        """
+        if pool_max_size is None:
+            pool_max_size = self._pool_size
+        if (
+            not isinstance(pool_max_size, int)
+            or isinstance(pool_max_size, bool)
+            or pool_max_size <= 0
+        ):
+            raise AttributeError("Pool max size should be higher than 0")
+        if pool_min_size is None:
+            pool_min_size = min(self._pool_size, pool_max_size)
+        if (
+            not isinstance(pool_min_size, int)
+            or isinstance(pool_min_size, bool)
+            or not 0 <= pool_min_size <= pool_max_size
+        ):
+            raise AttributeError(
+                "Pool min size should be higher or equal to 0 and lower or equal "
+                f"to the pool max size ({pool_max_size})"
+            )
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+
+    def _set_connection_lifetimes(
+        self, max_idle_time: Optional[float], max_lifetime: Optional[float]
+    ) -> None:
+        """Set the time after which idle and old connections are closed
+
+        Raises an AttributeError when a time is given and is not a positive number.
+        """
+        for name, value in (
+            ("pool_max_idle_time", max_idle_time),
+            ("pool_max_lifetime", max_lifetime),
+        ):
+            if value is not None and (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or value <= 0
+            ):
+                raise AttributeError(
+                    f"{name} must be a number higher than 0, found: '{value}'"
+                )
+        self._max_idle_time = max_idle_time
+        self._max_lifetime = max_lifetime
+
+    def _set_acquire_timeout(self, acquire_timeout: float) -> None:
+        """Set the default time to wait for a connection when the pool is exhausted.
+
+        Raises an AttributeError when acquire_timeout is not a positive number.
+        """
+        if (
+            not isinstance(acquire_timeout, (int, float))
+            or isinstance(acquire_timeout, bool)
+            or acquire_timeout < 0
+        ):
+            raise AttributeError(
+                "pool_acquire_timeout must be a positive number, "
+                f"found: '{acquire_timeout}'"
+            )
+        self._acquire_timeout = acquire_timeout
+
+    def _set_validation_interval(self, validation_interval: Optional[float]) -> None:
+        """Set the idle time after which a connection is pinged on checkout
+
+        Raises an AttributeError when validation_interval is given and is not a
+        positive number.
+        """
+        if validation_interval is not None and (
+            not isinstance(validation_interval, (int, float))
+            or isinstance(validation_interval, bool)
+            or validation_interval < 0
+        ):
+            raise AttributeError(
+                "pool_validation_interval must be a positive number, "
+                f"found: '{validation_interval}'"
+            )
+        self._validation_interval = validation_interval
+
     def _set_pool_name(self, pool_name: str) -> None:
         r"""Set the name of the pool.
 
@@ -564,6 +914,122 @@ class MySQLConnectionPool:
             raise AttributeError(f"Pool name '{pool_name}' is too long")
         self._pool_name = pool_name
 
+    def _start_maintenance(self) -> None:
+        """Start the thread closing idle and expired connections
+
+        The thread only holds a weak reference to the pool and stops once the pool
+        is garbage collected.
+        """
+        thresholds = [
+            value for value in (self._max_idle_time, self._max_lifetime) if value
+        ]
+        interval = min([CNX_POOL_MAINTENANCE_INTERVAL] + [t / 2 for t in thresholds])
+        stop = threading.Event()
+        weakref.finalize(self, stop.set)
+        self._maintenance_thread = threading.Thread(
+            target=_run_pool_maintenance,
+            args=(weakref.ref(self), stop, interval),
+            name=f"{self._pool_name}-maintenance",
+            daemon=True,
+        )
+        self._maintenance_thread.start()
+
+    def _is_expired(self, cnx: MySQLConnectionAbstract, now: float) -> bool:
+        """Check whether a connection is older than pool_max_lifetime."""
+        return bool(self._max_lifetime) and (
+            now - self._cnx_opened_at.get(cnx, now) > self._max_lifetime
+        )
+
+    def _needs_validation(self, cnx: MySQLConnectionAbstract, now: float) -> bool:
+        """Check whether a connection must be pinged before being handed out
+
+        Connections whose last use is unknown, such as the ones which failed to
+        be reset, are always pinged unless validation is disabled.
+        """
+        if self._validation_interval is None:
+            return False
+        last_used = self._cnx_last_used.get(cnx)
+        return last_used is None or now - last_used >= self._validation_interval
+
+    def _mark_used(self, cnx: MySQLConnectionAbstract, usable: bool) -> None:
+        """Record whether a connection returned to the pool is known to be usable."""
+        with self._lock:
+            if usable:
+                self._cnx_last_used[cnx] = time.monotonic()
+            else:
+                self._cnx_last_used.pop(cnx, None)
+
+    def _serve_waiter(self, cnx: Optional[MySQLConnectionAbstract]) -> None:
+        """Hand a connection, or a free slot, to the thread waiting the longest.
+
+        It will not acquire a lock as the methods using _serve_waiter() will have
+        it set.
+        """
+        waiter = self._waiters.popleft()
+        waiter.served = True
+        waiter.cnx = cnx
+        waiter.condition.notify()
+
+    def _release_slot(self) -> None:
+        """Release the slot of a connection that was closed or could not be opened
+
+        If threads are waiting for a connection, the slot is handed to the one
+        waiting the longest which opens a new connection. It will not acquire a
+        lock as the methods using _release_slot() will have it set.
+        """
+        if self._waiters:
+            self._serve_waiter(None)
+        else:
+            self._cnx_count -= 1
+
+    def _forget_connection(self, cnx: MySQLConnectionAbstract) -> None:
+        """Remove the bookkeeping of a connection closed by the pool."""
+        self._cnx_opened_at.pop(cnx, None)
+        self._cnx_idle_since.pop(cnx, None)
+        self._cnx_last_used.pop(cnx, None)
+
+    def _open_connection(self, prefill: bool = False) -> MySQLConnectionAbstract:
+        """Open a new connection for a slot already reserved in the pool
+
+        The connection is opened without holding the lock. The slot is released
+        when the connection can not be opened, and when `prefill` is true the
+        connection is no longer counted as being opened by _prefill().
+
+        Raises `PoolError` or any error raised while connecting.
+        """
+        try:
+            if not self._cnx_config:
+                raise PoolError("Connection configuration not available")
+            cnx: MySQLConnectionAbstract = connect(  # type: ignore[assignment]
+                **self._cnx_config
+            )
+            try:
+                if (
+                    self._reset_session
+                    and self._cnx_config["compress"]
+                    and cnx.get_server_version() < (5, 7, 3)
+                ):
+                    raise NotSupportedError(
+                        "Pool reset session is not supported with "
+                        "compression for MySQL server version 5.7.2 "
+                        "or earlier"
+                    )
+            except KeyError:
+                pass
+        except Exception:
+            with self._lock:
+                if prefill:
+                    self._cnx_prefilling -= 1
+                self._release_slot()
+            self._metrics.increment("connections_failed")
+            raise
+
+        self._metrics.increment("connections_created")
+        cnx.pool_config_version = self._config_version
+        with self._lock:
+            self._cnx_opened_at[cnx] = self._cnx_last_used[cnx] = time.monotonic()
+        return cnx
+
     def _queue_connection(self, cnx: MySQLConnectionAbstract) -> None:
         """Put connection back in the queue
 
@@ -571,6 +1037,9 @@ class MySQLConnectionPool:
         acquire a lock as the methods using _queue_connection() will have it
         set.
 
+        If threads are waiting for a connection, it is handed straight to the one
+        waiting the longest instead.
+
         Raises `PoolError` on errors.
         """
         if not isinstance(cnx, MYSQL_CNX_CLASS):
@@ -578,10 +1047,15 @@ class MySQLConnectionPool:
                 "Connection instance not subclass of MySQLConnectionAbstract"
             )
 
+        if self._waiters:
+            self._serve_waiter(cnx)
+            return
+
         try:
             self._cnx_queue.put(cnx, block=False)
         except queue.Full as err:
             raise PoolError("Failed adding connection; queue is full") from err
+        self._cnx_idle_since[cnx] = time.monotonic()
 
     def add_connection(self, cnx: Optional[MySQLConnectionAbstract] = None) -> None:
         """Adds a connection to the pool.
@@ -602,73 +1076,277 @@ class MySQLConnectionPool:
                        connection can be added (maximum reached) or when the connection
                        can not be instantiated.
         """
-        with CONNECTION_POOL_LOCK:
+        with self._lock:
             if not self._cnx_config:
                 raise PoolError("Connection configuration not available")
 
-            if self._cnx_queue.full():
+            if cnx is not None and cnx in self._cnx_opened_at:
+                # A connection of the pool given back
+                self._queue_connection(cnx)
+                return
+
+            if self._cnx_count >= self._pool_max_size:
                 raise PoolError("Failed adding connection; queue is full")
 
-            if not cnx:
-                cnx = connect(**self._cnx_config)  # type: ignore[assignment]
-                try:
-                    if (
-                        self._reset_session
-                        and self._cnx_config["compress"]
-                        and cnx.get_server_version() < (5, 7, 3)
-                    ):
-                        raise NotSupportedError(
-                            "Pool reset session is not supported with "
-                            "compression for MySQL server version 5.7.2 "
-                            "or earlier"
-                        )
-                except KeyError:
-                    pass
-
-                cnx.pool_config_version = self._config_version
-            else:
-                if not isinstance(cnx, MYSQL_CNX_CLASS):
-                    raise PoolError(
-                        "Connection instance not subclass of MySQLConnectionAbstract"
-                    )
+            if cnx is not None and not isinstance(cnx, MYSQL_CNX_CLASS):
+                raise PoolError(
+                    "Connection instance not subclass of MySQLConnectionAbstract"
+                )
+            self._cnx_count += 1
+
+        if not cnx:
+            cnx = self._open_connection()
+
+        with self._lock:
+            self._cnx_opened_at.setdefault(cnx, time.monotonic())
+            self._queue_connection(cnx)
 
+    def _prefill_connection(self) -> None:
+        """Open a connection for a slot reserved by _prefill() and queue it."""
+        cnx = self._open_connection(prefill=True)
+        with self._lock:
+            self._cnx_prefilling -= 1
             self._queue_connection(cnx)
 
-    def get_connection(self) -> PooledMySQLConnection:
+    def _prefill(self, count: int, background: bool = False) -> None:
+        """Open `count` connections in parallel and add them to the pool
+
+        Up to `CNX_POOL_PREFILL_WORKERS` connections are opened at the same time.
+        Unless `background` is true, wait for all of them and raise the first
+        error that occurred. Otherwise, return at once: threads calling
+        get_connection() meanwhile wait for the connections being opened, and
+        the ones which can not be opened are left to the pool maintenance or
+        opened on demand.
+
+        Raises `PoolError` or any error raised while connecting.
+        """
+        with self._lock:
+            count = min(count, self._pool_max_size - self._cnx_count)
+            if count <= 0:
+                return
+            self._cnx_count += count
+            self._cnx_prefilling += count
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(count, CNX_POOL_PREFILL_WORKERS),
+            thread_name_prefix=f"{self._pool_name}-prefill",
+        )
+        futures = [executor.submit(self._prefill_connection) for _ in range(count)]
+        executor.shutdown(wait=not background)
+        if not background:
+            for future in futures:
+                future.result()
+
+    def _acquire_connection(self, timeout: float) -> Optional[MySQLConnectionAbstract]:
+        """Take an idle connection out of the queue.
+
+        When there is no idle connection but the pool has not reached its
+        maximum size, a slot is reserved and `None` is returned: the caller must
+        open a new connection. Otherwise, wait up to `timeout` seconds for a
+        connection to be returned. While the pool is being filled in the
+        background, threads also wait, whatever the timeout, for the connections
+        being opened. Waiting threads are served in FIFO order. It will not
+        acquire a lock as get_connection() will have it set.
+
+        Raises `PoolError` when no connection is available in time.
+        """
+        if not self._waiters:
+            try:
+                cnx = self._cnx_queue.get(block=False)
+                self._cnx_idle_since.pop(cnx, None)
+                return cnx
+            except queue.Empty:
+                pass
+
+            if self._cnx_config and self._cnx_count < self._pool_max_size:
+                self._cnx_count += 1
+                return None
+
+        # Each connection being opened will serve one of the waiting threads
+        prefilling = len(self._waiters) < self._cnx_prefilling
+        if timeout <= 0 and not prefilling:
+            raise PoolError("Failed getting connection; pool exhausted")
+
+        waiter = _PoolWaiter(self._lock)
+        self._waiters.append(waiter)
+        try:
+            waiter.condition.wait_for(
+                lambda: waiter.served, None if prefilling else timeout
+            )
+        finally:
+            if not waiter.served:
+                self._waiters.remove(waiter)
+
+        if not waiter.served:
+            raise PoolError(
+                "Failed getting connection; pool exhausted, no connection was "
+                f"returned within {timeout} seconds"
+            )
+        return waiter.cnx
+
+    def get_connection(self, timeout: Optional[float] = None) -> PooledMySQLConnection:
         """Gets a connection from the pool.
 
         This method returns an PooledMySQLConnection instance which
         has a reference to the pool that created it, and the next available
         MySQL connection.
 
-        When the MySQL connection is not connect, a reconnect is attempted.
+        When there is no idle connection, a new one is opened as long as the pool
+        has less than `pool_max_size` connections. Otherwise, the calling thread
+        waits until a connection is returned to the pool or `timeout` expires.
+        Connections are handed out to the waiting threads in the order they called
+        this method.
+
+        When the MySQL connection is older than `pool_max_lifetime`, or was not
+        used for `pool_validation_interval` seconds and is not connected anymore,
+        a reconnect is attempted.
+
+        Args:
+            timeout: Number of seconds to wait for a connection when the pool is
+                     exhausted. If this argument is not given, the pool's
+                     `pool_acquire_timeout` is used.
 
         Returns:
             A `PooledMySQLConnection` instance.
 
         Raises:
-            PoolError: On errors.
+            PoolError: On errors, or when no connection is available in time.
         """
-        with CONNECTION_POOL_LOCK:
+        if timeout is None:
+            timeout = self._acquire_timeout
+
+        started = time.monotonic()
+        with self._lock:
             try:
-                cnx = self._cnx_queue.get(block=False)
-            except queue.Empty as err:
-                raise PoolError("Failed getting connection; pool exhausted") from err
+                cnx = self._acquire_connection(timeout)
+            except PoolError:
+                self._metrics.increment("checkout_timeouts")
+                raise
+
+        if cnx is None:
+            return self._checkout(self._open_connection(), started)
+
+        with self._lock:
+            now = time.monotonic()
+            cnx_config, config_version = self._cnx_config, self._config_version
+            stale = config_version != cnx.pool_config_version or self._is_expired(
+                cnx, now
+            )
+            validate = not stale and self._needs_validation(cnx, now)
 
-            if (
-                not cnx.is_connected()
-                or self._config_version != cnx.pool_config_version
-            ):
-                cnx.config(**self._cnx_config)
-                try:
-                    cnx.reconnect()
-                except InterfaceError:
-                    # Failed to reconnect, give connection back to pool
+        # The server is pinged, and the connection reopened, without the lock
+        if stale or (validate and not cnx.is_connected()):
+            cnx.config(**cnx_config)
+            try:
+                cnx.reconnect()
+            except Error:
+                # Failed to reconnect, give connection back to pool
+                with self._lock:
                     self._queue_connection(cnx)
-                    raise
-                cnx.pool_config_version = self._config_version
+                self._metrics.increment("connections_failed")
+                raise
+            self._metrics.increment("connections_closed")
+            self._metrics.increment("connections_created")
+            cnx.pool_config_version = config_version
+            with self._lock:
+                self._cnx_opened_at[cnx] = self._cnx_last_used[cnx] = time.monotonic()
+        else:
+            with self._lock:
+                self._cnx_last_used[cnx] = now
+
+        return self._checkout(cnx, started)
+
+    def _checkout(
+        self, cnx: MySQLConnectionAbstract, started: float
+    ) -> PooledMySQLConnection:
+        """Hand out a connection, recording the time spent getting it."""
+        pcnx = PooledMySQLConnection(self, cnx)
+        self._metrics.increment("checkouts")
+        self._metrics.record("wait_time", pcnx._checkout_time - started)
+        return pcnx
 
-            return PooledMySQLConnection(self, cnx)
+    def get_metrics(self) -> PoolMetricsType:
+        """Returns a snapshot of the metrics of the pool.
+
+        Besides the counters and histograms described in `PoolMetrics`, the
+        snapshot holds the number of connections opened by the pool (`size`),
+        the idle ones (`idle`), the ones handed out (`in_use`), the number of
+        threads waiting for a connection (`waiting`) and `max_size`.
+
+        Returns:
+            A dictionary of metrics, see `mysql.connector.types.PoolMetricsType`.
+        """
+        metrics = self._metrics.snapshot()
+        with self._lock:
+            idle = self._cnx_queue.qsize()
+            metrics.update(
+                size=self._cnx_count,
+                idle=idle,
+                in_use=self._cnx_count - idle,
+                waiting=len(self._waiters),
+                max_size=self._pool_max_size,
+            )
+        return metrics
+
+    def _maintain(self) -> None:
+        """Close idle and expired connections and open the missing ones
+
+        Idle connections older than pool_max_lifetime are closed, as are the ones
+        idle for longer than pool_max_idle_time as long as pool_min_size
+        connections remain. New connections are then opened up to pool_min_size.
+        The connections are closed and opened without holding the lock.
+        """
+        now = time.monotonic()
+        closing: List[MySQLConnectionAbstract] = []
+        with self._lock:
+            idle = []
+            while True:
+                try:
+                    idle.append(self._cnx_queue.get(block=False))
+                except queue.Empty:
+                    break
+
+            # Go through the connections from the least recently used one
+            keep = []
+            for cnx in reversed(idle):
+                if self._is_expired(cnx, now) or (
+                    self._max_idle_time
+                    and now - self._cnx_idle_since.get(cnx, now) > self._max_idle_time
+                    and self._cnx_count - len(closing) > self._pool_min_size
+                ):
+                    closing.append(cnx)
+                else:
+                    keep.append(cnx)
+            for cnx in keep:
+                self._cnx_queue.put(cnx, block=False)
+            for cnx in closing:
+                self._forget_connection(cnx)
+                self._cnx_count -= 1
+
+            missing = 0
+            if self._cnx_config:
+                missing = max(self._pool_min_size - self._cnx_count, 0)
+                self._cnx_count += missing
+
+        self._metrics.increment("connections_closed", len(closing))
+        for cnx in closing:
+            try:
+                cnx.disconnect()
+            except Error:
+                pass
+
+        for _ in range(missing):
+            try:
+                cnx = self._open_connection()
+            except Error:
+                # Retried in the next run; the remaining slots are released
+                with self._lock:
+                    for _ in range(missing - 1):
+                        self._release_slot()
+                break
+            with self._lock:
+                self._queue_connection(cnx)
+            missing -= 1
 
     def _remove_connections(self) -> int:
         """Close all connections
@@ -680,20 +1358,23 @@ class MySQLConnectionPool:
 
         Returns int.
         """
-        with CONNECTION_POOL_LOCK:
-            cnt = 0
-            cnxq = self._cnx_queue
-            while cnxq.qsize():
+        closing = []
+        with self._lock:
+            while True:
                 try:
-                    cnx = cnxq.get(block=False)
-                    cnx.disconnect()
-                    cnt += 1
+                    cnx = self._cnx_queue.get(block=False)
                 except queue.Empty:
-                    return cnt
-                except PoolError:
-                    raise
-                except Error:
-                    # Any other error when closing means connection is closed
-                    pass
-
-            return cnt
+                    break
+                self._forget_connection(cnx)
+                self._cnx_count -= 1
+                closing.append(cnx)
+
+        self._metrics.increment("connections_closed", len(closing))
+        for cnx in closing:
+            try:
+                cnx.disconnect()
+            except Error:
+                # Any other error when closing means connection is closed
+                pass
+
+        return len(closing)
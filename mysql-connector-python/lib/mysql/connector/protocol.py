@@ -37,6 +37,7 @@ from decimal import Decimal, DecimalException
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Deque,
     Dict,
     List,
@@ -48,11 +49,14 @@ from typing import (
 
 from . import utils
 from .constants import (
+    DEFAULT_ZSTD_COMPRESSION_LEVEL,
     PARAMETER_COUNT_AVAILABLE,
     ClientFlag,
     FieldFlag,
     FieldType,
     ServerCmd,
+    ServerFlag,
+    SessionTrackType,
 )
 from .errors import DatabaseError, InterfaceError, ProgrammingError, get_exception
 from .logger import logger
@@ -81,6 +85,89 @@ ERR_STATUS = 0xFF
 DEFAULT_CHARSET_ID = 45
 DEFAULT_MAX_ALLOWED_PACKET = 1073741824
 
+BINARY_INTEGER_FORMATS = {
+    FieldType.TINY: "b",
+    FieldType.SHORT: "h",
+    FieldType.INT24: "i",
+    FieldType.LONG: "i",
+    FieldType.LONGLONG: "q",
+}
+UINT16 = struct.Struct("<H")
+UINT32 = struct.Struct("<I")
+UINT64 = struct.Struct("<Q")
+
+BinaryValueDecoder = Callable[[memoryview, int], Tuple[Any, int]]
+BinaryRowDecoder = Callable[[bytes, int], Tuple[BinaryProtocolType, ...]]
+
+
+def _read_binary_lc_string(view: memoryview, pos: int) -> Tuple[memoryview, int]:
+    """Read a length coded string starting at pos
+
+    Returns a tuple (string, position after the string).
+    """
+    length = view[pos]
+    if length < 251:
+        pos += 1
+    elif length == 252:
+        length = UINT16.unpack_from(view, pos + 1)[0]
+        pos += 3
+    elif length == 253:
+        length = int.from_bytes(view[pos + 1 : pos + 4], "little")
+        pos += 4
+    else:
+        length = UINT64.unpack_from(view, pos + 1)[0]
+        pos += 9
+    return (view[pos : pos + length], pos + length)
+
+
+def _decode_binary_timestamp(
+    view: memoryview, pos: int, field_type: int
+) -> Tuple[Optional[Union[datetime.date, datetime.datetime]], int]:
+    """Decode a timestamp starting at pos"""
+    length = view[pos]
+    value: Optional[Union[datetime.datetime, datetime.date]] = None
+    if length == 4:
+        year = UINT16.unpack_from(view, pos + 1)[0]
+        if field_type in (FieldType.DATETIME, FieldType.TIMESTAMP):
+            value = datetime.datetime(year, view[pos + 3], view[pos + 4])
+        else:
+            value = datetime.date(year, view[pos + 3], view[pos + 4])
+    elif length >= 7:
+        mcs = 0
+        if length == 11:
+            mcs = UINT32.unpack_from(view, pos + 8)[0]
+        value = datetime.datetime(
+            UINT16.unpack_from(view, pos + 1)[0],
+            view[pos + 3],
+            view[pos + 4],
+            view[pos + 5],
+            view[pos + 6],
+            view[pos + 7],
+            mcs,
+        )
+    return (value, pos + length + 1)
+
+
+def _decode_binary_time(view: memoryview, pos: int) -> Tuple[datetime.timedelta, int]:
+    """Decode a time value starting at pos"""
+    length = view[pos]
+    if not length:
+        return (datetime.timedelta(), pos + 1)
+    mcs = 0
+    if length > 8:
+        mcs = UINT32.unpack_from(view, pos + 9)[0]
+    days = UINT32.unpack_from(view, pos + 2)[0]
+    if view[pos + 1] == 1:
+        days *= -1
+    value = datetime.timedelta(
+        days=days,
+        seconds=view[pos + 8],
+        microseconds=mcs,
+        minutes=view[pos + 7],
+        hours=view[pos + 6],
+    )
+    return (value, pos + length + 1)
+
 
 class MySQLProtocol:
     """Implements MySQL client/server protocol
@@ -88,6 +175,11 @@ class MySQLProtocol:
     Create and parses MySQL packets.
     """
 
+    def __init__(self) -> None:
+        self._binary_row_decoder: Optional[
+            Tuple[List[DescriptionType], str, BinaryRowDecoder]
+        ] = None
+
     @staticmethod
     def parse_auth_more_data(pkt: bytes) -> bytes:
         """Parse a MySQL auth more data packet.
@@ -297,6 +389,7 @@ class MySQLProtocol:
         is_change_user_request: bool = False,
         ssl_enabled: bool = False,
         plugin_config: Optional[Dict[str, Any]] = None,
+        zstd_compression_level: int = DEFAULT_ZSTD_COMPRESSION_LEVEL,
     ) -> Tuple[bytes, MySQLAuthPlugin]:
         """Make a MySQL Authentication packet.
 
@@ -317,6 +410,8 @@ class MySQLProtocol:
             plugin_config: Custom configuration to be passed to the auth plugin
                            when invoked. The parameters defined here will override
                            the one defined in the auth plugin itself.
+            zstd_compression_level: Compression level sent to the server when the
+                                    zstd compression algorithm is negotiated.
 
         Returns:
             handshake_response: Handshake response as per [1].
@@ -403,6 +498,10 @@ class MySQLProtocol:
         if (client_flags & ClientFlag.CONNECT_ARGS) and conn_attrs is not None:
             response_payload.append(MySQLProtocol.make_conn_attrs(conn_attrs))
 
+        # zstd compression level
+        if client_flags & ClientFlag.ZSTD_COMPRESSION_ALGORITHM:
+            response_payload.append(utils.int1store(zstd_compression_level))
+
         return b"".join(response_payload), auth_strategy
 
     @staticmethod
@@ -503,8 +602,12 @@ class MySQLProtocol:
 
     @staticmethod
     def parse_ok(packet: bytes) -> OkPacketType:
-        """Parse a MySQL OK-packet"""
-        if not packet[4] == 0:
+        """Parse a MySQL OK-packet
+
+        The OK packet terminating a result set when CLIENT_DEPRECATE_EOF is
+        in use carries the 0xFE header instead of 0x00.
+        """
+        if packet[4] not in (0, 254):
             raise InterfaceError("Failed parsing OK packet (invalid).")
 
         ok_packet = {}
@@ -520,10 +623,47 @@ class MySQLProtocol:
             if packet:
                 packet, ok_packet["info_msg"] = utils.read_lc_string(packet)
                 ok_packet["info_msg"] = ok_packet["info_msg"].decode("utf-8")
-        except ValueError as err:
+            if packet and (
+                ok_packet["status_flag"] & ServerFlag.SERVER_SESSION_STATE_CHANGED
+            ):
+                ok_packet["session_track"] = (  # type: ignore[assignment]
+                    MySQLProtocol.parse_session_track(packet)
+                )
+        except (IndexError, ValueError) as err:
             raise InterfaceError("Failed parsing OK packet.") from err
         return ok_packet
 
+    @staticmethod
+    def parse_session_track(data: bytes) -> List[Tuple[int, Any]]:
+        """Parse the session state information found in an OK packet
+
+        The information is sent by the server when CLIENT_SESSION_TRACK is
+        set and the session state changed. System variables are returned as
+        a (name, value) tuple, the other types as a string.
+
+        Returns a list of (type, value) tuples.
+        """
+        res: List[Tuple[int, Any]] = []
+        _, data = utils.read_lc_string(data)
+        while data:
+            track_type = data[0]
+            data, value = utils.read_lc_string(data[1:])
+            if track_type == SessionTrackType.SYSTEM_VARIABLES:
+                value, name = utils.read_lc_string(value)
+                _, value = utils.read_lc_string(value)
+                res.append((track_type, (name.decode("utf-8"), value.decode("utf-8"))))
+            elif track_type == SessionTrackType.GTIDS:
+                # skip the encoding specification byte
+                _, value = utils.read_lc_string(value[1:])
+                res.append((track_type, value.decode("utf-8")))
+            elif track_type <= SessionTrackType.TRANSACTION_STATE:
+                _, value = utils.read_lc_string(value)
+                res.append((track_type, value.decode("utf-8")))
+            else:
+                # unknown type, keep the raw data
+                res.append((track_type, value))
+        return res
+
     @staticmethod
     def parse_column_count(packet: bytes) -> Optional[int]:
         """Parse a MySQL packet with the number of columns in result set"""
@@ -568,8 +708,8 @@ class MySQLProtocol:
 
     def parse_eof(self, packet: bytes) -> EofPacketType:
         """Parse a MySQL EOF-packet"""
-        if packet[4] == 0:
-            # EOF packet deprecation
+        if packet[4] == 0 or len(packet) > 9:
+            # EOF packet deprecation, an OK packet is used instead
             return self.parse_ok(packet)
 
         err_msg = "Failed parsing EOF packet."
@@ -636,19 +776,22 @@ class MySQLProtocol:
                 break
             packet = sock.recv()
             if packet.startswith(b"\xff\xff\xff"):
-                datas = [packet[4:]]
+                # Append the payloads to one buffer, without intermediate slices
+                datas = bytearray(memoryview(packet)[4:])
                 packet = sock.recv()
                 while packet.startswith(b"\xff\xff\xff"):
-                    datas.append(packet[4:])
+                    datas += memoryview(packet)[4:]
                     packet = sock.recv()
-                datas.append(packet[4:])
-                rowdata = utils.read_lc_string_list(b"".join(datas))
-            elif packet[4] == 254 and packet[0] < 7:
+                datas += memoryview(packet)[4:]
+                rowdata = utils.read_lc_string_list(datas)
+            elif packet[4] == 254:
+                # EOF, or OK when CLIENT_DEPRECATE_EOF is set; a row starting
+                # with 0xFE spans multiple packets and is handled above
                 eof = self.parse_eof(packet)
                 rowdata = None
             else:
                 eof = None
-                rowdata = utils.read_lc_string_list(bytes(packet[4:]))
+                rowdata = utils.read_lc_string_list(packet, 4)
             if eof is None and rowdata is not None:
                 rows.append(rowdata)
             elif eof is None and rowdata is None:
@@ -756,6 +899,118 @@ class MySQLProtocol:
 
         return (packet[length + 1 :], tmp)
 
+    @staticmethod
+    def _make_binary_value_decoder(
+        field: DescriptionType, charset: str
+    ) -> BinaryValueDecoder:
+        """Make the function decoding the values of a column
+
+        The function takes a memoryview of the packet and the position of
+        the value, and returns the value and the position after it.
+        """
+        field_type = field[1]
+        if field_type in BINARY_INTEGER_FORMATS or field_type in (
+            FieldType.DOUBLE,
+            FieldType.FLOAT,
+        ):
+            if field_type == FieldType.DOUBLE:
+                format_ = "<d"
+            elif field_type == FieldType.FLOAT:
+                format_ = "<f"
+            else:
+                format_ = "<" + BINARY_INTEGER_FORMATS[field_type]
+                if field[7] & FieldFlag.UNSIGNED:
+                    format_ = format_.upper()
+            unpack_from = struct.Struct(format_).unpack_from
+            size = struct.calcsize(format_)
+
+            def decode_number(view: memoryview, pos: int) -> Tuple[Any, int]:
+                return (unpack_from(view, pos)[0], pos + size)
+
+            return decode_number
+
+        if field_type in (FieldType.DECIMAL, FieldType.NEWDECIMAL):
+
+            def decode_decimal(view: memoryview, pos: int) -> Tuple[Decimal, int]:
+                value, pos = _read_binary_lc_string(view, pos)
+                return (Decimal(str(value, charset)), pos)
+
+            return decode_decimal
+
+        if field_type in (FieldType.DATETIME, FieldType.DATE, FieldType.TIMESTAMP):
+            return lambda view, pos: _decode_binary_timestamp(view, pos, field_type)
+
+        if field_type == FieldType.TIME:
+            return _decode_binary_time
+
+        if field[7] == FieldFlag.BINARY or field[8] == 63:  # "binary" charset
+
+            def decode_bytes(view: memoryview, pos: int) -> Tuple[bytes, int]:
+                value, pos = _read_binary_lc_string(view, pos)
+                return (value.tobytes(), pos)
+
+            return decode_bytes
+
+        def decode_string(view: memoryview, pos: int) -> Tuple[StrOrBytes, int]:
+            value, pos = _read_binary_lc_string(view, pos)
+            try:
+                return (str(value, charset), pos)
+            except UnicodeDecodeError:
+                return (value.tobytes(), pos)
+
+        return decode_string
+
+    def make_binary_row_decoder(
+        self,
+        fields: List[DescriptionType],
+        charset: str = "utf-8",
+    ) -> BinaryRowDecoder:
+        """Make the function decoding the rows of a binary result set
+
+        The decoding of each column is looked up once from the fields. The
+        returned function takes a packet and the position of the NULL bitmap
+        in it, and returns the values of the row. The values are read at
+        their offset in the packet, which is not sliced.
+        """
+        null_bitmap_length = (len(fields) + 7 + 2) // 8
+        plan = tuple(
+            (
+                (pos + 2) // 8,
+                1 << (pos + 2) % 8,
+                self._make_binary_value_decoder(field, charset),
+            )
+            for pos, field in enumerate(fields)
+        )
+
+        def decode_row(packet: bytes, pos: int = 0) -> Tuple[BinaryProtocolType, ...]:
+            values: List[BinaryProtocolType] = []
+            append = values.append
+            offset = pos + null_bitmap_length
+            with memoryview(packet) as view:
+                for null_byte, null_bit, decode in plan:
+                    if packet[pos + null_byte] & null_bit:
+                        append(None)
+                    else:
+                        value, offset = decode(view, offset)
+                        append(value)
+            return tuple(values)
+
+        return decode_row
+
+    def _get_binary_row_decoder(
+        self, columns: List[DescriptionType], charset: str
+    ) -> BinaryRowDecoder:
+        """Get the row decoder of a binary result set
+
+        The decoder is kept while the same columns are read, since rows are
+        also read one at a time.
+        """
+        cached = self._binary_row_decoder
+        if cached is None or cached[0] is not columns or cached[1] != charset:
+            cached = (columns, charset, self.make_binary_row_decoder(columns, charset))
+            self._binary_row_decoder = cached
+        return cached[2]
+
     def _parse_binary_values(
         self,
         fields: List[DescriptionType],
@@ -763,52 +1018,7 @@ class MySQLProtocol:
         charset: str = "utf-8",
     ) -> Tuple[BinaryProtocolType, ...]:
         """Parse values from a binary result packet"""
-        null_bitmap_length = (len(fields) + 7 + 2) // 8
-        null_bitmap = [int(i) for i in packet[0:null_bitmap_length]]
-        packet = packet[null_bitmap_length:]
-
-        values: List[Any] = []
-        value: BinaryProtocolType = None
-        for pos, field in enumerate(fields):
-            if null_bitmap[int((pos + 2) / 8)] & (1 << (pos + 2) % 8):
-                values.append(None)
-                continue
-            if field[1] in (
-                FieldType.TINY,
-                FieldType.SHORT,
-                FieldType.INT24,
-                FieldType.LONG,
-                FieldType.LONGLONG,
-            ):
-                packet, value = self._parse_binary_integer(packet, field)
-                values.append(value)
-            elif field[1] in (FieldType.DOUBLE, FieldType.FLOAT):
-                packet, value = self._parse_binary_float(packet, field)
-                values.append(value)
-            elif field[1] in (FieldType.DECIMAL, FieldType.NEWDECIMAL):
-                packet, value = self._parse_binary_new_decimal(packet, charset)
-                values.append(value)
-            elif field[1] in (
-                FieldType.DATETIME,
-                FieldType.DATE,
-                FieldType.TIMESTAMP,
-            ):
-                (packet, value) = self._parse_binary_timestamp(packet, field[1])
-                values.append(value)
-            elif field[1] == FieldType.TIME:
-                (packet, value) = self._parse_binary_time(packet)
-                values.append(value)
-            elif field[7] == FieldFlag.BINARY or field[8] == 63:  # "binary" charset
-                (packet, value) = utils.read_lc_string(packet)
-                values.append(value)
-            else:
-                (packet, value) = utils.read_lc_string(packet)
-                try:
-                    values.append(value.decode(charset))
-                except UnicodeDecodeError:
-                    values.append(value)
-
-        return tuple(values)
+        return self.make_binary_row_decoder(fields, charset)(packet, 0)
 
     def read_binary_result(
         self,
@@ -824,19 +1034,20 @@ class MySQLProtocol:
         rows = []
         eof = None
         values = None
+        decode_row = self._get_binary_row_decoder(columns, charset)
         i = 0
         while True:
             if eof is not None:
                 break
             if i == count:
                 break
-            packet = bytes(sock.recv())
+            packet = sock.recv()
             if packet[4] == 254:
                 eof = self.parse_eof(packet)
                 values = None
             elif packet[4] == 0:
                 eof = None
-                values = self._parse_binary_values(columns, packet[5:], charset)
+                values = decode_row(packet, 5)
             if eof is None and values is not None:
                 rows.append(values)
             elif eof is None and values is None:
@@ -1013,15 +1224,21 @@ class MySQLProtocol:
         charset: str = "utf8",
         query_attrs: Optional[List[Tuple[str, BinaryProtocolType]]] = None,
         converter_str_fallback: bool = False,
+        bound_types: Optional[Dict[int, bytes]] = None,
     ) -> bytes:
-        """Make a MySQL packet with the Statement Execute command"""
+        """Make a MySQL packet with the Statement Execute command
+
+        When `bound_types` is given, it maps statement IDs to the parameter
+        types sent with their previous execution. The types are only sent
+        again when they changed, otherwise the server reuses the ones already
+        bound. The mapping is updated with the types sent.
+        """
         iteration_count = 1
-        null_bitmap = [0] * ((len(data) + 7) // 8)
-        values: List[bytes] = []
-        types: List[bytes] = []
+        null_bitmap = bytearray((len(data) + 7) // 8)
+        values = bytearray()
+        types = bytearray()
         packed = b""
         data_len = len(data)
-        query_attr_names: List[bytes] = []
         flags = flags if not query_attrs else flags + PARAMETER_COUNT_AVAILABLE
 
         if charset == "utf8mb4":
@@ -1034,7 +1251,7 @@ class MySQLProtocol:
             data = list(data)
             for _, attr_val in query_attrs:
                 data.append(attr_val)
-            null_bitmap = [0] * ((len(data) + 7) // 8)
+            null_bitmap = bytearray((len(data) + 7) // 8)
 
         if parameters or data:
             if data_len != len(parameters):
@@ -1046,11 +1263,8 @@ class MySQLProtocol:
                 _flags = 0
                 if value is None:
                     null_bitmap[(pos // 8)] |= 1 << (pos % 8)
-                    types.append(
-                        utils.int1store(FieldType.NULL) + utils.int1store(_flags)
-                    )
-                    continue
-                if pos in long_data_used:
+                    field_type = FieldType.NULL
+                elif pos in long_data_used:
                     if long_data_used[pos][0]:
                         # We suppose binary data
                         field_type = FieldType.BLOB
@@ -1063,47 +1277,55 @@ class MySQLProtocol:
                         field_type,
                         _flags,
                     ) = self.prepare_binary_integer(value)
-                    values.append(packed)
+                    values += packed
                 elif isinstance(value, str):
                     value = value.encode(charset)
-                    values.append(utils.lc_int(len(value)) + value)
+                    values += utils.lc_int(len(value))
+                    values += value
                     field_type = FieldType.STRING
                 elif isinstance(value, bytes):
-                    values.append(utils.lc_int(len(value)) + value)
+                    values += utils.lc_int(len(value))
+                    values += value
                     field_type = FieldType.STRING
                 elif isinstance(value, Decimal):
-                    values.append(
-                        utils.lc_int(len(str(value).encode(charset)))
-                        + str(value).encode(charset)
-                    )
+                    value = str(value).encode(charset)
+                    values += utils.lc_int(len(value))
+                    values += value
                     field_type = FieldType.DECIMAL
                 elif isinstance(value, float):
-                    values.append(struct.pack("<d", value))
+                    values += struct.pack("<d", value)
                     field_type = FieldType.DOUBLE
                 elif isinstance(value, (datetime.datetime, datetime.date)):
                     (packed, field_type) = self.prepare_binary_timestamp(value)
-                    values.append(packed)
+                    values += packed
                 elif isinstance(value, (datetime.timedelta, datetime.time)):
                     (packed, field_type) = self.prepare_binary_time(value)
-                    values.append(packed)
+                    values += packed
                 elif converter_str_fallback:
                     value = str(value).encode(charset)
-                    values.append(utils.lc_int(len(value)) + value)
+                    values += utils.lc_int(len(value))
+                    values += value
                     field_type = FieldType.STRING
                 else:
                     raise ProgrammingError(
                         "MySQL binary protocol can not handle "
                         f"'{value.__class__.__name__}' objects"
                     )
-                types.append(utils.int1store(field_type) + utils.int1store(_flags))
-                if query_attrs and pos + 1 > data_len:
-                    name = query_attrs[pos - data_len][0].encode(charset)
-                    query_attr_names.append(utils.lc_int(len(name)) + name)
-        packet = [
-            utils.int4store(statement_id),
-            utils.int1store(flags),
-            utils.int4store(iteration_count),
-        ]
+                types.append(field_type)
+                types.append(_flags)
+                # if CLIENT_QUERY_ATTRIBUTES is on {
+                #    string<lenenc>    parameter_name    Name of the parameter
+                # or empty if not present
+                # } if CLIENT_QUERY_ATTRIBUTES is on
+                if query_attrs is not None:
+                    if pos + 1 > data_len:
+                        name = query_attrs[pos - data_len][0].encode(charset)
+                        types += utils.lc_int(len(name))
+                        types += name
+                    else:
+                        types.append(0)
+
+        packet = bytearray(struct.pack("<IBI", statement_id, flags, iteration_count))
 
         # if (num_params > 0 || (CLIENT_QUERY_ATTRIBUTES \
         #                        && (flags & PARAMETER_COUNT_AVAILABLE)) {
@@ -1114,26 +1336,17 @@ class MySQLProtocol:
         if parameter_count:
             # if CLIENT_QUERY_ATTRIBUTES is on
             if query_attrs is not None:
-                packet.append(utils.lc_int(parameter_count))
-
-            packet.extend([struct.pack("B", bit) for bit in null_bitmap])
-            packet.append(utils.int1store(1))
-
-            count = 0
-            for a_type in types:
-                packet.append(a_type)
-                # if CLIENT_QUERY_ATTRIBUTES is on {
-                #    string<lenenc>    parameter_name    Name of the parameter
-                # or empty if not present
-                # } if CLIENT_QUERY_ATTRIBUTES is on
-                if query_attrs is not None:
-                    if count + 1 > data_len:
-                        packet.append(query_attr_names[count - data_len])
-                    else:
-                        packet.append(b"\x00")
-                count += 1
+                packet += utils.lc_int(parameter_count)
 
-            for a_value in values:
-                packet.append(a_value)
+            packet += null_bitmap
+            if bound_types is not None and bound_types.get(statement_id) == types:
+                # new_params_bound_flag unset, types of previous execution apply
+                packet.append(0)
+            else:
+                packet.append(1)
+                packet += types
+                if bound_types is not None:
+                    bound_types[statement_id] = bytes(types)
+            packet += values
 
-        return b"".join(packet)
+        return bytes(packet)
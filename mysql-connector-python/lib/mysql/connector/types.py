@@ -170,3 +170,10 @@ ParamsSequenceOrDictType = Union[ParamsDictType, ParamsSequenceType]
 
 WarningType = Tuple[str, int, str]
 """Warning generated by the previously executed operation."""
+
+HistogramType = Dict[str, Union[int, float, Tuple[Union[int, float], ...]]]
+"""Snapshot of a histogram: `count`, `sum` and `max` of the recorded values, and
+the number of values in each bucket (`counts`) delimited by the `bounds`."""
+
+PoolMetricsType = Dict[str, Union[int, HistogramType]]
+"""Snapshot of the metrics of a connection pool returned by `get_metrics()`."""
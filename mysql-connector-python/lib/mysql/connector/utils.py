@@ -35,7 +35,9 @@ import struct
 import subprocess
 import sys
 import unicodedata
+import weakref
 
+from collections import OrderedDict
 from decimal import Decimal
 from functools import lru_cache
 from stringprep import (
@@ -245,42 +247,45 @@ def read_lc_string(buf: bytes) -> Tuple[bytes, Optional[bytes]]:
     return (buf[lsize + length + 1 :], buf[lsize + 1 : length + lsize + 1])
 
 
-def read_lc_string_list(buf: bytes) -> Optional[Tuple[Optional[bytes], ...]]:
+def read_lc_string_list(
+    buf: bytes, pos: int = 0
+) -> Optional[Tuple[Optional[bytes], ...]]:
     """Reads all length encoded strings from the given buffer
 
+    The strings are read starting at position pos, which allows reading
+    them straight from a packet without copying its payload first. Each
+    string is copied once from the buffer.
+
     Returns a list of bytes
     """
     byteslst: List[Optional[bytes]] = []
+    append = byteslst.append
 
     sizes = {252: 2, 253: 3, 254: 8}
 
     buf_len = len(buf)
-    pos = 0
+    view = memoryview(buf)
 
     while pos < buf_len:
         first = buf[pos]
-        if first == 255:
+        if first <= 250:
+            pos += 1
+            append(view[pos : pos + first].tobytes())
+            pos += first
+        elif first == 251:
+            # NULL value
+            append(None)
+            pos += 1
+        elif first == 255:
             # Special case when MySQL error 1317 is returned by MySQL.
             # We simply return None.
             return None
-        if first == 251:
-            # NULL value
-            byteslst.append(None)
-            pos += 1
         else:
-            if first <= 250:
-                length = first
-                byteslst.append(buf[(pos + 1) : length + (pos + 1)])
-                pos += 1 + length
-            else:
-                lsize = 0
-                try:
-                    lsize = sizes[first]
-                except KeyError:
-                    return None
-                length = intread(buf[(pos + 1) : lsize + (pos + 1)])
-                byteslst.append(buf[pos + 1 + lsize : length + lsize + (pos + 1)])
-                pos += 1 + lsize + length
+            lsize = sizes[first]
+            length = int.from_bytes(view[pos + 1 : pos + 1 + lsize], "little")
+            pos += 1 + lsize
+            append(view[pos : pos + length].tobytes())
+            pos += length
 
     return tuple(byteslst)
 
@@ -704,3 +709,164 @@ class GenericWrapper:
     def get_wrapped_class(self) -> str:
         """Gets the wrapped class name."""
         return self._wrapped.__class__.__name__
+
+
+class PreparedStatementCache:
+    """Least recently used cache of server-side prepared statements.
+
+    Prepared statements are kept by their normalized SQL text so they can be
+    reused across cursors of the same connection. The cache does not talk to
+    the server: statements evicted or invalidated are handed back to the
+    connection, which is in charge of deallocating them.
+
+    A cursor pins its statement while it has an open server-side cursor or a
+    result set not read yet. Pinned statements are not shared with other
+    cursors, and they are not deallocated before being unpinned. Pins only
+    hold a weak reference to their cursor, a statement is no longer pinned
+    once its cursor is garbage collected.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Constructor."""
+        self.capacity: int = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self._statements: OrderedDict[bytes, Any] = OrderedDict()
+        self._stale: List[Any] = []
+        self._pinned: Dict[int, Tuple[Any, weakref.ReferenceType, bool]] = {}
+
+    def __len__(self) -> int:
+        """Number of statements in the cache."""
+        return len(self._statements)
+
+    def __contains__(self, statement: bytes) -> bool:
+        """Whether the statement is in the cache."""
+        return self.normalize(statement) in self._statements
+
+    @staticmethod
+    def normalize(statement: bytes) -> bytes:
+        """Normalizes the SQL text used as cache key.
+
+        Only the surrounding whitespace and trailing semicolons are removed,
+        the statement itself is left untouched.
+        """
+        return statement.strip().rstrip(b";").rstrip()
+
+    def is_pinned(self, prepared: Any, owner: Optional[Any] = None) -> bool:
+        """Whether the prepared statement is pinned, by `owner` when given."""
+        pin = self._pinned.get(id(prepared))
+        if pin is None:
+            return False
+        pinned_by = pin[1]()
+        if pinned_by is None:
+            # The cursor was garbage collected without unpinning
+            del self._pinned[id(prepared)]
+            return False
+        return owner is None or pinned_by is owner
+
+    def pin(self, prepared: Any, owner: Any, unread_result: bool = False) -> None:
+        """Pins a prepared statement while a cursor is using it.
+
+        Args:
+            prepared: The prepared statement.
+            owner: The cursor using the statement.
+            unread_result: Whether the statement is pinned because its result
+                           set is pending on the connection, see
+                           `unpin_unread_result()`.
+        """
+        self._pinned[id(prepared)] = (prepared, weakref.ref(owner), unread_result)
+
+    def unpin(self, prepared: Any, owner: Any) -> None:
+        """Unpins a prepared statement, it can be shared or deallocated again.
+
+        Nothing is done when the statement is not pinned by `owner`.
+        """
+        if self.is_pinned(prepared, owner):
+            del self._pinned[id(prepared)]
+
+    def unpin_unread_result(self) -> None:
+        """Unpins the statements pinned for a result set pending on the connection.
+
+        Used when the connection consumes or discards the unread result.
+        """
+        for key, (_, _, unread_result) in list(self._pinned.items()):
+            if unread_result:
+                del self._pinned[key]
+
+    def get(self, statement: bytes) -> Optional[Any]:
+        """Gets a cached prepared statement.
+
+        Args:
+            statement: SQL text of the prepared statement.
+
+        Returns:
+            The prepared statement or `None` if it is not cached or pinned.
+        """
+        key = self.normalize(statement)
+        prepared = self._statements.get(key)
+        if prepared is None or self.is_pinned(prepared):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._statements.move_to_end(key)
+        return prepared
+
+    def put(self, statement: bytes, prepared: Any) -> List[Any]:
+        """Adds a prepared statement to the cache.
+
+        A pinned statement replaced by the new one is deallocated once it is
+        unpinned. Pinned statements are not evicted, the cache can hold more
+        statements than its capacity until they are unpinned.
+
+        Args:
+            statement: SQL text of the prepared statement.
+            prepared: The prepared statement.
+
+        Returns:
+            A list with the statements evicted to make room for the new one,
+            which must be deallocated by the caller.
+        """
+        key = self.normalize(statement)
+        evicted = []
+        previous = self._statements.pop(key, None)
+        if previous is not None and previous is not prepared:
+            if self.is_pinned(previous):
+                self._stale.append(previous)
+            else:
+                evicted.append(previous)
+        self._statements[key] = prepared
+        for oldest in list(self._statements):
+            if len(self._statements) <= self.capacity:
+                break
+            if oldest != key and not self.is_pinned(self._statements[oldest]):
+                evicted.append(self._statements.pop(oldest))
+        return evicted
+
+    def invalidate(self) -> None:
+        """Invalidates all cached statements.
+
+        The statements are still allocated on the server, they are returned
+        by `pop_stale()` so they can be deallocated once it is safe to send
+        commands to the server.
+        """
+        self._stale.extend(self._statements.values())
+        self._statements.clear()
+
+    def pop_stale(self) -> List[Any]:
+        """Returns and forgets the statements invalidated or replaced.
+
+        Pinned statements are kept until they are unpinned.
+        """
+        stale = [prepared for prepared in self._stale if not self.is_pinned(prepared)]
+        self._stale = [prepared for prepared in self._stale if self.is_pinned(prepared)]
+        return stale
+
+    def clear(self) -> None:
+        """Removes all statements without deallocating them.
+
+        Used when the server already deallocated them, for instance after
+        reconnecting or resetting the session.
+        """
+        self._statements.clear()
+        self._stale.clear()
+        self._pinned.clear()
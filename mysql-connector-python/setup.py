@@ -139,6 +139,7 @@ def main() -> None:
                 "zipp>=0.5",
             ],
             "fido2": ["fido2==1.1.2"],
+            "compression": ["zstandard>=0.12.0,<=0.19.0"],
         },
     )
 
@@ -0,0 +1,132 @@
+# Copyright (c) 2025, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+
+"""Connection pool contention benchmark.
+
+Measures the number of borrow/return cycles per second of `MySQLConnectionPool`
+for an increasing number of threads. The threads are spread over one or more
+pools; since each pool has its own lock, checkouts from different pools do not
+wait for each other.
+
+This isn't an automated test, it is meant to be executed manually against a
+running MySQL server:
+
+`$ python tests/benchmarks/pool_contention.py --mysql-port=3306 --pools=2`
+"""
+
+import threading
+import time
+
+from argparse import ArgumentParser, Namespace
+
+from mysql.connector.pooling import MySQLConnectionPool
+
+
+def setup_cmd_parser() -> Namespace:
+    parser = ArgumentParser(description="Connection pool contention benchmark.")
+    parser.add_argument("--mysql-user", default="root", help="MySQL user")
+    parser.add_argument("--mysql-password", default="", help="MySQL password")
+    parser.add_argument("--mysql-host", default="127.0.0.1", help="MySQL host")
+    parser.add_argument("--mysql-port", default=3306, type=int, help="MySQL port")
+    parser.add_argument(
+        "--threads",
+        default="1,2,4,8,16",
+        help="comma separated numbers of threads to run",
+    )
+    parser.add_argument(
+        "--pools", default=1, type=int, help="number of pools shared by the threads"
+    )
+    parser.add_argument(
+        "--iterations",
+        default=2000,
+        type=int,
+        help="number of borrow/return cycles of each thread",
+    )
+    parser.add_argument(
+        "--reset-session",
+        action="store_true",
+        help="reset the session when a connection is returned",
+    )
+    return parser.parse_args()
+
+
+def run(pools, threads: int, iterations: int) -> float:
+    """Borrows and returns connections, returns cycles per second."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(pool: MySQLConnectionPool) -> None:
+        barrier.wait()
+        for _ in range(iterations):
+            pool.get_connection().close()
+
+    workers = [
+        threading.Thread(target=worker, args=(pools[i % len(pools)],))
+        for i in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    args = setup_cmd_parser()
+    config = {
+        "user": args.mysql_user,
+        "password": args.mysql_password,
+        "host": args.mysql_host,
+        "port": args.mysql_port,
+        "use_pure": True,
+    }
+    for threads in (int(value) for value in args.threads.split(",")):
+        # Every thread can hold a connection, so only the locking is measured
+        pool_size = -(-threads // args.pools)
+        pools = [
+            MySQLConnectionPool(
+                pool_name=f"bench{i}",
+                pool_min_size=pool_size,
+                pool_max_size=pool_size,
+                pool_acquire_timeout=10,
+                pool_reset_session=args.reset_session,
+                pool_validation_interval=None,
+                **config,
+            )
+            for i in range(args.pools)
+        ]
+        result = run(pools, threads, args.iterations)
+        print(f"{threads:>4} threads: {result:12.1f} borrow/return/s")
+        for pool in pools:
+            pool._remove_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# Copyright (c) 2024, Oracle and/or its affiliates. All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""Prepared statement execution benchmark.
+
+Measures the number of executions per second of a prepared statement using
+`MySQLCursorPrepared`, which only sends COM_STMT_RESET when the statement has
+long data, an open server-side cursor or a pending result set. For comparison,
+the same workload is run with a cursor resetting the statement before every
+execution, as done by previous versions.
+
+This isn't an automated test, it is meant to be executed manually against a
+running MySQL server:
+
+`$ python tests/benchmarks/prepared_execute.py --mysql-port=3306 --iterations=5000`
+"""
+
+import time
+
+from argparse import ArgumentParser, Namespace
+
+import mysql.connector
+
+from mysql.connector.cursor import MySQLCursorPrepared
+
+
+class MySQLCursorPreparedAlwaysReset(MySQLCursorPrepared):
+    """Prepared cursor sending COM_STMT_RESET before every execution."""
+
+    def execute(self, operation, params=None, multi=False):
+        self._stmt_reset_needed = True
+        super().execute(operation, params, multi)
+
+
+def setup_cmd_parser() -> Namespace:
+    parser = ArgumentParser(description="Prepared statement execution benchmark.")
+    parser.add_argument("--mysql-user", default="root", help="MySQL user")
+    parser.add_argument("--mysql-password", default="", help="MySQL password")
+    parser.add_argument("--mysql-host", default="127.0.0.1", help="MySQL host")
+    parser.add_argument("--mysql-port", default=3306, type=int, help="MySQL port")
+    parser.add_argument(
+        "--iterations",
+        default=5000,
+        type=int,
+        help="number of executions for each run",
+    )
+    return parser.parse_args()
+
+
+def run(cnx, cursor_class, iterations: int) -> float:
+    """Executes a prepared INSERT and a SELECT, returns executions per second."""
+    cur = cnx.cursor(cursor_class=cursor_class)
+    start = time.perf_counter()
+    for i in range(iterations):
+        cur.execute("INSERT INTO bench_prepared (id, val) VALUES (?, ?)", (i, "x"))
+    for i in range(iterations):
+        cur.execute("SELECT val FROM bench_prepared WHERE id = ?", (i,))
+        cur.fetchall()
+    elapsed = time.perf_counter() - start
+    cur.close()
+    return 2 * iterations / elapsed
+
+
+def main() -> None:
+    args = setup_cmd_parser()
+    config = {
+        "user": args.mysql_user,
+        "password": args.mysql_password,
+        "host": args.mysql_host,
+        "port": args.mysql_port,
+        "use_pure": True,
+        "autocommit": True,
+    }
+    results = {}
+    with mysql.connector.connect(**config) as cnx:
+        cur = cnx.cursor()
+        cur.execute("CREATE DATABASE IF NOT EXISTS myconnpy_bench")
+        cnx.database = "myconnpy_bench"
+        for name, cursor_class in (
+            ("always reset", MySQLCursorPreparedAlwaysReset),
+            ("reset on demand", MySQLCursorPrepared),
+        ):
+            cur.execute("DROP TABLE IF EXISTS bench_prepared")
+            cur.execute(
+                "CREATE TABLE bench_prepared (id INT PRIMARY KEY, val VARCHAR(10))"
+            )
+            results[name] = run(cnx, cursor_class, args.iterations)
+            print(f"{name:>16}: {results[name]:10.1f} executes/s")
+        cur.execute("DROP DATABASE myconnpy_bench")
+        cur.close()
+
+    speedup = results["reset on demand"] / results["always reset"]
+    print(f"{'speedup':>16}: {speedup:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
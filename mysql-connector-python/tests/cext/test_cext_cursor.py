@@ -237,6 +237,34 @@ class CExtMySQLCursorTests(tests.CMySQLCursorTests):
         cur.executemany(stmt, data)
         self.assertEqual(2, cur.rowcount)
 
+        # Rows are split in statements fitting in max_allowed_packet
+        self.cnx.max_allowed_packet = 1100
+        cur.executemany(stmt_insert, ((i, i * 100) for i in range(10, 30)))
+        self.assertEqual(20, cur.rowcount)
+        self.assertNotIn(b"(10,'1000')", cur._executed)
+        cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 >= 10")
+        self.assertEqual([(20,)], cur.fetchall())
+
+        # All the rows are converted before the first statement is sent
+        data = [(i, i * 100) for i in range(30, 50)] + [(50, object())]
+        self.assertRaises(errors.Error, cur.executemany, stmt_insert, data)
+        cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 >= 30")
+        self.assertEqual([(0,)], cur.fetchall())
+        self.cnx._max_allowed_packet_limit = None
+
+        # Statements other than INSERT are sent in multi-statement batches
+        stmt = "UPDATE {0} SET col2 = %s WHERE col1 = %s".format(tbl)
+        data = ((str(i), i) for i in range(10, 30))
+        cur.executemany(stmt, data, batch_size=8)
+        self.assertEqual(20, cur.rowcount)
+        cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 = col2")
+        self.assertEqual([(20,)], cur.fetchall())
+        stmt = "DELETE FROM {0} WHERE col1 = %s OR col4 = 1".format(tbl)
+        with self.assertRaises(errors.ProgrammingError) as context:
+            cur.executemany(stmt, [(10,), (11,)], batch_size=8)
+        self.assertIn("(executing parameter set 0)", context.exception.msg)
+        self.assertRaises(ValueError, cur.executemany, stmt, [(10,)], batch_size=0)
+
         stmt = "TRUNCATE TABLE {0}".format(tbl)
         cur.execute(stmt)
 
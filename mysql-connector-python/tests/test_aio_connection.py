@@ -245,6 +245,8 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
             await self.cnx._handle_result(None)
         dummy_socket = AioDummySocket()
         await dummy_socket.set_connection_socket(self.cnx)
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-ClientFlag.DEPRECATE_EOF])
         self.cnx._allow_local_infile = 1
         eof_packet = EOF_PACKET
         eof_packet[3] = 3
@@ -319,6 +321,33 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
         with self.assertRaises(InterfaceError):
             await self.cnx._handle_result(b"\x01\x00\x00\x01\x00")
 
+    @foreach_cnx_aio()
+    async def test__handle_result_deprecate_eof(self):
+        """Handle a result set sent with CLIENT_DEPRECATE_EOF"""
+        dummy_socket = AioDummySocket()
+        await dummy_socket.set_connection_socket(self.cnx)
+        self.cnx.set_client_flags([ClientFlag.DEPRECATE_EOF])
+
+        # No EOF packet follows the column definitions
+        self.cnx._socket._writer.add_packets(
+            [COLUMNS_SINGLE, bytearray(b"\x02\x00\x00\x03\x01\x31")]
+        )
+        exp = {
+            "eof": {},
+            "columns": [("1", 8, None, None, None, None, 0, 129, 63)],
+        }
+        self.assertEqual(exp, await self.cnx._handle_result(COLUMNS_SINGLE_COUNT))
+
+        # The result set is terminated by an OK packet with 0xFE header
+        self.cnx._socket._writer.add_packet(
+            bytearray(b"\x07\x00\x00\x04\xfe\x00\x00\x0a\x00\x00\x00")
+        )
+        rows, eof = await self.cnx.get_rows(raw=True)
+        self.assertEqual([(b"1",)], rows)
+        self.assertEqual(10, eof["status_flag"])
+        self.assertTrue(self.cnx.have_next_result)
+        self.assertFalse(self.cnx.unread_result)
+
     def __helper_get_rows_buffer(self, toggle_next_result=False):
         self.cnx._socket._writer.reset()
 
@@ -444,6 +473,8 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
         """Send a query to MySQL"""
         dummy_socket = AioDummySocket()
         await dummy_socket.set_connection_socket(self.cnx)
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-ClientFlag.DEPRECATE_EOF])
 
         self.cnx._socket._writer.add_packet(OK_PACKET)
         res = await self.cnx.cmd_query("SET AUTOCOMMIT = OFF")
@@ -480,6 +511,8 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
         """Send queries to MySQL"""
         dummy_socket = AioDummySocket()
         await dummy_socket.set_connection_socket(self.cnx)
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-ClientFlag.DEPRECATE_EOF])
 
         self.cnx._socket._writer.add_packet(OK_PACKET)
         res = await anext(self.cnx.cmd_query_iter("SET AUTOCOMMIT = OFF"))
@@ -1427,6 +1460,8 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
         """Prepare a MySQL statement."""
         dummy_socket = AioDummySocket()
         await dummy_socket.set_connection_socket(self.cnx)
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-ClientFlag.DEPRECATE_EOF])
 
         stmt = b"SELECT CONCAT(?, ?) AS c1"
         self.cnx._socket._writer.add_packets(
@@ -1504,6 +1539,8 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
     async def test__handle_binary_result(self):
         dummy_socket = AioDummySocket()
         await dummy_socket.set_connection_socket(self.cnx)
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-ClientFlag.DEPRECATE_EOF])
 
         with self.assertRaises(InterfaceError):
             await self.cnx._handle_binary_result(None)
@@ -1700,6 +1737,30 @@ class MySQLConnectionAioTests(MySQLConnectorAioTestCase):
             self.assertEqual(exp, await cur.fetchall())
             cur.execute("DROP TABLE IF EXISTS local_data")
 
+    @unittest.skipIf(
+        tests.MYSQL_EXTERNAL_SERVER,
+        "Test not available for external MySQL servers",
+    )
+    @foreach_cnx_aio(allow_local_infile=True)
+    async def test_load_rows(self):
+        async with await self.cnx.cursor() as cur:
+            await cur.execute("DROP TABLE IF EXISTS local_data")
+            await cur.execute(
+                "CREATE TABLE local_data (id int, c1 VARCHAR(6), c2 VARCHAR(6))"
+            )
+            rows = ((i, f"c1_{i}", None if i % 2 else f"c2\t{i}") for i in range(1, 5))
+            await cur.load_rows("local_data", rows)
+            self.assertEqual(4, cur.rowcount)
+            await cur.execute("SELECT * FROM local_data")
+            exp = [
+                (1, "c1_1", None),
+                (2, "c1_2", "c2\t2"),
+                (3, "c1_3", None),
+                (4, "c1_4", "c2\t4"),
+            ]
+            self.assertEqual(exp, await cur.fetchall())
+            await cur.execute("DROP TABLE IF EXISTS local_data")
+
     @unittest.skipIf(
         tests.MYSQL_EXTERNAL_SERVER,
         "Test not available for external MySQL servers",
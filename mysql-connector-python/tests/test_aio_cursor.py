@@ -538,6 +538,62 @@ class MySQLCursorTests(tests.MySQLConnectorAioTestCase, MySQLCursorTestsMixin):
     async def test_executemany(self):
         await self._test_executemany(self.cnx, MySQLCursor)
 
+    @foreach_cnx_aio()
+    async def test_executemany_batch_size(self):
+        tbl = "myconnpy_cursor"
+        await self._test_execute_setup(self.cnx, tbl)
+        async with await self.cnx.cursor() as cur:
+            await cur.executemany(
+                f"INSERT INTO {tbl} (col1,col2) VALUES (%s,%s)",
+                [(i, "a") for i in range(1, 21)],
+            )
+            await cur.executemany(
+                f"UPDATE {tbl} SET col2 = %s WHERE col1 = %s",
+                ((str(i), i) for i in range(1, 21)),
+                batch_size=8,
+            )
+            self.assertEqual(20, cur.rowcount)
+            await cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 = col2")
+            self.assertEqual([(20,)], await cur.fetchall())
+            with self.assertRaises(ProgrammingError) as context:
+                await cur.executemany(
+                    f"DELETE FROM {tbl} WHERE col1 = %s OR col4 = 1",
+                    [(1,), (2,)],
+                    batch_size=8,
+                )
+            self.assertIn("(executing parameter set 0)", context.exception.msg)
+            await cur.execute(f"DROP TABLE IF EXISTS {tbl}")
+
+    @foreach_cnx_aio()
+    async def test_executemany_max_allowed_packet(self):
+        tbl = "myconnpy_cursor"
+        stmt_insert = f"INSERT INTO {tbl} (col1,col2) VALUES (%s,%s)"
+        await self._test_execute_setup(self.cnx, tbl)
+        server_limit = await self.cnx.get_max_allowed_packet()
+        async with await self.cnx.cursor() as cur:
+            # Rows are split in statements fitting in max_allowed_packet
+            self.cnx.set_max_allowed_packet(1100)
+            await cur.executemany(stmt_insert, ((i, i * 100) for i in range(10, 30)))
+            self.assertEqual(20, cur.rowcount)
+            self.assertNotIn(b"(10,'1000')", cur._executed)
+            await cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 >= 10")
+            self.assertEqual([(20,)], await cur.fetchall())
+
+            # All the rows are converted before the first statement is sent
+            data = [(i, i * 100) for i in range(30, 50)] + [(50, object())]
+            with self.assertRaises(ProgrammingError):
+                await cur.executemany(stmt_insert, data)
+            await cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 >= 30")
+            self.assertEqual([(0,)], await cur.fetchall())
+            await cur.execute(f"DROP TABLE IF EXISTS {tbl}")
+
+        # The limit set is kept while the server's is queried again per session
+        await self.cnx.cmd_reset_connection()
+        self.assertIsNone(self.cnx._max_allowed_packet)
+        self.assertEqual(1100, await self.cnx.get_max_allowed_packet())
+        self.cnx._max_allowed_packet_limit = None
+        self.assertEqual(server_limit, await self.cnx.get_max_allowed_packet())
+
     @foreach_cnx_aio()
     async def test_fetchone(self):
         await self._test_fetchone(self.cnx, MySQLCursor)
@@ -550,6 +606,31 @@ class MySQLCursorTests(tests.MySQLConnectorAioTestCase, MySQLCursorTestsMixin):
     async def test_fetchmany(self):
         await self._test_fetchmany(self.cnx, MySQLCursor)
 
+    @foreach_cnx_aio()
+    async def test_fetchmany_arraysize(self):
+        tbl = "myconnpy_fetch"
+        await self._test_execute_setup(self.cnx, tbl)
+        async with await self.cnx.cursor() as cur:
+            await cur.executemany(
+                f"INSERT INTO {tbl} (col1,col2) VALUES (%s,%s)",
+                [(i, str(i * 100)) for i in range(10)],
+            )
+            cur.arraysize = 4
+            await cur.execute(f"SELECT col1,col2 FROM {tbl} ORDER BY col1")
+            self.assertEqual((0, "0"), await cur.fetchone())
+            self.assertEqual(1, cur.rowcount)
+            self.assertEqual([(1, "100"), (2, "200")], await cur.fetchmany(2))
+            self.assertEqual(3, cur.rowcount)
+            self.assertEqual(
+                [(i, str(i * 100)) for i in range(3, 7)], await cur.fetchmany()
+            )
+            self.assertEqual(
+                [(i, str(i * 100)) for i in range(7, 10)], await cur.fetchall()
+            )
+            self.assertEqual(10, cur.rowcount)
+            self.assertFalse(self.cnx.unread_result)
+        await self._test_execute_cleanup(self.cnx, tbl)
+
     @foreach_cnx_aio()
     async def test_fetchwarnings(self):
         async with await self.cnx.cursor() as cur:
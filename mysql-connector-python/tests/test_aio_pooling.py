@@ -0,0 +1,178 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License, version 2.0, as
+# published by the Free Software Foundation.
+#
+# This program is also distributed with certain software (including
+# but not limited to OpenSSL) that is licensed under separate terms,
+# as designated in a particular file or component or in included license
+# documentation.  The authors of MySQL hereby grant you an
+# additional permission to link the program and your derivative works
+# with the separately licensed software that they have included with
+# MySQL.
+#
+# Without limiting anything contained in the foregoing, this file,
+# which is part of MySQL Connector/Python, is also subject to the
+# Universal FOSS Exception, version 1.0, a copy of which can be found at
+# http://oss.oracle.com/licenses/universal-foss-exception.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License, version 2.0, for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin St, Fifth Floor, Boston, MA 02110-1301  USA
+
+"""Unittests for mysql.connector.aio.pooling
+"""
+
+import asyncio
+
+import tests
+
+from mysql.connector import errors
+from mysql.connector.aio import MySQLConnectionPool, PooledMySQLConnection
+from mysql.connector.aio.connection import MySQLConnection
+
+
+class MySQLConnectionPoolAioTests(tests.MySQLConnectorAioTestCase):
+    def setUp(self):
+        self.config = self.get_clean_mysql_config()
+
+    def test_init(self):
+        self.assertRaises(errors.PoolError, MySQLConnectionPool)
+        for kwargs in (
+            {"pool_size": 0},
+            {"pool_min_size": 3, "pool_max_size": 2},
+            {"pool_acquire_timeout": -1},
+            {"pool_max_idle_time": 0},
+            {"pool_validation_interval": -1},
+            {"pool_health_check_interval": 0},
+        ):
+            self.assertRaises(
+                AttributeError, MySQLConnectionPool, pool_name="test", **kwargs
+            )
+        self.assertRaises(
+            errors.PoolError, MySQLConnectionPool, pool_name="test", spam="ham"
+        )
+
+        cnxpool = MySQLConnectionPool(
+            pool_name="test", pool_min_size=1, pool_max_size=3, **self.config
+        )
+        self.assertEqual("test", cnxpool.pool_name)
+        self.assertEqual(1, cnxpool.pool_min_size)
+        self.assertEqual(3, cnxpool.pool_max_size)
+        self.assertTrue(cnxpool.reset_session)
+        self.assertEqual(0, cnxpool._cnx_count)
+
+    async def test_get_connection(self):
+        async with MySQLConnectionPool(
+            pool_name="test", pool_min_size=1, pool_max_size=2, **self.config
+        ) as cnxpool:
+            self.assertEqual(1, len(cnxpool._idle))
+            pcnx1 = await cnxpool.get_connection()
+            self.assertIsInstance(pcnx1, PooledMySQLConnection)
+            self.assertIsInstance(pcnx1._cnx, MySQLConnection)
+            self.assertEqual("test", pcnx1.pool_name)
+            self.assertRaises(errors.PoolError, pcnx1.config, user="spam")
+
+            # A second connection is opened on demand
+            pcnx2 = await cnxpool.get_connection()
+            self.assertEqual(2, cnxpool._cnx_count)
+            with self.assertRaises(errors.PoolError):
+                await cnxpool.get_connection()
+
+            # Waiting coroutines get the returned connections
+            waiter = asyncio.create_task(cnxpool.get_connection(timeout=5))
+            await asyncio.sleep(0.1)
+            cnx = pcnx1._cnx
+            await pcnx1.close()
+            pcnx3 = await waiter
+            self.assertIs(cnx, pcnx3._cnx)
+            with self.assertRaises(errors.PoolError):
+                await cnxpool.get_connection(timeout=0.1)
+
+            for pcnx in (pcnx2, pcnx3):
+                await pcnx.close()
+            self.assertEqual(2, len(cnxpool._idle))
+
+        self.assertTrue(cnxpool.closed)
+        self.assertEqual(0, cnxpool._cnx_count)
+        with self.assertRaises(errors.PoolError):
+            await cnxpool.get_connection()
+
+    async def test_reset_session(self):
+        async with MySQLConnectionPool(
+            pool_name="test", pool_size=1, **self.config
+        ) as cnxpool:
+            async with await cnxpool.get_connection() as pcnx:
+                await pcnx.cmd_query("SET @ham = 2")
+            async with await cnxpool.get_connection() as pcnx:
+                await pcnx.cmd_query("SELECT @ham")
+                self.assertEqual((None,), (await pcnx.get_rows())[0][0])
+
+            # Without COM_RESET_CONNECTION, the user is authenticated again
+            async def cmd_reset_connection():
+                return False
+
+            async with await cnxpool.get_connection() as pcnx:
+                await pcnx.cmd_query("SET @ham = 2")
+                pcnx._cnx.cmd_reset_connection = cmd_reset_connection
+            async with await cnxpool.get_connection() as pcnx:
+                await pcnx.cmd_query("SELECT @ham")
+                self.assertEqual((None,), (await pcnx.get_rows())[0][0])
+
+    async def test_health_checks(self):
+        async with MySQLConnectionPool(
+            pool_name="test",
+            pool_min_size=1,
+            pool_max_size=3,
+            pool_max_idle_time=0.2,
+            pool_health_check_interval=0.1,
+            **self.config,
+        ) as cnxpool:
+            pcnxs = [await cnxpool.get_connection() for _ in range(3)]
+            for pcnx in pcnxs:
+                await pcnx.close()
+            self.assertEqual(3, cnxpool._cnx_count)
+            await asyncio.sleep(0.6)
+            self.assertEqual(1, cnxpool._cnx_count)
+
+            # Dead idle connections are replaced
+            connection_id = cnxpool._idle[0].connection_id
+            async with MySQLConnection(**self.config) as cnx:
+                await cnx.cmd_query(f"KILL {connection_id}")
+            await asyncio.sleep(0.4)
+            self.assertEqual(1, cnxpool._cnx_count)
+            self.assertNotEqual(connection_id, cnxpool._idle[0].connection_id)
+
+    async def test_prefill(self):
+        async with MySQLConnectionPool(
+            pool_name="test", pool_size=4, pool_lazy_prefill=True, **self.config
+        ) as cnxpool:
+            self.assertEqual(4, cnxpool._cnx_count)
+            pcnxs = [await cnxpool.get_connection() for _ in range(4)]
+            self.assertEqual(0, cnxpool._cnx_prefilling)
+            self.assertEqual(4, len({pcnx.connection_id for pcnx in pcnxs}))
+            for pcnx in pcnxs:
+                await pcnx.close()
+            self.assertEqual(4, len(cnxpool._idle))
+
+    async def test_get_metrics(self):
+        async with MySQLConnectionPool(
+            pool_name="test", pool_size=1, pool_acquire_timeout=0.1, **self.config
+        ) as cnxpool:
+            async with await cnxpool.get_connection():
+                with self.assertRaises(errors.PoolError):
+                    await cnxpool.get_connection()
+                self.assertEqual(1, cnxpool.get_metrics()["in_use"])
+
+            metrics = cnxpool.get_metrics()
+            self.assertEqual(1, metrics["checkouts"])
+            self.assertEqual(1, metrics["checkout_timeouts"])
+            self.assertEqual(1, metrics["connections_created"])
+            self.assertEqual(1, metrics["idle"])
+            self.assertEqual(1, metrics["hold_time"]["count"])
@@ -70,6 +70,7 @@ from mysql.connector import (
     cursor,
     errors,
     network,
+    protocol,
 )
 from mysql.connector.constants import DEFAULT_CONFIGURATION
 from mysql.connector.conversion import MySQLConverter, MySQLConverterBase
@@ -301,6 +302,8 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
         self.assertRaises(errors.InterfaceError, self.cnx._handle_result, None)
         self.cnx._allow_local_infile = 1
         self.cnx._socket.sock = tests.DummySocket()
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-constants.ClientFlag.DEPRECATE_EOF])
         eof_packet = EOF_PACKET
         eof_packet[3] = 3
         self.cnx._socket.sock.add_packets([COLUMNS_SINGLE, eof_packet])
@@ -376,6 +379,118 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
             b"\x01\x00\x00\x01\x00",
         )
 
+    def test__handle_result_deprecate_eof(self):
+        """Handle a result set sent with CLIENT_DEPRECATE_EOF"""
+        self.cnx._socket.sock = tests.DummySocket()
+        self.cnx.set_client_flags([constants.ClientFlag.DEPRECATE_EOF])
+        # No EOF packet follows the column definitions
+        self.cnx._socket.sock.add_packets(
+            [COLUMNS_SINGLE, bytearray(b"\x02\x00\x00\x03\x01\x31")]
+        )
+        exp = {
+            "eof": {},
+            "columns": [("1", 8, None, None, None, None, 0, 129, 63)],
+        }
+        try:
+            self.assertEqual(exp, self.cnx._handle_result(COLUMNS_SINGLE_COUNT))
+            # The result set is terminated by an OK packet with 0xFE header
+            self.cnx._socket.sock.add_packet(
+                bytearray(b"\x07\x00\x00\x04\xfe\x00\x00\x0a\x00\x00\x00")
+            )
+            rows, eof = self.cnx.get_rows(raw=True)
+            self.assertEqual([(b"1",)], rows)
+            self.assertEqual(10, eof["status_flag"])
+            self.assertTrue(self.cnx.have_next_result)
+            self.assertFalse(self.cnx.unread_result)
+        finally:
+            self.cnx.set_client_flags([-constants.ClientFlag.DEPRECATE_EOF])
+
+    def test__handle_session_track(self):
+        """Serve session state from the session tracking information"""
+        cnx = _DummyMySQLConnection()
+        cnx._protocol = protocol.MySQLProtocol()
+        cnx._client_flags |= constants.ClientFlag.SESSION_TRACK
+
+        # OK packet with time_zone and schema changes, autocommit enabled
+        cnx._handle_ok(
+            bytearray(
+                b"\x23\x00\x00\x01\x00\x00\x00\x02\x40\x00\x00\x00\x1a"
+                b"\x00\x11\x09time_zone\x06+00:00\x01\x05\x04test"
+            )
+        )
+        self.assertEqual("+00:00", cnx.time_zone)
+        self.assertEqual("test", cnx.database)
+        self.assertTrue(cnx.autocommit)
+
+        # SET autocommit = 0, the status flags are used
+        cnx._handle_ok(bytearray(b"\x07\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00"))
+        self.assertFalse(cnx.autocommit)
+
+        # Current database was dropped
+        cnx._handle_ok(bytearray(b"\x07\x00\x00\x01\x00\x01\x00\x00\x01\x00\x00"))
+        self.assertNotIn("database", cnx._session_state)
+
+        # Tracking was reconfigured, cached values are discarded
+        cnx._handle_ok(
+            bytearray(
+                b"\x2b\x00\x00\x01\x00\x00\x00\x00\x40\x00\x00\x00\x22"
+                b"\x00\x20\x1esession_track_system_variables\x00"
+            )
+        )
+        self.assertEqual({"autocommit": False}, cnx._session_state)
+
+        # Tracking reconfigured without being reported by the server
+        cnx._handle_ok(
+            bytearray(
+                b"\x23\x00\x00\x01\x00\x00\x00\x02\x40\x00\x00\x00\x1a"
+                b"\x00\x11\x09time_zone\x06+00:00\x01\x05\x04test"
+            )
+        )
+        # Only statements assigning session_track_* variables are taken into account
+        for statement in (
+            "SELECT 'SET session_track_schema = OFF'",
+            "SET @var = 'session_track_schema = OFF' /* session_track_gtids = 1 */",
+        ):
+            self.assertRaises(errors.OperationalError, cnx.cmd_query, statement)
+            self.assertEqual("test", cnx.database)
+        self.assertRaises(
+            errors.OperationalError,
+            cnx.cmd_query,
+            "/* reset */ SET @@session.session_track_system_variables = ''",
+        )
+        self.assertEqual({"autocommit": True}, cnx._session_state)
+
+    def test_get_prepared_statement(self):
+        """Get prepared statements using the prepared statement cache"""
+        cnx = _DummyMySQLConnection()
+        self.assertEqual(None, cnx.prepared_statement_cache)
+        self.assertRaises(AttributeError, cnx.config, prepared_statement_cache_size=-1)
+        cnx.config(prepared_statement_cache_size=1)
+
+        prepared, closed = [], []
+
+        def cmd_stmt_prepare(statement):
+            prepared.append(statement)
+            return {"statement_id": len(prepared), "parameters": []}
+
+        cnx.cmd_stmt_prepare = cmd_stmt_prepare
+        cnx.cmd_stmt_close = closed.append
+
+        stmt = cnx.get_prepared_statement(b"SELECT 1")
+        self.assertEqual(stmt, cnx.get_prepared_statement(b"SELECT 1;"))
+        self.assertEqual([b"SELECT 1"], prepared)
+        self.assertEqual(1, cnx.prepared_statement_cache.hits)
+
+        # The least recently used statement is deallocated on eviction
+        cnx.get_prepared_statement(b"SELECT 2")
+        self.assertEqual([1], closed)
+
+        # Invalidated statements are deallocated on the next prepare
+        cnx.prepared_statement_cache.invalidate()
+        cnx.get_prepared_statement(b"SELECT 2")
+        self.assertEqual([1, 2], closed)
+        self.assertEqual([b"SELECT 1", b"SELECT 2", b"SELECT 2"], prepared)
+
     def __helper_get_rows_buffer(self, toggle_next_result=False):
         self.cnx._socket.sock.reset()
 
@@ -489,6 +604,8 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
     def test_cmd_query(self):
         """Send a query to MySQL"""
         self.cnx._socket.sock = tests.DummySocket()
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-constants.ClientFlag.DEPRECATE_EOF])
         self.cnx._socket.sock.add_packet(OK_PACKET)
         res = self.cnx.cmd_query("SET AUTOCOMMIT = OFF")
         self.assertEqual(OK_PACKET_RESULT, res)
@@ -520,6 +637,8 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
     def test_cmd_query_iter(self):
         """Send queries to MySQL"""
         self.cnx._socket.sock = tests.DummySocket()
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-constants.ClientFlag.DEPRECATE_EOF])
         self.cnx._socket.sock.add_packet(OK_PACKET)
         res = next(self.cnx.cmd_query_iter("SET AUTOCOMMIT = OFF"))
         self.assertEqual(OK_PACKET_RESULT, res)
@@ -1244,6 +1363,14 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
         self.assertEqual(cnx._ssl["cert"], "dummyCert")
         self.assertEqual(cnx._ssl["key"], "dummyKey")
 
+    def test_read_buffer_size(self):
+        """Validate the read_buffer_size option"""
+        cnx = _DummyMySQLConnection()
+        for value in (0, -1, True, "4096"):
+            self.assertRaises(AttributeError, cnx.config, read_buffer_size=value)
+        cnx.config(read_buffer_size=4096)
+        self.assertEqual(4096, cnx._read_buffer_size)
+
     def test_character_set(self):
         # Test character set
         config = tests.get_mysql_config()
@@ -1340,6 +1467,16 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
         self.assertEqual(self.cnx._time_zone, self.cnx.time_zone)
         self.assertEqual(self.cnx._sql_mode, self.cnx.sql_mode)
 
+        # The settings are sent to the server using a single statement
+        queries = []
+        cmd_query = self.cnx.cmd_query
+        self.cnx.cmd_query = lambda query, *args, **kwargs: (
+            queries.append(query) or cmd_query(query, *args, **kwargs)
+        )
+        self.cnx._post_connection()
+        self.assertEqual(1, len(queries))
+        self.assertTrue(queries[0].startswith("SET NAMES 'utf8mb4'"))
+
     def test_connect(self):
         """Connect to the MySQL server"""
         config = tests.get_mysql_config()
@@ -1872,6 +2009,8 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
     def test_cmd_stmt_prepare(self):
         """Prepare a MySQL statement"""
         self.cnx._socket.sock = tests.DummySocket()
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-constants.ClientFlag.DEPRECATE_EOF])
 
         stmt = b"SELECT CONCAT(?, ?) AS c1"
         self.cnx._socket.sock.add_packets(
@@ -1946,6 +2085,8 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
 
     def test__handle_binary_result(self):
         self.cnx._socket.sock = tests.DummySocket()
+        # Packets are sent with an EOF after the column definitions
+        self.cnx.set_client_flags([-constants.ClientFlag.DEPRECATE_EOF])
 
         self.assertRaises(errors.InterfaceError, self.cnx._handle_binary_result, None)
         self.assertRaises(
@@ -2004,6 +2145,18 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
         exp = (1, columns, {"status_flag": 0, "warning_count": 0})
         self.assertEqual(exp, self.cnx.cmd_stmt_execute(*params))
 
+        # open a read-only cursor, rows are fetched using COM_STMT_FETCH
+        result = self.cnx.cmd_stmt_execute(
+            *params[:3], flags=constants.CursorType.READ_ONLY
+        )
+        flag = constants.ServerFlag
+        self.assertTrue(result[2]["status_flag"] & flag.STATUS_CURSOR_EXISTS)
+        self.assertFalse(self.cnx.unread_result)
+        self.cnx.cmd_stmt_fetch(1, 1)
+        rows, eof = self.cnx.get_rows(binary=True, columns=columns)
+        self.assertEqual([("ham",)], rows)
+        self.assertTrue(eof["status_flag"] & flag.STATUS_LAST_ROW_SENT)
+
     def test_cmd_stmt_close(self):
         # statement does not exists, does not return or raise anything
         try:
@@ -2132,6 +2285,60 @@ class MySQLConnectionTests(tests.MySQLConnectorTests):
         cur.execute("DROP TABLE IF EXISTS local_data")
         cur.close()
 
+    @unittest.skipIf(
+        tests.MYSQL_EXTERNAL_SERVER,
+        "Test not available for external MySQL servers",
+    )
+    @tests.foreach_cnx(allow_local_infile=True)
+    def test_load_rows(self):
+        cur = self.cnx.cursor()
+        cur.execute("DROP TABLE IF EXISTS local_data")
+        cur.execute("CREATE TABLE local_data (id int, c1 VARCHAR(6), c2 VARCHAR(6))")
+        rows = ((i, f"c1\t{i}", None if i % 2 else f"c2\\{i}") for i in range(1, 7))
+        if CMySQLConnection and isinstance(self.cnx, CMySQLConnection):
+            self.assertRaises(NotSupportedError, cur.load_rows, "local_data", rows)
+            cur.execute("DROP TABLE IF EXISTS local_data")
+            cur.close()
+            return
+
+        cur.load_rows("local_data", rows)
+        self.assertEqual(6, cur.rowcount)
+        cur.load_rows("local_data", [{"c1": "c1_7", "id": 7}], ("id", "c1"))
+        self.assertEqual(1, cur.rowcount)
+        cur.execute("SELECT * FROM local_data")
+        exp = [
+            (1, "c1\t1", None),
+            (2, "c1\t2", "c2\\2"),
+            (3, "c1\t3", None),
+            (4, "c1\t4", "c2\\4"),
+            (5, "c1\t5", None),
+            (6, "c1\t6", "c2\\6"),
+            (7, "c1_7", None),
+        ]
+        self.assertEqual(exp, cur.fetchall())
+
+        # Rows converted before an error are loaded
+        self.assertRaises(
+            ProgrammingError, cur.load_rows, "local_data", [(8, "a", "b"), (object(),)]
+        )
+        cur.execute("SELECT COUNT(*) FROM local_data")
+        self.assertEqual([(8,)], cur.fetchall())
+
+        # Table and column names are quoted
+        cur.execute("DROP TABLE IF EXISTS local_data")
+        cur.execute("CREATE TABLE local_data (`select` INT, `a``b` VARCHAR(6))")
+        cur.load_rows(
+            f"{self.cnx.database}.local_data", [(1, "x"), (2, "y")], ("select", "a`b")
+        )
+        self.assertEqual(2, cur.rowcount)
+        cur.execute("SELECT `select`, `a``b` FROM local_data ORDER BY `select`")
+        self.assertEqual([(1, "x"), (2, "y")], cur.fetchall())
+        self.assertRaises(
+            ProgrammingError, cur.load_rows, "local_data; DROP TABLE t", [(1, "x")]
+        )
+        cur.execute("DROP TABLE IF EXISTS local_data")
+        cur.close()
+
     @unittest.skipIf(
         tests.MYSQL_EXTERNAL_SERVER,
         "Test not available for external MySQL servers",
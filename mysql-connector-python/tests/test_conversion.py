@@ -423,6 +423,40 @@ class MySQLConverterTests(tests.MySQLConnectorTests):
         res = self.cnv.row_to_python(data, description)
         self.assertEqual(res, self._to_python_exp)
 
+    def test_make_row_decoder(self):
+        """Convert MySQL rows to Python types using a row decoder"""
+        data = [v[0] for v in self._to_python_data]
+        description = [v[1] for v in self._to_python_data]
+
+        decode_row = self.cnv.make_row_decoder(description)
+        self.assertEqual(decode_row(data), self._to_python_exp)
+        self.assertEqual(decode_row([None] * len(data)), (None,) * len(data))
+
+        # Binary strings and unknown field types
+        description = [
+            ("bin", constants.FieldType.STRING, None, None, None, None, 1, 0, 63),
+            ("geo", constants.FieldType.GEOMETRY),
+            ("latin", constants.FieldType.VAR_STRING, None, None, None, None, 1, 0, 8),
+        ]
+        decode_row = self.cnv.make_row_decoder(description)
+        self.assertEqual(
+            (b"\xff", "\u00e4", b"\xff"), decode_row((b"\xff", b"\xc3\xa4", b"\xff"))
+        )
+
+        # The field which failed is reported
+        decode_row = self.cnv.make_row_decoder([("col1", constants.FieldType.LONG)])
+        with self.assertRaises(ValueError) as context:
+            decode_row((b"ham",))
+        self.assertIn("col1", context.exception.message)
+
+        # An overridden row_to_python() is used
+        class RowConverter(conversion.MySQLConverter):
+            def row_to_python(self, row, fields):
+                return tuple(row)
+
+        decode_row = RowConverter().make_row_decoder(description)
+        self.assertEqual((b"1", b"2", b"3"), decode_row((b"1", b"2", b"3")))
+
     def test__float_to_python(self):
         """Convert a MySQL FLOAT/DOUBLE to a Python float type"""
         data = b"3.14"
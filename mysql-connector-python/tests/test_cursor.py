@@ -42,6 +42,8 @@ to be created first.
 """
 
 import datetime
+import gc
+import io
 import re
 import time
 
@@ -105,6 +107,64 @@ class CursorModule(tests.MySQLConnectorTests):
         for exp, stmt in cases:
             self.assertEqual(exp, re.search(regex, stmt).group(1))
 
+    def test_load_data_statement(self):
+        self.assertEqual(
+            "LOAD DATA LOCAL INFILE '<rows>' INTO TABLE `db`.`t 1` "
+            "CHARACTER SET utf8mb4 (`select`,`a``b`,@var)",
+            cursor.load_data_statement("db.t 1", ("select", "a`b", "@var"), "utf8mb4"),
+        )
+        self.assertEqual(
+            "LOAD DATA LOCAL INFILE '<rows>' INTO TABLE `t``; DROP TABLE t` "
+            "CHARACTER SET latin1",
+            cursor.load_data_statement("t`; DROP TABLE t", None, "latin1"),
+        )
+        self.assertRaises(
+            errors.ProgrammingError,
+            cursor.load_data_statement,
+            "t",
+            None,
+            "latin1 SET x",
+        )
+
+    def test_compile_templates(self):
+        fragments = cursor.compile_format_template("SELECT %s, '%s'", "utf8")
+        self.assertEqual((b"SELECT ", b", '", b"'"), fragments)
+        self.assertEqual(
+            b"SELECT 1, ''a''", cursor.substitute_params(fragments, [b"1", b"'a'"])
+        )
+        self.assertRaises(
+            errors.ProgrammingError, cursor.substitute_params, fragments, [b"1"]
+        )
+        self.assertRaises(
+            errors.ProgrammingError,
+            cursor.substitute_params,
+            fragments,
+            [b"1", b"2", b"3"],
+        )
+        self.assertIs(
+            fragments, cursor.compile_format_template("SELECT %s, '%s'", "utf8")
+        )
+
+        fragments, names = cursor.compile_mapping_template(
+            "SELECT %(a)s LIKE 'a%(x)%', %(b)s, %(a)s", "utf8"
+        )
+        self.assertEqual((b"SELECT ", b" LIKE 'a%', ", b", ", b""), fragments)
+        self.assertEqual((b"a", b"b", b"a"), names)
+        self.assertRaises(
+            ValueError, cursor.compile_mapping_template, "SELECT %(a)d", "utf8"
+        )
+
+        # Long statements are not kept in the caches
+        values = ", ".join(["'a'"] * cursor.QUERY_TEMPLATE_CACHE_MAX_LENGTH)
+        for compile_template, operation in (
+            (cursor.compile_format_template, f"SELECT %s, {values}"),
+            (cursor.compile_mapping_template, f"SELECT %(a)s, {values}"),
+            (cursor.compile_insert_template, f"INSERT INTO t VALUES (%s, {values})"),
+        ):
+            template = compile_template(operation, "utf8")
+            self.assertEqual(template, compile_template(operation, "utf8"))
+            self.assertIsNot(template, compile_template(operation, "utf8"))
+
 
 class CursorBaseTests(tests.MySQLConnectorTests):
     def setUp(self):
@@ -747,6 +807,36 @@ class MySQLCursorTests(tests.TestsCursor):
         self.cur.executemany(stmt, data)
         self.assertEqual(2, self.cur.rowcount)
 
+        # Rows are split in statements fitting in max_allowed_packet
+        self.cnx.max_allowed_packet = 1100
+        self.cur.executemany(stmt_insert, ((i, i * 100) for i in range(10, 30)))
+        self.assertEqual(20, self.cur.rowcount)
+        self.assertNotIn(b"(10,'1000')", self.cur._executed)
+        self.cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 >= 10")
+        self.assertEqual([(20,)], self.cur.fetchall())
+
+        # All the rows are converted before the first statement is sent
+        data = [(i, i * 100) for i in range(30, 50)] + [(50, object())]
+        self.assertRaises(
+            errors.ProgrammingError, self.cur.executemany, stmt_insert, data
+        )
+        self.cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 >= 30")
+        self.assertEqual([(0,)], self.cur.fetchall())
+        self.cnx._max_allowed_packet_limit = None
+
+        # Statements other than INSERT are sent in multi-statement batches
+        stmt = "UPDATE {0} SET col2 = %s WHERE col1 = %s".format(tbl)
+        data = ((str(i), i) for i in range(10, 30))
+        self.cur.executemany(stmt, data, batch_size=8)
+        self.assertEqual(20, self.cur.rowcount)
+        self.cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col1 = col2")
+        self.assertEqual([(20,)], self.cur.fetchall())
+        stmt = "DELETE FROM {0} WHERE col1 = %s OR col4 = 1".format(tbl)
+        with self.assertRaises(errors.ProgrammingError) as context:
+            self.cur.executemany(stmt, [(10,), (11,)], batch_size=8)
+        self.assertIn("(executing parameter set 0)", context.exception.msg)
+        self.assertRaises(ValueError, self.cur.executemany, stmt, [(10,)], batch_size=0)
+
         stmt = "TRUNCATE TABLE {0}".format(tbl)
         self.cur.execute(stmt)
 
@@ -987,6 +1077,17 @@ class MySQLCursorTests(tests.TestsCursor):
             tests.cmp_result(exp, rows), "Fetching next 3 rows test failed."
         )
         self.assertEqual([], self.cur.fetchmany())
+
+        # Rows are read ahead arraysize at a time
+        self.cur.arraysize = 4
+        self.cur.execute(stmt_select)
+        self.assertEqual((9, "900"), self.cur.fetchone())
+        self.assertEqual(1, self.cur.rowcount)
+        self.assertEqual([(8, "800"), (7, "700")], self.cur.fetchmany(2))
+        self.assertEqual(3, self.cur.rowcount)
+        self.assertEqual([(i, str(i * 100)) for i in range(6, -1, -1)], list(self.cur))
+        self.assertEqual(nrrows, self.cur.rowcount)
+        self.assertFalse(self.cnx.unread_result)
         self._test_execute_cleanup(self.cnx, tbl)
         self.cur.close()
 
@@ -1363,6 +1464,113 @@ class MySQLCursorPreparedTests(tests.TestsCursor):
         exp = [(bytearray(b"ham"),)]
         self.assertEqual(exp, cur.fetchall())
 
+    def test_execute_stmt_reset(self):
+        """COM_STMT_RESET is only sent when the statement needs it"""
+        cur = self.cnx.cursor(cursor_class=cursor.MySQLCursorPrepared)
+        resets = []
+        cmd_stmt_reset = self.cnx.cmd_stmt_reset
+
+        def _cmd_stmt_reset(statement_id):
+            resets.append(statement_id)
+            cmd_stmt_reset(statement_id)
+
+        self.cnx.cmd_stmt_reset = _cmd_stmt_reset
+
+        stmt = "SELECT ? AS c1"
+        for value in range(3):
+            cur.execute(stmt, (value,))
+            self.assertEqual([(value,)], cur.fetchall())
+        self.assertEqual([], resets)
+
+        # Long data is discarded before the next execution
+        cur.execute(stmt, (io.BytesIO(b"ham"),))
+        cur.fetchall()
+        cur.execute(stmt, (1,))
+        self.assertEqual([(1,)], cur.fetchall())
+        self.assertEqual([cur._prepared["statement_id"]], resets)
+        cur.close()
+
+    def test_execute_fetch_size(self):
+        """Fetch rows in batches from a server-side cursor"""
+        self.assertRaises(ValueError, self.cnx.cursor, fetch_size=2)
+        self.assertRaises(
+            ValueError,
+            self.cnx.cursor,
+            cursor_class=cursor.MySQLCursorPrepared,
+            fetch_size=0,
+        )
+        cur = self.cnx.cursor(cursor_class=cursor.MySQLCursorPrepared, fetch_size=2)
+        self.assertEqual(2, cur.fetch_size)
+
+        stmt = (
+            "SELECT a FROM (SELECT 1 AS a UNION ALL SELECT 2 UNION ALL SELECT 3 "
+            "UNION ALL SELECT 4 UNION ALL SELECT 5) AS t WHERE a > ? ORDER BY a"
+        )
+        cur.execute(stmt, (0,))
+        self.assertTrue(cur._cursor_exists)
+        self.assertFalse(self.cnx.unread_result)
+        self.assertEqual((1,), cur.fetchone())
+
+        # Other statements can be executed between batches
+        cur2 = self.cnx.cursor()
+        cur2.execute("SELECT 'ham'")
+        self.assertEqual(1, len(cur2.fetchall()))
+        cur2.close()
+
+        self.assertEqual([(2,), (3,), (4,)], cur.fetchmany(3))
+        self.assertEqual([(5,)], cur.fetchall())
+        self.assertEqual(None, cur.fetchone())
+        self.assertEqual(5, cur.rowcount)
+
+        # Re-execute while the cursor is still open
+        cur.execute(stmt, (2,))
+        self.assertEqual((3,), cur.fetchone())
+        cur.execute(stmt, (3,))
+        self.assertEqual([(4,), (5,)], cur.fetchall())
+        cur.close()
+
+    def test_execute_prepared_statement_cache(self):
+        """Cursors do not share a cached statement while reading its result"""
+        config = tests.get_mysql_config()
+        config["prepared_statement_cache_size"] = 5
+        cnx = connection.MySQLConnection(**config)
+        stmt = (
+            "SELECT a FROM (SELECT 1 AS a UNION ALL SELECT 2 UNION ALL SELECT 3) "
+            "AS t WHERE a > ? ORDER BY a"
+        )
+        cur1 = cnx.cursor(cursor_class=cursor.MySQLCursorPrepared, fetch_size=1)
+        cur2 = cnx.cursor(cursor_class=cursor.MySQLCursorPrepared, fetch_size=1)
+
+        cur1.execute(stmt, (0,))
+        self.assertEqual((1,), cur1.fetchone())
+        cur2.execute(stmt, (1,))
+        self.assertNotEqual(
+            cur1._prepared["statement_id"], cur2._prepared["statement_id"]
+        )
+        self.assertEqual((2,), cur2.fetchone())
+        # The server-side cursor of cur1 is still open
+        self.assertEqual([(2,), (3,)], cur1.fetchall())
+        self.assertEqual([(3,)], cur2.fetchall())
+
+        # Statements are shared again once the result sets are read
+        cur1.execute(stmt, (2,))
+        self.assertEqual(cur2._prepared, cur1._prepared)
+        self.assertEqual([(3,)], cur1.fetchall())
+
+        # Statements pinned by dropped cursors are evicted again
+        cur3 = cnx.cursor(cursor_class=cursor.MySQLCursorPrepared, fetch_size=1)
+        cur3.execute(stmt, (0,))
+        self.assertEqual((1,), cur3.fetchone())
+        del cur3
+        gc.collect()
+        for num in range(10):
+            cur2.execute(f"SELECT {num}")
+            self.assertEqual([(num,)], cur2.fetchall())
+        self.assertLessEqual(len(cnx.prepared_statement_cache), 5)
+        cur1.close()
+        cur2.close()
+        cnx.close()
+
     def test_executemany(self):
         cur = self.cnx.cursor(cursor_class=cursor.MySQLCursorPrepared)
 
@@ -1417,6 +1625,65 @@ class MySQLCursorPreparedTests(tests.TestsCursor):
         self._test_execute_cleanup(self.cnx, tbl)
         cur.close()
 
+    def test_executemany_pipelined(self):
+        """Pipeline the executions of executemany()"""
+        cur = self.cnx.cursor(cursor_class=cursor.MySQLCursorPrepared)
+        tbl = "myconnpy_cursor"
+        self._test_execute_setup(self.cnx, tbl)
+        stmt_insert = f"INSERT INTO {tbl} (col1, col2) VALUES (%s, %s)"
+
+        self.assertRaises(
+            ValueError, cur.executemany, stmt_insert, [(1, "a")], pipeline_size=0
+        )
+
+        data = [(i, str(i * 100)) for i in range(1, 11)]
+        cur.executemany(stmt_insert, data, pipeline_size=3)
+        self.assertEqual(10, cur.rowcount)
+
+        cur.executemany(
+            f"UPDATE {tbl} SET col2 = %(col2)s WHERE col1 = %(col1)s",
+            [{"col1": i, "col2": "ham"} for i in range(1, 6)],
+            pipeline_size=2,
+        )
+        self.assertEqual(5, cur.rowcount)
+
+        # The parameter set in error is reported, the ones in flight are executed
+        data = [(11, "a"), (12, "b"), (1, "c"), (13, "d"), (14, "e")]
+        with self.assertRaises(errors.IntegrityError) as context:
+            cur.executemany(stmt_insert, data, pipeline_size=2)
+        self.assertIn("parameter set 2", context.exception.msg)
+        self.assertEqual(1062, context.exception.errno)
+        self.assertEqual(3, cur.rowcount)
+
+        cur.execute(f"SELECT col1 FROM {tbl} WHERE col1 > 10 ORDER BY col1")
+        self.assertEqual([(11,), (12,), (13,)], cur.fetchall())
+
+        # The connection is still usable
+        cur.execute(f"SELECT COUNT(*) FROM {tbl} WHERE col2 = ?", ("ham",))
+        self.assertEqual([(5,)], cur.fetchall())
+
+        # Parameter sets are taken lazily, an invalid one is reported once the
+        # executions in flight are done
+        def params():
+            yield (21, "a")
+            yield (22, "b")
+            yield (23,)
+            yield (24, "d")
+
+        self.assertRaises(
+            errors.ProgrammingError,
+            cur.executemany,
+            stmt_insert,
+            params(),
+            pipeline_size=2,
+        )
+        self.assertEqual(2, cur.rowcount)
+        cur.execute(f"SELECT col1 FROM {tbl} WHERE col1 > 20 ORDER BY col1")
+        self.assertEqual([(21,), (22,)], cur.fetchall())
+
+        self._test_execute_cleanup(self.cnx, tbl)
+        cur.close()
+
     def test_fetchone(self):
         cur = self.cnx.cursor(cursor_class=cursor.MySQLCursorPrepared)
 
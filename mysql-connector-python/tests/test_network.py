@@ -269,6 +269,202 @@ class MySQLSocketNetBrokerCompressedTests(tests.MySQLConnectorTests):
         self.assertRaises(errors.OperationalError, self.cnx.recv)
 
 
+class MySQLSocketNetBrokerZstdTests(tests.MySQLConnectorTests):
+
+    """Testing network.MySQLTCPSocket with zstd compressed packets"""
+
+    def setUp(self):
+        config = tests.get_mysql_config()
+        self._host = config["host"]
+        self._port = config["port"]
+        self.cnx = network.MySQLTCPSocket(host=self._host, port=self._port)
+        self.cnx.sock = tests.DummySocket()
+        self.cnx._address = "dummy"
+
+    def tearDown(self):
+        try:
+            self.cnx.close_connection()
+        except:
+            pass
+
+    def test_unknown_algorithm(self):
+        """Only zlib and zstd compressed packets are supported"""
+        self.assertRaises(
+            errors.NotSupportedError, network.NetworkBrokerCompressed, "lz4"
+        )
+
+    @unittest.skipIf(network.HAVE_ZSTD, "zstandard is installed")
+    def test_switch_without_zstandard(self):
+        """Switching to zstd requires the zstandard package"""
+        self.assertRaises(
+            errors.NotSupportedError, self.cnx.switch_to_compressed_mode, "zstd"
+        )
+
+    @unittest.skipIf(not network.HAVE_ZSTD, "zstandard is not available")
+    def test_send_recv(self):
+        """Packets compressed with zstd are read back"""
+        self.cnx.switch_to_compressed_mode("zstd", 5)
+        payload = b"\x03SELECT " + b"'abc', " * 100 + b"1"
+        self.cnx.send(payload, 0)
+        sent = self.cnx.sock._client_sends[0]
+        self.assertEqual(len(payload) + 4, int.from_bytes(sent[4:7], "little"))
+        self.assertLess(len(sent), len(payload))
+
+        self.cnx.sock.add_packet(sent)
+        header = len(payload).to_bytes(3, "little") + b"\x00"
+        self.assertEqual(bytearray(header + payload), self.cnx.recv())
+
+
+class CompressionOptionsTests(tests.MySQLConnectorTests):
+
+    """Testing the compression options helpers"""
+
+    def test_validate_compression_options(self):
+        """Validate the compression_algorithms and zstd_compression_level options"""
+        self.assertEqual(
+            (None, network.DEFAULT_ZSTD_COMPRESSION_LEVEL),
+            network.validate_compression_options(None, None),
+        )
+        self.assertEqual(
+            (("zstd", "zlib"), 7),
+            network.validate_compression_options(" ZSTD,zlib", 7),
+        )
+        self.assertEqual(
+            (("uncompressed",), 22),
+            network.validate_compression_options(["uncompressed"], 22),
+        )
+        for algorithms in ("", "lz4", ["zlib", "lz4"], 1):
+            self.assertRaises(
+                AttributeError,
+                network.validate_compression_options,
+                algorithms,
+                None,
+            )
+        for level in (0, 23, "3", True):
+            self.assertRaises(
+                AttributeError, network.validate_compression_options, None, level
+            )
+
+    def test_negotiate_compression(self):
+        """Choose the compression algorithm from the options and the server"""
+        zlib_flag = network.ClientFlag.COMPRESS
+        zstd_flag = network.ClientFlag.ZSTD_COMPRESSION_ALGORITHM
+        both = zlib_flag | zstd_flag
+        negotiate = network.negotiate_compression
+
+        self.assertEqual((None, 0), negotiate(None, False, both))
+        self.assertEqual(("zlib", zlib_flag), negotiate(None, True, both))
+        self.assertEqual((None, 0), negotiate(None, True, 0))
+        self.assertEqual((None, 0), negotiate(("uncompressed",), True, both))
+        self.assertEqual(("zlib", zlib_flag), negotiate(("zlib",), False, zlib_flag))
+        # Falls back to zlib when no requested algorithm is available
+        self.assertEqual(("zlib", zlib_flag), negotiate(("zstd",), True, zlib_flag))
+        self.assertEqual((None, 0), negotiate(("zstd",), True, 0))
+        if network.HAVE_ZSTD:
+            self.assertEqual(("zstd", zstd_flag), negotiate(("zstd",), True, both))
+            self.assertEqual(
+                ("zlib", zlib_flag), negotiate(("zlib", "zstd"), True, both)
+            )
+
+    def test_negotiate_compression_reconnect(self):
+        """A server without compression doesn't disable it for the next one"""
+        negotiate = network.negotiate_compression
+        flag = network.ClientFlag.COMPRESS
+        self.assertEqual((None, 0), negotiate(None, True, 0))
+        self.assertEqual(("zlib", flag), negotiate(None, True, flag))
+        self.assertEqual((None, 0), negotiate(("zlib",), True, 0))
+        self.assertEqual(("zlib", flag), negotiate(("zlib",), True, flag))
+
+
+class MySQLSocketNetBrokerBufferedTests(tests.MySQLConnectorTests):
+
+    """Testing network.MySQLTCPSocket with NetworkBrokerBuffered enabled"""
+
+    def setUp(self):
+        config = tests.get_mysql_config()
+        self._host = config["host"]
+        self._port = config["port"]
+        self.cnx = network.MySQLTCPSocket(host=self._host, port=self._port)
+        self.cnx.switch_to_buffered_mode(network.MIN_READ_BUFFER_SIZE)
+        self.cnx.sock = tests.DummySocket()
+        self.cnx._address = "dummy"
+
+    def tearDown(self):
+        try:
+            self.cnx.close_connection()
+        except:
+            pass
+
+    def test_init(self):
+        """Buffer size is never lower than MIN_READ_BUFFER_SIZE"""
+        broker = network.NetworkBrokerBuffered(16)
+        self.assertEqual(network.MIN_READ_BUFFER_SIZE, len(broker._buffer))
+        broker = network.NetworkBrokerBuffered()
+        self.assertEqual(network.DEFAULT_READ_BUFFER_SIZE, len(broker._buffer))
+
+    def test_recv(self):
+        """Receive several packets pulled in a single chunk"""
+        # Receive a packet which is not 4 bytes long
+        self.cnx.sock.add_packet(b"\01\01\01")
+        self.assertRaises(errors.InterfaceError, self.cnx.recv)
+
+        # Socket fails to receive and produces an error
+        self.cnx.sock.reset()
+        self.cnx.sock.raise_socket_error()
+        self.assertRaises(errors.OperationalError, self.cnx.recv)
+
+        # Receive packets after a query, SELECT "Ham"
+        exp = [
+            b"\x01\x00\x00\x01\x01",
+            b"\x19\x00\x00\x02\x03\x64\x65\x66\x00\x00\x00\x03\x48\x61\x6d\x00"
+            b"\x0c\x21\x00\x09\x00\x00\x00\xfd\x01\x00\x1f\x00\x00",
+            b"\x05\x00\x00\x03\xfe\x00\x00\x02\x00",
+            b"\x04\x00\x00\x04\x03\x48\x61\x6d",
+            b"\x05\x00\x00\x05\xfe\x00\x00\x02\x00",
+        ]
+        self.cnx._netbroker = network.NetworkBrokerBuffered()
+        self.cnx.sock.reset()
+        self.cnx.sock.add_packets(exp)
+        result = [self.cnx.recv() for _ in range(len(exp))]
+        self.assertEqual(exp, result)
+        self.assertEqual(5, self.cnx._netbroker._pktnr)
+        self.assertEqual(0, self.cnx._netbroker.buffered_size)
+
+    def test_recv_across_chunks(self):
+        """Receive packets spanning the boundaries of the read-ahead buffer"""
+        size = network.MIN_READ_BUFFER_SIZE
+        exp = [
+            b"\xfd\x0f\x00\x01" + b"a" * (size - 3),
+            b"\x0a\x00\x00\x02" + b"b" * 10,
+            b"\x00\x10\x00\x03" + b"c" * size,
+        ]
+        self.cnx.sock.add_packets(exp)
+        result = [self.cnx.recv() for _ in range(len(exp))]
+        self.assertEqual(exp, result)
+
+    def test_recv_max_payload_length(self):
+        """Receive packets larger than the read-ahead buffer"""
+        exp = [
+            b"\xff\xff\xff\x01" + b"a" * network.MAX_PAYLOAD_LENGTH,
+            b"\x03\x00\x00\x02abc",
+        ]
+        self.cnx._netbroker = network.NetworkBrokerBuffered()
+        self.cnx.sock = tests.DummySocket()
+        self.cnx.sock.add_packets(exp)
+        # Pull the continuation packet in chunks to avoid the DummySocket slow path
+        self.cnx.sock.recv_into = lambda buf, nbytes=0: self._recv_into(buf, nbytes)
+        result = [self.cnx.recv() for _ in range(len(exp))]
+        self.assertEqual([len(pkt) for pkt in exp], [len(pkt) for pkt in result])
+        self.assertEqual(exp, result)
+
+    def _recv_into(self, buf, nbytes):
+        replies = self.cnx.sock._server_replies
+        nbytes = min(nbytes or len(buf), len(replies))
+        buf[:nbytes] = replies[:nbytes]
+        del replies[:nbytes]
+        return nbytes
+
+
 # Abstract classes cannot be instantiated,
 # a dummy sublcass for MySQLSocket is needed
 class MySQLSocketSubclass(network.MySQLSocket):
@@ -337,6 +533,17 @@ class MySQLSocketTests(tests.MySQLConnectorTests):
         self.cnx.set_connection_timeout(exp)
         self.assertEqual(exp, self.cnx._connection_timeout)
 
+    def test_unread(self):
+        """Push back a packet"""
+        packet = bytearray(b"\x05\x00\x00\x05\xfe\x00\x00\x02\x00")
+        self.cnx.unread(packet)
+        self.assertEqual(packet, self.cnx.recv())
+        self.assertEqual(None, self.cnx._unread_packet)
+
+        self.cnx.unread(packet)
+        self.cnx.close_connection()
+        self.assertEqual(None, self.cnx._unread_packet)
+
 
 @unittest.skipIf(
     tests.MYSQL_EXTERNAL_SERVER,
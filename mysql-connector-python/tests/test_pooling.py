@@ -29,6 +29,8 @@
 """Unittests for mysql.connector.pooling
 """
 
+import threading
+import time
 import unittest
 import uuid
 
@@ -345,6 +347,243 @@ class MySQLConnectionPoolTests(tests.MySQLConnectorTests):
         with cnxpool.get_connection() as pcnx:
             self.assertTrue(isinstance(pcnx, pooling.PooledMySQLConnection))
 
+    def test_get_connection_timeout(self):
+        dbconfig = tests.get_mysql_config()
+        if tests.MYSQL_VERSION < (5, 7):
+            dbconfig["client_flags"] = [-ClientFlag.CONNECT_ARGS]
+        self.assertRaises(
+            AttributeError,
+            pooling.MySQLConnectionPool,
+            pool_name="test",
+            pool_acquire_timeout=-1,
+        )
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_size=1, pool_name="test", pool_acquire_timeout=0.1, **dbconfig
+        )
+        self.assertEqual(0.1, cnxpool.acquire_timeout)
+
+        # Exhausted pool, waiting using the pool's default timeout
+        pcnx = cnxpool.get_connection()
+        start = time.monotonic()
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertRaises(errors.PoolError, cnxpool.get_connection, timeout=0)
+        self.assertEqual(0, len(cnxpool._waiters))
+
+        # Returned connections are handed to the waiters in FIFO order
+        served = []
+
+        def wait_for_connection(name):
+            with cnxpool.get_connection(timeout=10) as waiter_cnx:
+                served.append((name, waiter_cnx.connection_id))
+
+        threads = []
+        for name in ("first", "second"):
+            thread = threading.Thread(target=wait_for_connection, args=(name,))
+            thread.start()
+            threads.append(thread)
+            while len(cnxpool._waiters) < len(threads):
+                time.sleep(0.01)
+        connection_id = pcnx.connection_id
+        pcnx.close()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([("first", connection_id), ("second", connection_id)], served)
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+
+    def test_pool_lock(self):
+        dbconfig = tests.get_mysql_config()
+        if tests.MYSQL_VERSION < (5, 7):
+            dbconfig["client_flags"] = [-ClientFlag.CONNECT_ARGS]
+        cnxpool1 = pooling.MySQLConnectionPool(
+            pool_name="test1", pool_size=1, **dbconfig
+        )
+        cnxpool2 = pooling.MySQLConnectionPool(
+            pool_name="test2", pool_size=1, **dbconfig
+        )
+        self.assertIsNot(cnxpool1._lock, cnxpool2._lock)
+
+        # A pool busy in another thread does not block the other pools
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with cnxpool1._lock:
+                locked.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        try:
+            locked.wait(5)
+            with cnxpool2.get_connection() as pcnx:
+                self.assertTrue(pcnx.is_connected())
+        finally:
+            release.set()
+            thread.join()
+
+    def test_validation_interval(self):
+        dbconfig = tests.get_mysql_config()
+        if tests.MYSQL_VERSION < (5, 7):
+            dbconfig["client_flags"] = [-ClientFlag.CONNECT_ARGS]
+        self.assertRaises(
+            AttributeError,
+            pooling.MySQLConnectionPool,
+            pool_name="test",
+            pool_validation_interval=-1,
+        )
+
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_name="test", pool_size=1, pool_validation_interval=0.2, **dbconfig
+        )
+        self.assertEqual(0.2, cnxpool.validation_interval)
+        pings = []
+        cnx = cnxpool._cnx_queue.queue[0]
+        is_connected = cnx.is_connected
+        cnx.is_connected = lambda: pings.append(1) or is_connected()
+
+        # Recently used connections are not pinged
+        for _ in range(3):
+            with cnxpool.get_connection() as pcnx:
+                pcnx.cmd_query("SELECT 1")
+                pcnx.get_rows()
+        self.assertEqual(0, len(pings))
+
+        # Connections unused for too long are pinged, and reconnected when needed
+        with cnxpool.get_connection() as pcnx:
+            connection_id = pcnx.connection_id
+        with MySQLConnection(**dbconfig) as cnx:
+            cnx.cmd_query(f"KILL {connection_id}")
+        time.sleep(0.3)
+        with cnxpool.get_connection() as pcnx:
+            self.assertNotEqual(connection_id, pcnx.connection_id)
+        self.assertEqual(1, len(pings))
+
+    def test_elastic_pool(self):
+        dbconfig = tests.get_mysql_config()
+        if tests.MYSQL_VERSION < (5, 7):
+            dbconfig["client_flags"] = [-ClientFlag.CONNECT_ARGS]
+        for kwargs in (
+            {"pool_max_size": 0},
+            {"pool_min_size": -1},
+            {"pool_min_size": 3, "pool_max_size": 2},
+            {"pool_max_idle_time": 0},
+            {"pool_max_lifetime": "1"},
+        ):
+            self.assertRaises(
+                AttributeError, pooling.MySQLConnectionPool, pool_name="test", **kwargs
+            )
+
+        # Connections are opened on demand and closed when idle for too long
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_name="test",
+            pool_min_size=1,
+            pool_max_size=pooling.CNX_POOL_MAXSIZE + 1,
+            pool_max_idle_time=0.2,
+            **dbconfig,
+        )
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+        pcnxs = [cnxpool.get_connection() for _ in range(cnxpool.pool_max_size)]
+        self.assertEqual(cnxpool.pool_max_size, cnxpool._cnx_count)
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+        for pcnx in pcnxs:
+            pcnx.close()
+        deadline = time.monotonic() + 5
+        while cnxpool._cnx_count > 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(1, cnxpool._cnx_count)
+        self.assertEqual(1, cnxpool._cnx_queue.qsize())
+
+        # Connections are replaced after their lifetime
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_name="test", pool_size=1, pool_max_lifetime=0.2, **dbconfig
+        )
+        with cnxpool.get_connection() as pcnx:
+            connection_id = pcnx.connection_id
+        time.sleep(0.5)
+        with cnxpool.get_connection() as pcnx:
+            self.assertNotEqual(connection_id, pcnx.connection_id)
+        self.assertEqual(1, cnxpool._cnx_count)
+
+    def test_prefill(self):
+        dbconfig = tests.get_mysql_config()
+        if tests.MYSQL_VERSION < (5, 7):
+            dbconfig["client_flags"] = [-ClientFlag.CONNECT_ARGS]
+        cnxpool = pooling.MySQLConnectionPool(pool_name="test", pool_size=4, **dbconfig)
+        self.assertEqual(4, cnxpool._cnx_queue.qsize())
+        self.assertEqual(0, cnxpool._cnx_prefilling)
+
+        # The first connection is opened up front, the others in the background
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_name="test", pool_size=4, pool_lazy_prefill=True, **dbconfig
+        )
+        self.assertEqual(4, cnxpool._cnx_count)
+        pcnxs = [cnxpool.get_connection() for _ in range(4)]
+        self.assertEqual(0, cnxpool._cnx_prefilling)
+        self.assertEqual(4, len({pcnx.connection_id for pcnx in pcnxs}))
+        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+        for pcnx in pcnxs:
+            pcnx.close()
+        self.assertEqual(4, cnxpool._cnx_queue.qsize())
+
+        # The connections opened are closed when the pool can not be filled
+        lock = threading.Lock()
+        attempts, opened = [], []
+
+        class FailingPool(pooling.MySQLConnectionPool):
+            def _open_connection(self, prefill=False):
+                with lock:
+                    attempts.append(prefill)
+                    fail = len(attempts) == 3
+                if fail:
+                    with self._lock:
+                        self._cnx_prefilling -= 1
+                        self._release_slot()
+                    raise errors.InterfaceError("Failed opening the connection")
+                cnx = super()._open_connection(prefill)
+                opened.append(cnx)
+                return cnx
+
+        self.assertRaises(
+            errors.InterfaceError,
+            FailingPool,
+            pool_name="test",
+            pool_size=4,
+            **dbconfig,
+        )
+        self.assertEqual(4, len(attempts))
+        self.assertEqual(3, len(opened))
+        self.assertFalse(any(cnx.is_connected() for cnx in opened))
+
+    def test_get_metrics(self):
+        dbconfig = tests.get_mysql_config()
+        if tests.MYSQL_VERSION < (5, 7):
+            dbconfig["client_flags"] = [-ClientFlag.CONNECT_ARGS]
+        cnxpool = pooling.MySQLConnectionPool(
+            pool_name="test", pool_size=1, pool_acquire_timeout=0.1, **dbconfig
+        )
+        with cnxpool.get_connection():
+            metrics = cnxpool.get_metrics()
+            self.assertEqual(1, metrics["in_use"])
+            self.assertEqual(0, metrics["idle"])
+            self.assertRaises(errors.PoolError, cnxpool.get_connection)
+
+        metrics = cnxpool.get_metrics()
+        self.assertEqual(1, metrics["checkouts"])
+        self.assertEqual(1, metrics["checkout_timeouts"])
+        self.assertEqual(1, metrics["connections_created"])
+        self.assertEqual(1, metrics["size"])
+        self.assertEqual(1, metrics["idle"])
+        self.assertEqual(0, metrics["waiting"])
+        self.assertEqual(1, metrics["wait_time"]["count"])
+        self.assertEqual(1, metrics["hold_time"]["count"])
+        self.assertEqual(1, sum(metrics["hold_time"]["counts"]))
+
+        # Listeners are given each recorded duration
+        durations = []
+        cnxpool._metrics.add_listener(lambda name, value: durations.append(name))
+        cnxpool.get_connection().close()
+        self.assertEqual(["wait_time", "hold_time"], durations)
+
     def test__remove_connections(self):
         dbconfig = tests.get_mysql_config()
         if tests.MYSQL_VERSION < (5, 7):
@@ -356,7 +595,11 @@ class MySQLConnectionPoolTests(tests.MySQLConnectorTests):
         self.assertEqual(1, cnxpool._remove_connections())
         self.assertEqual(0, cnxpool._remove_connections())
 
-        self.assertRaises(errors.PoolError, cnxpool.get_connection)
+        # Closed connections are opened again on demand
+        self.assertEqual(0, cnxpool._cnx_count)
+        pcnx = cnxpool.get_connection()
+        self.assertEqual(1, cnxpool._cnx_count)
+        pcnx.close()
 
 
 class ModuleConnectorPoolingTests(tests.MySQLConnectorTests):
@@ -35,8 +35,8 @@ import struct
 
 import tests
 
-from mysql.connector import errors, protocol
-from mysql.connector.constants import ClientFlag, FieldFlag, FieldType
+from mysql.connector import errors, network, protocol
+from mysql.connector.constants import ClientFlag, FieldFlag, FieldType, SessionTrackType
 
 OK_PACKET = bytearray(b"\x07\x00\x00\x01\x00\x01\x00\x00\x00\x01\x00")
 OK_PACKET_RESULT = {
@@ -59,6 +59,16 @@ ERR_PACKET = bytearray(
 EOF_PACKET = bytearray(b"\x01\x00\x00\x00\xfe\x00\x00\x00\x00")
 EOF_PACKET_RESULT = {"status_flag": 0, "warning_count": 0}
 
+# OK packet replacing EOF when CLIENT_DEPRECATE_EOF is set
+OK_EOF_PACKET = bytearray(b"\x07\x00\x00\x05\xfe\x00\x00\x22\x00\x01\x00")
+OK_EOF_PACKET_RESULT = {
+    "insert_id": 0,
+    "affected_rows": 0,
+    "field_count": 254,
+    "warning_count": 1,
+    "status_flag": 34,
+}
+
 SEED = bytearray(
     b"\x66\x5e\x25\x3d\x40\x6c\x7c\x4f\x53\x32"
     b"\x41\x2f\x68\x3e\x3b\x4f\x5a\x56\x23\x46"
@@ -140,6 +150,12 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         res, _ = self._protocol.make_auth(**kwargs)
         self.assertEqual(exp["nouser"], res)
 
+        # the zstd compression level follows the connection attributes
+        kwargs["client_flags"] = flags | ClientFlag.ZSTD_COMPRESSION_ALGORITHM
+        kwargs["zstd_compression_level"] = 7
+        res, _ = self._protocol.make_auth(**kwargs)
+        self.assertEqual(b"\x0d\xa2\x13\x04" + exp["nouser"][4:] + b"\x07", res)
+
     def test_make_auth_ssl(self):
         """Make a SSL authentication packet"""
         cases = [
@@ -268,6 +284,32 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         res = self._protocol.parse_ok(okpkt)
         self.assertEqual(exp, res)
 
+    def test_parse_ok_session_track(self):
+        """Parse OK-packet with session state information"""
+        okpkt = bytearray(
+            b"\x23\x00\x00\x01\x00\x00\x00\x02\x40\x00\x00\x00\x1a"
+            b"\x00\x11\x09time_zone\x06+00:00\x01\x05\x04test"
+        )
+        exp = {
+            "insert_id": 0,
+            "affected_rows": 0,
+            "field_count": 0,
+            "warning_count": 0,
+            "status_flag": 0x4002,
+            "info_msg": "",
+            "session_track": [
+                (SessionTrackType.SYSTEM_VARIABLES, ("time_zone", "+00:00")),
+                (SessionTrackType.SCHEMA, "test"),
+            ],
+        }
+        self.assertEqual(exp, self._protocol.parse_ok(okpkt))
+
+        # Session state information is only read when the server flags it
+        okpkt[8] = 0x00
+        del exp["session_track"]
+        exp["status_flag"] = 0x02
+        self.assertEqual(exp, self._protocol.parse_ok(okpkt))
+
     def test_parse_column_count(self):
         """Parse the number of columns"""
         packet = bytearray(b"\x01\x00\x00\x01\x03")
@@ -295,9 +337,47 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         res = self._protocol.parse_eof(EOF_PACKET)
         self.assertEqual(EOF_PACKET_RESULT, res)
 
+        # OK packet with the EOF header (CLIENT_DEPRECATE_EOF)
+        res = self._protocol.parse_eof(OK_EOF_PACKET)
+        self.assertEqual(OK_EOF_PACKET_RESULT, res)
+
+        okpkt = bytearray(OK_EOF_PACKET + b"\x04spam")
+        okpkt[0] += 5
+        exp = OK_EOF_PACKET_RESULT.copy()
+        exp["info_msg"] = "spam"
+        self.assertEqual(exp, self._protocol.parse_eof(okpkt))
+
     def test_read_text_result(self):
         # Tested by MySQLConnectionTests.test_get_rows() and .test_get_row()
-        pass
+        # Result set terminated by an OK packet (CLIENT_DEPRECATE_EOF)
+        config = tests.get_mysql_config()
+        sock = network.MySQLTCPSocket(host=config["host"], port=config["port"])
+        sock.sock = tests.DummySocket()
+        sock.sock.add_packets(
+            [
+                bytearray(b"\x04\x00\x00\x03\x03\x48\x61\x6d"),
+                bytearray(b"\x05\x00\x00\x04\x04\x53\x70\x61\x6d"),
+                OK_EOF_PACKET,
+            ]
+        )
+        rows, eof = self._protocol.read_text_result(sock, (8, 0, 33), count=None)
+        self.assertEqual([(b"Ham",), (b"Spam",)], rows)
+        self.assertEqual(OK_EOF_PACKET_RESULT, eof)
+
+        # Row split over several packets, with a NULL and an empty value
+        value = b"x" * 0xFFFFFF
+        payload = b"\xfb\x00\xfd" + len(value).to_bytes(3, "little") + value
+        sock.sock.add_packets(
+            [
+                bytearray(b"\xff\xff\xff\x03" + payload[:0xFFFFFF]),
+                bytearray(b"\x06\x00\x00\x04" + payload[0xFFFFFF:]),
+                OK_EOF_PACKET,
+            ]
+        )
+        rows, eof = self._protocol.read_text_result(sock, (8, 0, 33), count=None)
+        self.assertEqual([(None, b"", value)], rows)
+        self.assertEqual(bytes, type(rows[0][2]))
+        self.assertEqual(OK_EOF_PACKET_RESULT, eof)
 
     def test_parse_binary_prepare_ok(self):
         """Parse Prepare OK packet"""
@@ -500,6 +580,47 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         res = self._protocol._parse_binary_values(fields, packet)
         self.assertEqual(exp, res)
 
+    def test_make_binary_row_decoder(self):
+        """Decode binary result rows using a row decoder"""
+        fields = [
+            ("aInt", 3, None, None, None, None, 0, 0, 63),
+            ("aUBigInt", 8, None, None, None, None, 0, 32, 63),
+            ("aNull", 3, None, None, None, None, 1, 0, 63),
+            ("aDouble", 5, None, None, None, None, 0, 128, 63),
+            ("aStr", 253, None, None, None, None, 0, 1, 45),
+            ("aLatin1", 253, None, None, None, None, 0, 1, 8),
+            ("aTime", 11, None, None, None, None, 1, 128, 63),
+        ]
+        packet = bytearray(
+            b"\x00\x00\x00\x01\x00"  # header and OK byte
+            b"\x10\x00"  # NULL bitmap
+            b"\xfe\xff\xff\xff"
+            b"\xff\xff\xff\xff\xff\xff\xff\xff"
+            b"\x00\x00\x00\x00\x00\x00\xf8\x3f"
+            b"\x03\x61\x62\x63"
+            b"\x01\xe9"
+            b"\x00"
+        )
+        exp = (
+            -2,
+            18446744073709551615,
+            None,
+            1.5,
+            "abc",
+            b"\xe9",
+            datetime.timedelta(),
+        )
+
+        decode_row = self._protocol.make_binary_row_decoder(fields, "utf8")
+        self.assertEqual(exp, decode_row(packet, 5))
+        self.assertEqual(exp, decode_row(bytes(packet[5:])))
+
+        # The decoder is kept for the rows of the same result set
+        get_decoder = self._protocol._get_binary_row_decoder
+        decode_row = get_decoder(fields, "utf8")
+        self.assertIs(decode_row, get_decoder(fields, "utf8"))
+        self.assertIsNot(decode_row, get_decoder(list(fields), "utf8"))
+
     def test_read_binary_result(self):
         """Read MySQL binary protocol result"""
 
@@ -712,6 +833,38 @@ class MySQLProtocolTests(tests.MySQLConnectorTests):
         res = self._protocol.make_stmt_execute(statement_id, data, (1,) * 11)
         self.assertEqual(exp, res)
 
+        # Types are omitted when they match the previous execution
+        bound_types = {}
+        data = ("ham", 1)
+        exp = bytearray(
+            b"\x01\x00\x00\x00\x00\x01\x00\x00\x00\x00\x01\xfe\x00"
+            b"\x01\x80\x03\x68\x61\x6d\x01"
+        )
+        res = self._protocol.make_stmt_execute(
+            statement_id, data, (1, 2), bound_types=bound_types
+        )
+        self.assertEqual(exp, res)
+        self.assertEqual({statement_id: b"\xfe\x00\x01\x80"}, bound_types)
+
+        data = ("spam", 2)
+        exp = bytearray(
+            b"\x01\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x04\x73\x70\x61\x6d\x02"
+        )
+        res = self._protocol.make_stmt_execute(
+            statement_id, data, (1, 2), bound_types=bound_types
+        )
+        self.assertEqual(exp, res)
+
+        data = (None, 2)
+        exp = bytearray(
+            b"\x01\x00\x00\x00\x00\x01\x00\x00\x00\x01\x01\x06\x00\x01\x80\x02"
+        )
+        res = self._protocol.make_stmt_execute(
+            statement_id, data, (1, 2), bound_types=bound_types
+        )
+        self.assertEqual(exp, res)
+        self.assertEqual({statement_id: b"\x06\x00\x01\x80"}, bound_types)
+
         # Raise an error passing an unsupported object as parameter value
         class UnSupportedObject:
             pass
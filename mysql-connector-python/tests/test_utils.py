@@ -29,6 +29,7 @@
 """Unittests for mysql.connector.utils
 """
 
+import gc
 import struct
 
 import tests
@@ -327,3 +328,123 @@ class UtilsTests(tests.MySQLConnectorTests):
             res = utils.normalize_unicode_string(input_str)
             _, b_rule = utils.validate_normalized_unicode_string(res)
             self.assertEqual(comment, b_rule)
+
+    def test_prepared_statement_cache(self):
+        """Test PreparedStatementCache"""
+        cache = utils.PreparedStatementCache(2)
+        self.assertEqual(0, len(cache))
+        self.assertEqual(None, cache.get(b"SELECT 1"))
+        self.assertEqual(1, cache.misses)
+
+        self.assertEqual([], cache.put(b"SELECT 1", {"statement_id": 1}))
+        self.assertEqual([], cache.put(b"SELECT 2", {"statement_id": 2}))
+        self.assertEqual(2, len(cache))
+        # Surrounding whitespace and semicolons are not part of the key
+        self.assertTrue(b" SELECT 1; " in cache)
+        self.assertEqual({"statement_id": 1}, cache.get(b"SELECT 1;\n"))
+        self.assertEqual(1, cache.hits)
+
+        # Least recently used statement is evicted
+        evicted = cache.put(b"SELECT 3", {"statement_id": 3})
+        self.assertEqual([{"statement_id": 2}], evicted)
+        self.assertFalse(b"SELECT 2" in cache)
+        self.assertTrue(b"SELECT 1" in cache)
+
+        # Replacing a statement returns the previous one
+        evicted = cache.put(b"SELECT 3", {"statement_id": 4})
+        self.assertEqual([{"statement_id": 3}], evicted)
+
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(
+            [{"statement_id": 1}, {"statement_id": 4}],
+            sorted(cache.pop_stale(), key=lambda stmt: stmt["statement_id"]),
+        )
+        self.assertEqual([], cache.pop_stale())
+
+        cache.put(b"SELECT 1", {"statement_id": 5})
+        cache.invalidate()
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual([], cache.pop_stale())
+
+    def test_prepared_statement_cache_pin(self):
+        """Test pinning statements in PreparedStatementCache"""
+
+        class Cursor:
+            pass
+
+        cursor, other_cursor = Cursor(), Cursor()
+        cache = utils.PreparedStatementCache(1)
+        stmt1 = {"statement_id": 1}
+        cache.put(b"SELECT 1", stmt1)
+        cache.pin(stmt1, cursor)
+        self.assertTrue(cache.is_pinned(stmt1))
+        self.assertTrue(cache.is_pinned(stmt1, cursor))
+        self.assertFalse(cache.is_pinned(stmt1, other_cursor))
+
+        # Pinned statements are not shared
+        self.assertEqual(None, cache.get(b"SELECT 1"))
+        self.assertEqual(1, cache.misses)
+
+        # Pinned statements are not evicted
+        self.assertEqual([], cache.put(b"SELECT 2", {"statement_id": 2}))
+        self.assertEqual(2, len(cache))
+
+        # A replaced pinned statement is deallocated once unpinned
+        stmt3 = {"statement_id": 3}
+        self.assertEqual([{"statement_id": 2}], cache.put(b"SELECT 1", stmt3))
+        self.assertEqual(stmt3, cache.get(b"SELECT 1"))
+        self.assertEqual([], cache.pop_stale())
+        # Only the cursor holding the pin releases it
+        cache.unpin(stmt1, other_cursor)
+        self.assertTrue(cache.is_pinned(stmt1))
+        cache.unpin(stmt1, cursor)
+        self.assertFalse(cache.is_pinned(stmt1))
+        self.assertEqual([stmt1], cache.pop_stale())
+
+        # Invalidated pinned statements are deallocated once unpinned
+        cache.pin(stmt3, cursor)
+        cache.invalidate()
+        self.assertEqual([], cache.pop_stale())
+        cache.unpin(stmt3, cursor)
+        self.assertEqual([stmt3], cache.pop_stale())
+
+        # Pins for a result set pending on the connection
+        stmt4, stmt5 = {"statement_id": 4}, {"statement_id": 5}
+        cache.pin(stmt4, cursor, unread_result=True)
+        cache.pin(stmt5, other_cursor)
+        cache.unpin_unread_result()
+        self.assertFalse(cache.is_pinned(stmt4))
+        self.assertTrue(cache.is_pinned(stmt5))
+
+    def test_prepared_statement_cache_pin_dropped_cursor(self):
+        """Test statements pinned by a garbage collected cursor"""
+
+        class Cursor:
+            pass
+
+        cursor = Cursor()
+        cache = utils.PreparedStatementCache(1)
+        stmt1, stmt2 = {"statement_id": 1}, {"statement_id": 2}
+        cache.put(b"SELECT 1", stmt1)
+        cache.pin(stmt1, cursor)
+        cache.put(b"SELECT 1", stmt2)
+        self.assertEqual(1, len(cache))
+
+        del cursor
+        gc.collect()
+        self.assertFalse(cache.is_pinned(stmt1))
+        self.assertEqual([stmt1], cache.pop_stale())
+
+        # Statements pinned by dropped cursors are evicted again
+        cursor = Cursor()
+        cache.pin(stmt2, cursor)
+        cache.put(b"SELECT 2", {"statement_id": 3})
+        self.assertEqual(2, len(cache))
+        del cursor
+        gc.collect()
+        self.assertEqual(
+            [stmt2, {"statement_id": 3}], cache.put(b"SELECT 3", {"statement_id": 4})
+        )
+        self.assertLessEqual(len(cache), cache.capacity)
@@ -55,6 +55,7 @@ except ImportError:
     TLS_V1_3_SUPPORTED = False
     TLS_VERSIONS = {}
 
+import bisect
 import json
 import os
 import platform
@@ -64,6 +65,7 @@ import re
 import socket
 import sys
 import threading
+import time
 import uuid
 import warnings
 
@@ -122,7 +124,14 @@ from .statement import (
     UpdateStatement,
     quote_identifier,
 )
-from .types import ColumnType, MessageType, ResultBaseType, StatementType
+from .types import (
+    ColumnType,
+    HistogramType,
+    MessageType,
+    PoolMetricsType,
+    ResultBaseType,
+    StatementType,
+)
 
 sys.path.append("..")
 
@@ -170,6 +179,21 @@ _CNX_POOL_MAX_NAME_SIZE = 120
 _CNX_POOL_NAME_REGEX = re.compile(r"[^a-zA-Z0-9._:\-*$#]")
 _CNX_POOL_MAX_IDLE_TIME = 2147483
 _CNX_POOL_QUEUE_TIMEOUT = 2147483
+# Upper bounds, in seconds, of the buckets of the pool time histograms
+_CNX_POOL_METRICS_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
 
 # Time is on seconds
 _PENALTY_SERVER_OFFLINE = 1000000
@@ -1441,6 +1465,101 @@ class Connection:
         self.stream.close()
 
 
+class _Histogram:
+    """Distribution of durations over fixed buckets."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds: Tuple[float, ...] = bounds
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> HistogramType:
+        """Returns the state of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "bounds": self.bounds,
+            "counts": tuple(self.counts),
+        }
+
+
+class PoolMetrics:
+    """Counters and time distributions of a connection pool.
+
+    A :class:`ConnectionPool` records the connections it hands out
+    (``checkouts``), the requests which could not get a connection in time
+    (``checkout_timeouts``), and the connections opened
+    (``connections_created``), closed (``connections_closed``) or which failed
+    to open (``connections_failed``). The time spent getting a connection
+    (``wait_time``) and the time a connection was held before being returned
+    (``hold_time``) are recorded in histograms.
+
+    .. versionadded:: 8.3.0
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = dict.fromkeys(
+            (
+                "checkouts",
+                "checkout_timeouts",
+                "connections_created",
+                "connections_closed",
+                "connections_failed",
+            ),
+            0,
+        )
+        self._histograms: Dict[str, _Histogram] = {
+            "wait_time": _Histogram(_CNX_POOL_METRICS_BUCKETS),
+            "hold_time": _Histogram(_CNX_POOL_METRICS_BUCKETS),
+        }
+
+    def increment(self, counter: str) -> None:
+        """Increments a counter.
+
+        Args:
+            counter (str): The name of the counter.
+        """
+        with self._lock:
+            self._counters[counter] += 1
+
+    def record(self, histogram: str, duration: float) -> None:
+        """Records a duration in a histogram.
+
+        Args:
+            histogram (str): The name of the histogram.
+            duration (float): The duration in seconds.
+        """
+        with self._lock:
+            self._histograms[histogram].record(duration)
+
+    def snapshot(self) -> PoolMetricsType:
+        """Returns the counters and histograms.
+
+        Returns:
+            dict: The counters, and for each histogram the ``count``, ``sum``
+                  and ``max`` of the durations and the number of durations in
+                  each bucket (``counts``) delimited by the ``bounds``.
+        """
+        with self._lock:
+            metrics: PoolMetricsType = dict(self._counters)
+            for name, histogram in self._histograms.items():
+                metrics[name] = histogram.snapshot()
+        return metrics
+
+
 class PooledConnection(Connection):
     """Class to hold :class:`Connection` instances in a pool.
 
@@ -1467,6 +1586,22 @@ class PooledConnection(Connection):
         self.pool: ConnectionPool = pool
         self.host: str = pool.cnx_config["host"]
         self.port: int = pool.cnx_config["port"]
+        self._checkout_time: Optional[float] = None
+
+    def connect(self) -> None:
+        """Attempt to connect to the MySQL server.
+
+        Raises:
+            :class:`mysqlx.InterfaceError`: If fails to connect to the MySQL
+                                            server.
+            :class:`mysqlx.TimeoutError`: If connect timeout was exceeded.
+        """
+        try:
+            super().connect()
+        except Exception:
+            self.pool.metrics.increment("connections_failed")
+            raise
+        self.pool.metrics.increment("connections_created")
 
     def close_connection(self) -> None:
         """Closes the connection.
@@ -1474,6 +1609,7 @@ class PooledConnection(Connection):
         This method closes the socket.
         """
         super().close_session()
+        self.pool.metrics.increment("connections_closed")
 
     def close_session(self) -> None:
         """Do not close, but add connection back to pool.
@@ -1486,6 +1622,11 @@ class PooledConnection(Connection):
         state will be cleared by re-authenticating the user once the connection
         is get from the pool.
         """
+        if self._checkout_time is not None:
+            self.pool.metrics.record(
+                "hold_time", time.monotonic() - self._checkout_time
+            )
+            self._checkout_time = None
         self.pool.add_connection(self)
 
     def reconnect(self) -> None:
@@ -1561,6 +1702,7 @@ class ConnectionPool(queue.Queue):
         self.cnx_config: Dict[str, Any] = kwargs
         self.host: str = kwargs["host"]
         self.port: int = kwargs["port"]
+        self.metrics: PoolMetrics = PoolMetrics()
 
     def _set_pool_name(self, pool_name: str) -> None:
         r"""Set the name of the pool.
@@ -1586,6 +1728,47 @@ class ConnectionPool(queue.Queue):
         """Returns the number of open connections that can return to this pool."""
         return len(self._connections_openned)
 
+    def checkout(self, cnx: PooledConnection, started: float) -> PooledConnection:
+        """Records a connection handed out by this pool.
+
+        Args:
+            cnx (PooledConnection): The connection object.
+            started (float): The monotonic time at which the connection was
+                             requested.
+
+        Returns:
+            PooledConnection: The connection object.
+
+        .. versionadded:: 8.3.0
+        """
+        cnx._checkout_time = time.monotonic()
+        self.metrics.increment("checkouts")
+        self.metrics.record("wait_time", cnx._checkout_time - started)
+        return cnx
+
+    def get_metrics(self) -> PoolMetricsType:
+        """Returns a snapshot of the metrics of this pool.
+
+        Besides the counters and histograms described in :class:`PoolMetrics`,
+        the snapshot holds the number of connections opened by the pool
+        (``size``), the idle ones (``idle``), the ones handed out (``in_use``)
+        and ``max_size``.
+
+        Returns:
+            dict: The metrics of the pool.
+
+        .. versionadded:: 8.3.0
+        """
+        metrics = self.metrics.snapshot()
+        idle = self.qsize()
+        metrics.update(
+            size=self.open_connections,
+            idle=idle,
+            in_use=max(self.open_connections - idle, 0),
+            max_size=self.pool_max_size,
+        )
+        return metrics
+
     def remove_connection(self, cnx: Optional[PooledConnection] = None) -> None:
         """Removes a connection from this pool.
 
@@ -1950,6 +2133,7 @@ class PoolsManager:
             ):
                 cnx.sql(f"set mysqlx_wait_timeout = {pool.max_idle_time}").execute()
 
+        started = time.monotonic()
         pools = self._get_pools(settings)
         cur_priority = settings.get("cur_priority", None)
         error_list = []
@@ -1971,6 +2155,7 @@ class PoolsManager:
                         try:
                             cnx = pool.get(block=True, timeout=pool.queue_timeout)
                         except queue.Empty:
+                            pool.metrics.increment("checkout_timeouts")
                             raise PoolError(
                                 "Failed getting connection; pool exhausted"
                             ) from None
@@ -2028,14 +2213,14 @@ class PoolsManager:
                                         pool.remove_connection(cnx)
                                     except (RuntimeError, OSError, InterfaceError):
                                         pass
-                        return cnx
+                        return pool.checkout(cnx, started)
                 elif pool.open_connections < pool.pool_max_size:
                     # No connections in pool, but we can open a new one
                     cnx = PooledConnection(pool)
                     pool.track_connection(cnx)
                     cnx.connect()
                     set_mysqlx_wait_timeout(cnx)
-                    return cnx
+                    return pool.checkout(cnx, started)
                 else:
                     # Pool is exaust so the client needs to wait
                     with lock:
@@ -2043,8 +2228,9 @@ class PoolsManager:
                             cnx = pool.get(block=True, timeout=pool.queue_timeout)
                             cnx.reset()
                             set_mysqlx_wait_timeout(cnx)
-                            return cnx
+                            return pool.checkout(cnx, started)
                         except queue.Empty:
+                            pool.metrics.increment("checkout_timeouts")
                             raise PoolError("pool max size has been reached") from None
             except (InterfaceError, TimeoutError, PoolError) as err:
                 error_list.append(f"pool: {pool} error: {err}")
@@ -2073,6 +2259,19 @@ class PoolsManager:
 
         raise PoolError("Unable to connect to any of the target hosts")
 
+    def get_pool_metrics(self, settings: Dict[str, Any]) -> Dict[str, PoolMetricsType]:
+        """Retrieves the metrics of the pools that shares the given settings.
+
+        Args:
+            settings (dict): the configuration of the pool.
+
+        Returns:
+            dict: The metrics of each pool, by pool name.
+
+        .. versionadded:: 8.3.0
+        """
+        return {pool.name: pool.get_metrics() for pool in self._get_pools(settings)}
+
     def close_pool(self, cnx_settings: Dict[str, Any]) -> int:
         """Closes the connections in the pools
 
@@ -2623,6 +2822,21 @@ class Client:
         self.sessions.append(session)
         return session
 
+    def get_pool_metrics(self) -> Dict[str, PoolMetricsType]:
+        """Returns the metrics of the connection pools of this client.
+
+        Each pool, named after the router it connects to, reports the counters
+        and histograms described in :class:`mysqlx.connection.PoolMetrics`,
+        along with its ``size``, ``idle`` and ``in_use`` connections and
+        ``max_size``.
+
+        Returns:
+            dict: The metrics of each pool, by pool name.
+
+        .. versionadded:: 8.3.0
+        """
+        return PoolsManager().get_pool_metrics(self.settings)
+
     def close(self) -> None:
         """Closes the sessions opened by this client."""
         PoolsManager().close_pool(self.settings)
@@ -82,7 +82,9 @@ ErrorTypes = Union[
 ]
 EscapeTypes = Optional[Union[int, float, Decimal, StrOrBytes]]
 FieldTypes = Optional[Union[int, float, str, bytes, Decimal, datetime, timedelta]]
+HistogramType = Dict[str, Union[int, float, Tuple[Union[int, float], ...]]]
 MessageType: TypeAlias = "XdevMessage"
+PoolMetricsType = Dict[str, Union[int, HistogramType]]
 ProtobufMessageType: TypeAlias = "ProtoMessage"
 ProtobufMessageCextType = Dict[str, Any]
 ResultBaseType: TypeAlias = "BaseResult"
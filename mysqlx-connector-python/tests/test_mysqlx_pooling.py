@@ -404,6 +404,38 @@ class MySQLxClientTests(tests.MySQLxTests):
         # Verify that clossing the client again does not raise eceptions
         client.close()
 
+    def test_get_pool_metrics(self):
+        """Test the metrics of the connection pools of a client."""
+        settings = self.connect_kwargs.copy()
+        cnx_options = {"pooling": {"enabled": True, "max_size": 2}}
+        client = mysqlx.get_client(settings, cnx_options)
+
+        session = client.get_session()
+        session.close()
+        session = client.get_session()
+        metrics = client.get_pool_metrics()
+        self.assertEqual(1, len(metrics))
+        pool_metrics = list(metrics.values())[0]
+        self.assertEqual(2, pool_metrics["checkouts"])
+        self.assertEqual(0, pool_metrics["checkout_timeouts"])
+        self.assertEqual(1, pool_metrics["connections_created"])
+        self.assertEqual(0, pool_metrics["connections_failed"])
+        self.assertEqual(1, pool_metrics["size"])
+        self.assertEqual(0, pool_metrics["idle"])
+        self.assertEqual(1, pool_metrics["in_use"])
+        self.assertEqual(2, pool_metrics["max_size"])
+
+        wait_time = pool_metrics["wait_time"]
+        self.assertEqual(2, wait_time["count"])
+        self.assertEqual(2, sum(wait_time["counts"]))
+        self.assertEqual(len(wait_time["bounds"]) + 1, len(wait_time["counts"]))
+        self.assertEqual(1, pool_metrics["hold_time"]["count"])
+
+        session.close()
+        metrics = client.get_pool_metrics()
+        self.assertEqual(2, list(metrics.values())[0]["hold_time"]["count"])
+        client.close()
+
     @unittest.skipIf(tests.MYSQL_VERSION < (8, 0, 16), "not reset compatible")
     def test_reset_keeps_same_id(self):
         """Test pooled Session keeps the same session id."""
@@ -1064,6 +1096,41 @@ class MySQLxConnectionPoolingTests(tests.MySQLxTests):
         client.close()
 
 
+class MySQLxPoolMetricsTests(tests.MySQLConnectorTests):
+    def test_snapshot(self):
+        """Test the counters and histograms of PoolMetrics."""
+        metrics = mysqlx.connection.PoolMetrics()
+        metrics.increment("checkouts")
+        metrics.increment("checkouts")
+        metrics.increment("connections_failed")
+        metrics.record("wait_time", 0.002)
+        metrics.record("wait_time", 0.5)
+        metrics.record("hold_time", 100.0)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(2, snapshot["checkouts"])
+        self.assertEqual(1, snapshot["connections_failed"])
+        self.assertEqual(0, snapshot["connections_created"])
+
+        wait_time = snapshot["wait_time"]
+        bounds = wait_time["bounds"]
+        self.assertEqual(2, wait_time["count"])
+        self.assertAlmostEqual(0.502, wait_time["sum"])
+        self.assertEqual(0.5, wait_time["max"])
+        self.assertEqual(len(bounds) + 1, len(wait_time["counts"]))
+        self.assertEqual(1, wait_time["counts"][bounds.index(0.005)])
+        self.assertEqual(1, wait_time["counts"][bounds.index(0.5)])
+
+        hold_time = snapshot["hold_time"]
+        self.assertEqual(1, hold_time["count"])
+        self.assertEqual(1, hold_time["counts"][-1])
+
+        # The snapshot is not changed by the next records
+        metrics.record("wait_time", 0.002)
+        self.assertEqual(2, wait_time["count"])
+        self.assertEqual(3, metrics.snapshot()["wait_time"]["count"])
+
+
 class MySQLxClientConnectionAttributesTests(tests.MySQLConnectorTests):
     def setUp(self):
         self.connect_kwargs = tests.get_mysqlx_config()